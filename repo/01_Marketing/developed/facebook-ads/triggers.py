@@ -3,15 +3,20 @@ Facebook Ads Webhook Triggers implementation.
 """
 import hmac
 import hashlib
-from typing import Callable, Optional, Dict, Any
+import json
+import logging
+from typing import Callable, Optional, Dict, Any, List, Tuple
 from .models import Lead
 from .exceptions import FacebookAdsError, FacebookAdsAuthenticationError
 
+logger = logging.getLogger(__name__)
+
 
 class FacebookAdsTriggers:
     """Facebook Ads webhook triggers for Yoom integration."""
 
     WEBHOOK_EVENT_LEAD = "leadgen"
+    SIGNATURE_HEADER = "X-Hub-Signature-256"
 
     def __init__(self, app_secret: Optional[str] = None):
         """
@@ -104,6 +109,32 @@ class FacebookAdsTriggers:
             return challenge
         return None
 
+    def extract_events(self, event_data: Dict[str, Any]) -> List[Tuple[str, str, Lead]]:
+        """
+        Split a webhook payload into (event_type, event_id, Lead) tuples.
+
+        A single delivery can batch changes from several entries; the
+        leadgen_id identifies each lead across redeliveries. Changes
+        without one are identified by a hash of their content.
+
+        Args:
+            event_data: Webhook event payload from Facebook
+
+        Returns:
+            One tuple per leadgen change
+        """
+        events = []
+        for entry in event_data.get("entry", []):
+            for change in entry.get("changes", []):
+                if change.get("field") != self.WEBHOOK_EVENT_LEAD:
+                    continue
+                value = change.get("value", {})
+                lead_id = value.get("leadgen_id")
+                if lead_id is None:
+                    lead_id = hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+                events.append((self.WEBHOOK_EVENT_LEAD, str(lead_id), Lead.from_dict(value)))
+        return events
+
     def handle_webhook(self, event_data: Dict[str, Any]) -> Optional[Lead]:
         """
         Process incoming webhook event and call registered handlers.
@@ -150,9 +181,9 @@ class FacebookAdsTriggers:
                         for handler in self.handlers[self.WEBHOOK_EVENT_LEAD]:
                             try:
                                 handler(lead)
-                            except Exception as e:
+                            except Exception:
                                 # Continue processing even if one handler fails
-                                print(f"Handler error for lead event: {str(e)}")
+                                logger.exception("Handler error for lead event")
 
                         return lead
 
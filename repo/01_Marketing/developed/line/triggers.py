@@ -3,12 +3,17 @@ Webhook triggers implementation.
 """
 import hmac
 import hashlib
+import logging
 from typing import Callable, Optional, Dict, Any
 
+logger = logging.getLogger(__name__)
+
 
 class LineTriggers:
     """Webhook triggers for integration."""
 
+    SIGNATURE_HEADER = "X-Webhook-Signature"
+
     def __init__(self, webhook_secret: Optional[str] = None):
         """Initialize triggers handler."""
         self.webhook_secret = webhook_secret
@@ -37,7 +42,7 @@ class LineTriggers:
         for handler in self.handlers.get(event_type, []):
             try:
                 handler(event_data)
-            except Exception as e:
-                print(f"Handler error: {str(e)}")
+            except Exception:
+                logger.exception("Handler error for %s event", event_type)
         
         return event_data
@@ -1,9 +1,12 @@
 """
 Mailchimp Email Marketing API Actions implementation.
 """
+import hashlib
+import json
+import tarfile
 import requests
 import time
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator
 from .exceptions import (
     MailchimpError,
     MailchimpAuthenticationError,
@@ -17,8 +20,18 @@ class MailchimpActions:
     """API actions for integration."""
 
     BASE_URL = "https://usX.api.mailchimp.com/3.0"
+    MEMBERS_PER_LIST_REQUEST = 500
+    OPERATIONS_PER_BATCH = 10000
+    MAX_PENDING_BATCHES = 500
 
-    def __init__(self, api_key: Optional[str] = None, access_token: Optional[str] = None, timeout: int = 30):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        access_token: Optional[str] = None,
+        timeout: int = 30,
+        data_center: Optional[str] = None,
+        max_retries: int = 3,
+    ):
         """
         Initialize API client.
 
@@ -26,17 +39,28 @@ class MailchimpActions:
             api_key: API key for authentication
             access_token: OAuth access token
             timeout: Request timeout in seconds
+            data_center: Data center such as "us21" (taken from the API key suffix if omitted)
+            max_retries: Retries on 429 responses
         """
         self.api_key = api_key
         self.access_token = access_token
         self.timeout = timeout
+        self.max_retries = max_retries
         self.session = requests.Session()
         headers = {"Content-Type": "application/json"}
         headers.update({
             "X-API-Key": self.api_key,
         })
+        if access_token:
+            headers["Authorization"] = f"Bearer {access_token}"
+        elif api_key:
+            self.session.auth = ("anystring", api_key)
         self.session.headers.update(headers)
 
+        if not data_center and api_key and "-" in api_key:
+            data_center = api_key.rsplit("-", 1)[1]
+        self.base_url = self.BASE_URL.replace("usX", data_center) if data_center else self.BASE_URL
+
         # Rate limiting state
         self.last_request_time = 0
         self.min_request_interval = 0.1
@@ -51,11 +75,27 @@ class MailchimpActions:
         retry_on_rate_limit: bool = True,
     ) -> Dict[str, Any]:
         """Make authenticated request with rate limiting."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._send(method, endpoint, params, data)
+            except MailchimpRateLimitError as e:
+                if not retry_on_rate_limit or attempt == self.max_retries:
+                    raise
+                time.sleep(e.response.get("retry_after") or 2 ** attempt)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send one request; a 429 raises MailchimpRateLimitError carrying Retry-After."""
         elapsed = time.time() - self.last_request_time
         if elapsed < self.min_request_interval:
             time.sleep(self.min_request_interval - elapsed)
 
-        url = f"{self.BASE_URL}{endpoint}"
+        url = f"{self.base_url}{endpoint}"
 
         try:
             response = self.session.request(
@@ -79,12 +119,10 @@ class MailchimpActions:
                     message="Resource not found", status_code=404
                 )
             elif response.status_code == 429:
-                if retry_on_rate_limit:
-                    retry_after = int(response.headers.get("Retry-After", 5))
-                    time.sleep(retry_after)
-                    return self._make_request(method, endpoint, params, data, False)
                 raise MailchimpRateLimitError(
-                    message="Rate limit exceeded", status_code=429
+                    message="Rate limit exceeded",
+                    status_code=429,
+                    response={"retry_after": int(response.headers.get("Retry-After", 5))},
                 )
             elif response.status_code >= 400:
                 error_data = response.json() if response.text else {}
@@ -129,6 +167,192 @@ class MailchimpActions:
         """
         return self._make_request("POST", "/send_campaign", data=kwargs if "POST" in ["POST", "PUT", "PATCH"] else None, params=kwargs if "POST" in ["GET", "DELETE"] else None)
 
+    def batch_subscribe(
+        self,
+        list_id: str,
+        members: Iterable[Dict[str, Any]],
+        update_existing: bool = True,
+        chunk_size: int = MEMBERS_PER_LIST_REQUEST,
+    ) -> Dict[str, Any]:
+        """
+        Add or update list members with POST /lists/{list_id}, 500 per request.
+
+        Each request is processed synchronously by Mailchimp, so this suits
+        syncs of up to tens of thousands of members; use batch_upsert_members
+        for larger audiences.
+
+        Args:
+            list_id: Audience (list) ID
+            members: Member dicts (email_address, status, merge_fields, ...)
+            update_existing: Update members that already exist
+            chunk_size: Members per request (max 500)
+
+        Returns:
+            Totals and the per-record errors of all requests
+        """
+        summary = {"new_members": 0, "updated_members": 0, "error_count": 0, "errors": []}
+        for chunk in self._chunks(members, min(chunk_size, self.MEMBERS_PER_LIST_REQUEST)):
+            result = self._make_request(
+                "POST", f"/lists/{list_id}",
+                data={"members": chunk, "update_existing": update_existing},
+            )
+            summary["new_members"] += result.get("total_created", 0)
+            summary["updated_members"] += result.get("total_updated", 0)
+            summary["error_count"] += result.get("error_count", 0)
+            summary["errors"].extend(result.get("errors", []))
+        return summary
+
+    def batch_upsert_members(
+        self,
+        list_id: str,
+        members: Iterable[Dict[str, Any]],
+        status_if_new: str = "subscribed",
+        operations_per_batch: int = OPERATIONS_PER_BATCH,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Upsert list members through the /batches endpoint.
+
+        The members iterator is consumed lazily and split into batch
+        submissions of operations_per_batch PUT operations. All batches are
+        submitted before waiting, so Mailchimp processes them in parallel.
+        Results are then streamed batch by batch from the gzipped tar archives.
+
+        Args:
+            list_id: Audience (list) ID
+            members: Member dicts; email_address is required
+            status_if_new: Status for members that do not exist yet
+            operations_per_batch: Operations per batch submission
+            poll_interval: Initial batch status poll interval in seconds
+            max_poll_interval: Maximum poll interval in seconds
+            timeout: Give up waiting for a batch after this many seconds
+
+        Yields:
+            One result per member: operation_id (the email address),
+            status_code and the parsed response; status_code >= 400 marks
+            a per-record error
+        """
+        batch_ids = []
+        for chunk in self._chunks(members, operations_per_batch):
+            operations = []
+            for member in chunk:
+                email = member["email_address"]
+                subscriber_hash = hashlib.md5(email.lower().encode("utf-8")).hexdigest()
+                body = dict(member)
+                body.setdefault("status_if_new", status_if_new)
+                operations.append({
+                    "method": "PUT",
+                    "path": f"/lists/{list_id}/members/{subscriber_hash}",
+                    "operation_id": email,
+                    "body": json.dumps(body),
+                })
+            if len(batch_ids) >= self.MAX_PENDING_BATCHES:
+                # Mailchimp allows 500 pending batches; drain the oldest first
+                yield from self.iter_batch_results(
+                    self.wait_for_batch(batch_ids.pop(0), poll_interval, max_poll_interval, timeout)
+                )
+            batch_ids.append(self.submit_batch(operations)["id"])
+
+        for batch_id in batch_ids:
+            yield from self.iter_batch_results(
+                self.wait_for_batch(batch_id, poll_interval, max_poll_interval, timeout)
+            )
+
+    def submit_batch(self, operations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submit a batch of operations (POST /batches).
+
+        Args:
+            operations: {method, path, params, body, operation_id} dicts
+
+        Returns:
+            Batch status, including its id
+        """
+        return self._make_request("POST", "/batches", data={"operations": operations})
+
+    def get_batch(self, batch_id: str) -> Dict[str, Any]:
+        """Get the status of a batch."""
+        return self._make_request("GET", f"/batches/{batch_id}")
+
+    def wait_for_batch(
+        self,
+        batch_id: str,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Poll a batch with exponential backoff until it is finished.
+
+        Returns:
+            Final batch status, with response_body_url
+
+        Raises:
+            MailchimpError: If the batch is not finished within timeout
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        interval = poll_interval
+        while True:
+            batch = self.get_batch(batch_id)
+            if batch.get("status") == "finished":
+                return batch
+            if deadline and time.monotonic() + interval > deadline:
+                raise MailchimpError(
+                    f"Batch {batch_id} still {batch.get('status')} after {timeout} seconds"
+                )
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+
+    def iter_batch_results(self, batch: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the results of a finished batch from its gzipped tar archive.
+
+        The archive is read as it downloads; only one JSON file of results is
+        held in memory at a time.
+
+        Yields:
+            {operation_id, status_code, response} per operation
+        """
+        url = batch.get("response_body_url")
+        if not url:
+            return
+
+        # Pre-signed download URL: must be fetched without the API credentials
+        with requests.get(url, stream=True, timeout=self.timeout) as response:
+            if response.status_code >= 400:
+                raise MailchimpError(
+                    message=f"Batch results download failed: {response.status_code}",
+                    status_code=response.status_code,
+                )
+            with tarfile.open(fileobj=response.raw, mode="r|gz") as archive:
+                for entry in archive:
+                    if not entry.isfile() or not entry.name.endswith(".json"):
+                        continue
+                    for result in json.load(archive.extractfile(entry)):
+                        body = result.get("response")
+                        try:
+                            body = json.loads(body) if body else {}
+                        except ValueError:
+                            pass
+                        yield {
+                            "operation_id": result.get("operation_id"),
+                            "status_code": result.get("status_code"),
+                            "response": body,
+                        }
+
+    @staticmethod
+    def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) >= size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     def close(self):
         """Close the session."""
         self.session.close()
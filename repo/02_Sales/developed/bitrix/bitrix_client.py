@@ -29,8 +29,9 @@ Supports:
 import aiohttp
 import asyncio
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Tuple
 from dataclasses import dataclass
+from urllib.parse import urlencode
 
 
 @dataclass
@@ -104,6 +105,9 @@ class BitrixAPIClient:
     Format: https://{domain}.bitrix24.ru/rest/{user_id}/{access_token}/
     """
 
+    BATCH_LIMIT = 50
+    PAGE_SIZE = 50
+
     def __init__(self, domain: str, user_id: str, access_token: str):
         """
         Initialize Bitrix API client.
@@ -146,6 +150,15 @@ class BitrixAPIClient:
             aiohttp.ClientError: If request fails
             Exception: If API returns error
         """
+        data = await self._call(method, params)
+        return data.get("result", {})
+
+    async def _call(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make HTTP request and return the full response envelope (result, next, total)."""
         url = f"{self.base_url}/{method}"
 
         async with self.session.post(url, json=params) as response:
@@ -154,7 +167,7 @@ class BitrixAPIClient:
             if "error" in data:
                 raise Exception(f"Bitrix API error: {data.get('error_description', data.get('error'))}")
 
-            return data.get("result", {})
+            return data
 
     async def _batch_request(
         self,
@@ -180,8 +193,161 @@ class BitrixAPIClient:
         return await self._request("batch", batch_params)
 
     def _params_to_string(self, params: Dict[str, Any]) -> str:
-        """Convert params dictionary to query string"""
-        return "&".join([f"{k}={v}" for k, v in params.items()])
+        """Convert params dictionary to a PHP-style query string (fields[TITLE]=...)"""
+        pairs = []
+        for key, value in params.items():
+            pairs.extend(self._flatten_param(str(key), value))
+        return urlencode(pairs)
+
+    def _flatten_param(self, name: str, value: Any) -> List[Tuple[str, Any]]:
+        """Flatten nested dicts/lists into bracketed query keys"""
+        if isinstance(value, dict):
+            pairs = []
+            for key, item in value.items():
+                pairs.extend(self._flatten_param(f"{name}[{key}]", item))
+            return pairs
+        if isinstance(value, (list, tuple)):
+            pairs = []
+            for index, item in enumerate(value):
+                pairs.extend(self._flatten_param(f"{name}[{index}]", item))
+            return pairs
+        if value is None:
+            return [(name, "")]
+        return [(name, value)]
+
+    async def _bulk_call(
+        self,
+        method: str,
+        params_list: Iterable[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Run the same API method for many parameter sets via batch calls.
+
+        Commands are packed BATCH_LIMIT (50) per batch request. Failures of
+        individual commands do not stop the rest (halt=0).
+
+        Args:
+            method: API method name (e.g., "crm.lead.add")
+            params_list: Parameters for each command
+
+        Returns:
+            Dictionary with "results" (aligned with the input, None for failed
+            commands) and "errors" (input index -> error message)
+        """
+        results: List[Any] = []
+        errors: Dict[int, str] = {}
+        chunk: List[Dict[str, Any]] = []
+
+        async def flush() -> None:
+            offset = len(results)
+            commands = {
+                f"cmd{i}": {"method": method, "params": params}
+                for i, params in enumerate(chunk)
+            }
+            response = await self._batch_request(commands)
+            cmd_results = response.get("result", {}) or {}
+            cmd_errors = response.get("result_error", {}) or {}
+
+            for i in range(len(chunk)):
+                key = f"cmd{i}"
+                if key in cmd_errors:
+                    error = cmd_errors[key]
+                    if isinstance(error, dict):
+                        error = error.get("error_description", error.get("error"))
+                    errors[offset + i] = str(error)
+                    results.append(None)
+                else:
+                    results.append(cmd_results.get(key) if isinstance(cmd_results, dict) else None)
+            chunk.clear()
+
+        for params in params_list:
+            chunk.append(params)
+            if len(chunk) >= self.BATCH_LIMIT:
+                await flush()
+        if chunk:
+            await flush()
+
+        return {"results": results, "errors": errors}
+
+    async def _bulk_add(self, entity: str, fields_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Create many entities; results hold the new IDs"""
+        return await self._bulk_call(
+            f"crm.{entity}.add",
+            ({"fields": fields} for fields in fields_list)
+        )
+
+    async def _bulk_update(self, entity: str, updates: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """Update many entities given as {id: fields}"""
+        return await self._bulk_call(
+            f"crm.{entity}.update",
+            ({"id": entity_id, "fields": fields} for entity_id, fields in updates.items())
+        )
+
+    async def _bulk_delete(self, entity: str, ids: Iterable[int]) -> Dict[str, Any]:
+        """Delete many entities by ID"""
+        return await self._bulk_call(
+            f"crm.{entity}.delete",
+            ({"id": entity_id} for entity_id in ids)
+        )
+
+    async def _list_all(
+        self,
+        method: str,
+        params: Dict[str, Any],
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a *.list method.
+
+        Without a custom order this uses the fast path recommended by
+        Bitrix24: order by ID, filter ID greater than the last seen ID and
+        start=-1 so the server skips the COUNT query. With a custom order it
+        falls back to start/next offset paging.
+
+        Args:
+            method: List method name (e.g., "crm.lead.list")
+            params: filter/select/order parameters
+            limit: Maximum number of rows to return (None for all)
+
+        Returns:
+            List of raw rows
+        """
+        rows: List[Dict[str, Any]] = []
+        fast_path = not params.get("order")
+
+        if fast_path:
+            base_filter = dict(params.get("filter") or {})
+            select = params.get("select")
+            if select and "ID" not in select and "*" not in select:
+                select = list(select) + ["ID"]
+            last_id = 0
+
+            while limit is None or len(rows) < limit:
+                page_filter = dict(base_filter)
+                page_filter[">ID"] = last_id
+                page_params = {"filter": page_filter, "order": {"ID": "ASC"}, "start": -1}
+                if select:
+                    page_params["select"] = select
+
+                page = await self._request(method, page_params)
+                page = page if isinstance(page, list) else []
+                rows.extend(page)
+
+                if len(page) < self.PAGE_SIZE:
+                    break
+                last_id = int(page[-1]["ID"])
+        else:
+            start = 0
+            while limit is None or len(rows) < limit:
+                data = await self._call(method, dict(params, start=start))
+                page = data.get("result", [])
+                rows.extend(page if isinstance(page, list) else [])
+
+                if "next" not in data:
+                    break
+                start = data["next"]
+
+        return rows if limit is None else rows[:limit]
 
     # ==================== Leads ====================
 
@@ -337,7 +503,7 @@ class BitrixAPIClient:
         filter_params: Optional[Dict[str, Any]] = None,
         select: Optional[List[str]] = None,
         order: Optional[Dict[str, str]] = None,
-        limit: int = 50
+        limit: Optional[int] = 50
     ) -> List[Lead]:
         """
         Search for leads.
@@ -346,7 +512,7 @@ class BitrixAPIClient:
             filter_params: Filter conditions
             select: Fields to return
             order: Sort order
-            limit: Maximum number of leads to return
+            limit: Maximum number of leads to return (None for all pages)
 
         Returns:
             List of Lead objects
@@ -364,9 +530,7 @@ class BitrixAPIClient:
         if order:
             params["order"] = order
 
-        result = await self._request("crm.lead.list", params)
-
-        leads = result if isinstance(result, list) else []
+        leads = await self._list_all("crm.lead.list", params, limit)
         return [
             Lead(
                 id=lead.get("ID", 0),
@@ -381,9 +545,57 @@ class BitrixAPIClient:
                 date_create=lead.get("DATE_CREATE", ""),
                 date_modify=lead.get("DATE_MODIFY", "")
             )
-            for lead in leads[:limit]
+            for lead in leads
         ]
 
+    async def create_leads(self, fields_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many leads using batch calls (50 per request).
+
+        Args:
+            fields_list: Raw Bitrix field dictionaries (e.g., {"TITLE": ...})
+
+        Returns:
+            Dictionary with "results" (new IDs, None for failures) and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_add("lead", fields_list)
+
+    async def update_leads(self, updates: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many leads using batch calls (50 per request).
+
+        Args:
+            updates: Mapping of lead ID to raw Bitrix fields to update
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_update("lead", updates)
+
+    async def delete_leads(self, ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Delete many leads using batch calls (50 per request).
+
+        Args:
+            ids: Lead IDs
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_delete("lead", ids)
+
     # ==================== Deals ====================
 
     async def create_deal(
@@ -533,7 +745,7 @@ class BitrixAPIClient:
         filter_params: Optional[Dict[str, Any]] = None,
         select: Optional[List[str]] = None,
         order: Optional[Dict[str, str]] = None,
-        limit: int = 50
+        limit: Optional[int] = 50
     ) -> List[Deal]:
         """
         Search for deals.
@@ -542,7 +754,7 @@ class BitrixAPIClient:
             filter_params: Filter conditions
             select: Fields to return
             order: Sort order
-            limit: Maximum number of deals to return
+            limit: Maximum number of deals to return (None for all pages)
 
         Returns:
             List of Deal objects
@@ -560,9 +772,7 @@ class BitrixAPIClient:
         if order:
             params["order"] = order
 
-        result = await self._request("crm.deal.list", params)
-
-        deals = result if isinstance(result, list) else []
+        deals = await self._list_all("crm.deal.list", params, limit)
         return [
             Deal(
                 id=deal.get("ID", 0),
@@ -577,9 +787,57 @@ class BitrixAPIClient:
                 date_create=deal.get("DATE_CREATE", ""),
                 date_modify=deal.get("DATE_MODIFY", "")
             )
-            for deal in deals[:limit]
+            for deal in deals
         ]
 
+    async def create_deals(self, fields_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many deals using batch calls (50 per request).
+
+        Args:
+            fields_list: Raw Bitrix field dictionaries (e.g., {"TITLE": ...})
+
+        Returns:
+            Dictionary with "results" (new IDs, None for failures) and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_add("deal", fields_list)
+
+    async def update_deals(self, updates: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many deals using batch calls (50 per request).
+
+        Args:
+            updates: Mapping of deal ID to raw Bitrix fields to update
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_update("deal", updates)
+
+    async def delete_deals(self, ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Delete many deals using batch calls (50 per request).
+
+        Args:
+            ids: Deal IDs
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_delete("deal", ids)
+
     # ==================== Contacts ====================
 
     async def create_contact(
@@ -730,7 +988,7 @@ class BitrixAPIClient:
         filter_params: Optional[Dict[str, Any]] = None,
         select: Optional[List[str]] = None,
         order: Optional[Dict[str, str]] = None,
-        limit: int = 50
+        limit: Optional[int] = 50
     ) -> List[Contact]:
         """
         Search for contacts.
@@ -739,7 +997,7 @@ class BitrixAPIClient:
             filter_params: Filter conditions
             select: Fields to return
             order: Sort order
-            limit: Maximum number of contacts to return
+            limit: Maximum number of contacts to return (None for all pages)
 
         Returns:
             List of Contact objects
@@ -757,9 +1015,7 @@ class BitrixAPIClient:
         if order:
             params["order"] = order
 
-        result = await self._request("crm.contact.list", params)
-
-        contacts = result if isinstance(result, list) else []
+        contacts = await self._list_all("crm.contact.list", params, limit)
         return [
             Contact(
                 id=contact.get("ID", 0),
@@ -773,9 +1029,57 @@ class BitrixAPIClient:
                 date_create=contact.get("DATE_CREATE", ""),
                 date_modify=contact.get("DATE_MODIFY", "")
             )
-            for contact in contacts[:limit]
+            for contact in contacts
         ]
 
+    async def create_contacts(self, fields_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many contacts using batch calls (50 per request).
+
+        Args:
+            fields_list: Raw Bitrix field dictionaries (e.g., {"TITLE": ...})
+
+        Returns:
+            Dictionary with "results" (new IDs, None for failures) and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_add("contact", fields_list)
+
+    async def update_contacts(self, updates: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many contacts using batch calls (50 per request).
+
+        Args:
+            updates: Mapping of contact ID to raw Bitrix fields to update
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_update("contact", updates)
+
+    async def delete_contacts(self, ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Delete many contacts using batch calls (50 per request).
+
+        Args:
+            ids: Contact IDs
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_delete("contact", ids)
+
     # ==================== Products ====================
 
     async def create_product_item(
@@ -911,7 +1215,7 @@ class BitrixAPIClient:
         filter_params: Optional[Dict[str, Any]] = None,
         select: Optional[List[str]] = None,
         order: Optional[Dict[str, str]] = None,
-        limit: int = 50
+        limit: Optional[int] = 50
     ) -> List[ProductItem]:
         """
         Search for product items.
@@ -920,7 +1224,7 @@ class BitrixAPIClient:
             filter_params: Filter conditions
             select: Fields to return
             order: Sort order
-            limit: Maximum number of products to return
+            limit: Maximum number of products to return (None for all pages)
 
         Returns:
             List of ProductItem objects
@@ -938,9 +1242,7 @@ class BitrixAPIClient:
         if order:
             params["order"] = order
 
-        result = await self._request("crm.product.list", params)
-
-        products = result if isinstance(result, list) else []
+        products = await self._list_all("crm.product.list", params, limit)
         return [
             ProductItem(
                 id=product.get("ID", 0),
@@ -953,9 +1255,57 @@ class BitrixAPIClient:
                 date_create=product.get("DATE_CREATE", ""),
                 date_modify=product.get("DATE_MODIFY", "")
             )
-            for product in products[:limit]
+            for product in products
         ]
 
+    async def create_product_items(self, fields_list: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create many product items using batch calls (50 per request).
+
+        Args:
+            fields_list: Raw Bitrix field dictionaries (e.g., {"TITLE": ...})
+
+        Returns:
+            Dictionary with "results" (new IDs, None for failures) and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_add("product", fields_list)
+
+    async def update_product_items(self, updates: Dict[int, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Update many product items using batch calls (50 per request).
+
+        Args:
+            updates: Mapping of product item ID to raw Bitrix fields to update
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_update("product", updates)
+
+    async def delete_product_items(self, ids: Iterable[int]) -> Dict[str, Any]:
+        """
+        Delete many product items using batch calls (50 per request).
+
+        Args:
+            ids: Product item IDs
+
+        Returns:
+            Dictionary with "results" and "errors"
+
+        Raises:
+            aiohttp.ClientError: If request fails
+            Exception: If API returns error
+        """
+        return await self._bulk_delete("product", ids)
+
 
 # ==================== Webhook Support ====================
 
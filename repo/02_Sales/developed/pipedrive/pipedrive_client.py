@@ -42,12 +42,17 @@ Triggers:
 - Organization Deleted
 - Organization Added
 - Activity Added
+
+Sync:
+- Incremental change stream (v2 cursor lists / recents)
 """
 
 import aiohttp
 import asyncio
+import json
 import logging
-from typing import Optional, Dict, Any, List
+import os
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -155,6 +160,16 @@ class File:
     created_at: str = ""
 
 
+@dataclass
+class SyncChange:
+    """Entity change from the incremental sync stream"""
+    item_type: str
+    id: Any
+    action: str
+    timestamp: str
+    data: Dict[str, Any]
+
+
 class PipedriveClientError(Exception):
     """Base exception for Pipedrive client errors"""
     pass
@@ -174,6 +189,16 @@ class PipedriveClient:
     """
 
     BASE_URL = "https://{company_domain}.pipedrive.com/api/v1"
+    BASE_URL_V2 = "https://{company_domain}.pipedrive.com/api/v2"
+
+    # Item types with v2 cursor-paginated list endpoints; others use /recents
+    V2_LIST_ENDPOINTS = {
+        "deal": "/deals",
+        "person": "/persons",
+        "organization": "/organizations",
+        "activity": "/activities",
+        "product": "/products"
+    }
 
     def __init__(self, api_token: str, company_domain: str):
         """
@@ -186,13 +211,15 @@ class PipedriveClient:
         self.api_token = api_token
         self.company_domain = company_domain
         self.base_url = self.BASE_URL.format(company_domain=company_domain)
+        self.base_url_v2 = self.BASE_URL_V2.format(company_domain=company_domain)
         self.session: Optional[aiohttp.ClientSession] = None
         self._rate_limit_remaining = 100
         self._rate_limit_reset = 0
 
         logger = logging.getLogger("pipedrive")
-        logger.setLevel(logging.DEBUG)
         if not logger.handlers:
+            # INFO, matching the handler, so debug records are not built only to be dropped
+            logger.setLevel(logging.INFO)
             handler = logging.StreamHandler()
             handler.setLevel(logging.INFO)
             formatter = logging.Formatter(
@@ -210,6 +237,7 @@ class PipedriveClient:
 
         headers = {
             "Authorization": f"Basic {auth_string}",
+            "x-api-token": self.api_token,
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
@@ -229,21 +257,29 @@ class PipedriveClient:
         method: str,
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        full_response: bool = False,
+        v2: bool = False
     ) -> Dict[str, Any]:
-        """Make HTTP request with error handling and rate limiting."""
-        await self._check_rate_limit()
+        """
+        Make HTTP request with error handling and rate limiting.
 
-        url = f"{self.base_url}{endpoint}"
+        Returns the "data" member, or the whole body (with additional_data
+        for pagination) when full_response is True. v2 targets /api/v2.
+        """
+        url = f"{self.base_url_v2 if v2 else self.base_url}{endpoint}"
+        debug = self._logger.isEnabledFor(logging.DEBUG)
 
         retry_count = 0
         max_retries = 3
 
         while retry_count < max_retries:
+            await self._check_rate_limit()
             try:
-                self._logger.debug(f"Request: {method} {url}")
-                if data:
-                    self._logger.debug(f"Data: {data}")
+                if debug:
+                    self._logger.debug("Request: %s %s", method, url)
+                    if data:
+                        self._logger.debug("Data: %s", data)
 
                 async with self.session.request(
                     method,
@@ -255,8 +291,11 @@ class PipedriveClient:
 
                     if response.status in [200, 201]:
                         result = await response.json()
-                        self._logger.debug(f"Response: {result}")
+                        if debug:
+                            self._logger.debug("Response: %s", result)
                         if result.get("success", False):
+                            if full_response:
+                                return result
                             return result.get("data", {})
                         else:
                             raise PipedriveClientError(
@@ -299,13 +338,20 @@ class PipedriveClient:
                 await asyncio.sleep(2 ** retry_count)
 
     async def _check_rate_limit(self):
-        """Check if rate limit allows request"""
-        if self._rate_limit_remaining <= 1:
+        """
+        Check if rate limit allows request, and reserve a token for it.
+
+        Reserving keeps concurrent requests from all spending the last
+        tokens; the next response's headers restore the real count.
+        """
+        while self._rate_limit_remaining <= 1:
             now = int(datetime.now().timestamp())
-            if now < self._rate_limit_reset:
-                wait_time = self._rate_limit_reset - now
-                self._logger.warning(f"Rate limit reached, waiting {wait_time}s")
-                await asyncio.sleep(wait_time)
+            if now >= self._rate_limit_reset:
+                break
+            wait_time = self._rate_limit_reset - now
+            self._logger.warning(f"Rate limit reached, waiting {wait_time}s")
+            await asyncio.sleep(wait_time)
+        self._rate_limit_remaining -= 1
 
     async def _update_rate_limit(self, response: aiohttp.ClientResponse):
         """Update rate limit info from response headers"""
@@ -1004,4 +1050,236 @@ class PipedriveClient:
                 updated_at=item.get("update_time", "")
             ))
 
-        return products
\ No newline at end of file
+        return products
+
+    # ==================== Incremental Sync ====================
+
+    async def sync_changes(
+        self,
+        since: Optional[str] = None,
+        item_types: Tuple[str, ...] = ("person", "deal", "activity"),
+        state_file: Optional[str] = None,
+        page_size: int = 500,
+        prefetch_pages: int = 2,
+        use_v2: bool = True
+    ) -> AsyncIterator[SyncChange]:
+        """
+        Stream entities changed since a timestamp, ordered by update time.
+
+        Each item type is paged by its own task, so pages of different types
+        are fetched concurrently; all tasks share the rate-limit token budget
+        tracked from the X-RateLimit headers. Within a type, pages come from
+        v2 cursor lists (deals, persons, organizations, activities, products)
+        or from /recents advanced by timestamp, both stable while records
+        change. The per-type streams are merged into one stream ordered by
+        update time.
+
+        With state_file, the position of every item type is stored after each
+        page worth of changes has been consumed (and at the end), and later
+        calls resume from there; since is only used for types without state.
+
+        Args:
+            since: UTC start timestamp "YYYY-MM-DD HH:MM:SS" (default: everything)
+            item_types: Pipedrive item types (deal, person, organization, activity, note, ...)
+            state_file: JSON file for resumable sync positions
+            page_size: Items per page (max 500)
+            prefetch_pages: Pages buffered ahead of the consumer per type
+            use_v2: Use v2 cursor lists where available
+
+        Yields:
+            SyncChange objects with action "updated" or "deleted"
+        """
+        state = {}
+        if state_file and os.path.exists(state_file):
+            with open(state_file) as f:
+                state = json.load(f)
+
+        for item_type in item_types:
+            state.setdefault(item_type, {"timestamp": since, "ids": []})
+
+        queues = {
+            item_type: asyncio.Queue(maxsize=prefetch_pages)
+            for item_type in item_types
+        }
+        tasks = [
+            asyncio.create_task(self._produce_changes(
+                item_type, state[item_type], page_size, use_v2, queues[item_type]
+            ))
+            for item_type in item_types
+        ]
+
+        # Head page per type; merge by the timestamp of each page's next change
+        pages: Dict[str, List[SyncChange]] = {}
+        since_save = 0
+        try:
+            for item_type, changes_queue in queues.items():
+                page = await self._next_page(changes_queue)
+                if page:
+                    pages[item_type] = page
+
+            while pages:
+                item_type = min(pages, key=lambda key: pages[key][0].timestamp)
+                change = pages[item_type].pop(0)
+
+                yield change
+
+                position = state[item_type]
+                if change.timestamp != position["timestamp"]:
+                    position["timestamp"] = change.timestamp
+                    position["ids"] = []
+                position["ids"].append(change.id)
+
+                since_save += 1
+                if state_file and since_save >= page_size:
+                    self._save_sync_state(state_file, state)
+                    since_save = 0
+
+                if not pages[item_type]:
+                    page = await self._next_page(queues[item_type])
+                    if page:
+                        pages[item_type] = page
+                    else:
+                        del pages[item_type]
+
+            if state_file:
+                self._save_sync_state(state_file, state)
+
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    @staticmethod
+    async def _next_page(changes_queue: asyncio.Queue) -> Optional[List[SyncChange]]:
+        """Return the next non-empty page, or None when the producer is done."""
+        while True:
+            page = await changes_queue.get()
+            if isinstance(page, Exception):
+                raise page
+            if page is None or page:
+                return page
+
+    async def _produce_changes(
+        self,
+        item_type: str,
+        position: Dict[str, Any],
+        page_size: int,
+        use_v2: bool,
+        changes_queue: asyncio.Queue
+    ) -> None:
+        """Page through changes of one item type into a queue; None marks the end."""
+        seen_at_start = set(position.get("ids", []))
+        start_timestamp = position.get("timestamp")
+        try:
+            if use_v2 and item_type in self.V2_LIST_ENDPOINTS:
+                pages = self._iter_v2_changes(item_type, start_timestamp, page_size)
+            else:
+                pages = self._iter_recents_changes(item_type, start_timestamp, page_size)
+
+            async for page in pages:
+                await changes_queue.put([
+                    change for change in page
+                    if not (change.timestamp == start_timestamp and change.id in seen_at_start)
+                ])
+            await changes_queue.put(None)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            await changes_queue.put(e)
+
+    async def _iter_v2_changes(
+        self,
+        item_type: str,
+        since: Optional[str],
+        page_size: int
+    ) -> AsyncIterator[List[SyncChange]]:
+        """Page through a v2 list sorted by update_time, following next_cursor."""
+        params = {
+            "limit": page_size,
+            "sort_by": "update_time",
+            "sort_direction": "asc"
+        }
+        if since:
+            params["updated_since"] = since.replace(" ", "T") + "Z"
+
+        while True:
+            result = await self._request(
+                "GET", self.V2_LIST_ENDPOINTS[item_type], params=params, full_response=True, v2=True
+            )
+            yield [self._to_sync_change(item_type, item) for item in result.get("data") or []]
+
+            cursor = (result.get("additional_data") or {}).get("next_cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    async def _iter_recents_changes(
+        self,
+        item_type: str,
+        since: Optional[str],
+        page_size: int
+    ) -> AsyncIterator[List[SyncChange]]:
+        """
+        Page through /recents, moving since_timestamp to the end of each page.
+
+        Offsets are only used while a whole page shares one timestamp, so
+        records updated mid-sync cannot shift unread items out of range.
+        """
+        since = since or "1970-01-01 00:00:00"
+        start = 0
+        # IDs already yielded at the since timestamp, which the next page repeats
+        boundary_ids = set()
+        while True:
+            result = await self._request(
+                "GET", "/recents",
+                params={"since_timestamp": since, "items": item_type, "start": start, "limit": page_size},
+                full_response=True
+            )
+            changes = [
+                self._to_sync_change(entry.get("item", item_type), entry.get("data") or {}, entry.get("id"))
+                for entry in result.get("data") or []
+            ]
+            if not changes:
+                return
+            yield [
+                change for change in changes
+                if not (change.timestamp == since and change.id in boundary_ids)
+            ]
+
+            additional = result.get("additional_data") or {}
+            if not (additional.get("pagination") or {}).get("more_items_in_collection"):
+                return
+
+            last_timestamp = changes[-1].timestamp
+            if last_timestamp == since:
+                start += len(changes)
+            else:
+                since, start = last_timestamp, 0
+                boundary_ids = set()
+            boundary_ids.update(change.id for change in changes if change.timestamp == since)
+
+    @staticmethod
+    def _to_sync_change(item_type: str, data: Dict[str, Any], item_id: Any = None) -> SyncChange:
+        deleted = (
+            data.get("is_deleted")
+            or data.get("deleted")
+            or data.get("active_flag") is False
+        )
+        # v2 uses RFC 3339 ("2024-01-31T12:00:00Z"); v1 uses "2024-01-31 12:00:00"
+        timestamp = (data.get("update_time") or data.get("add_time") or "")
+        timestamp = timestamp.replace("T", " ").rstrip("Z")[:19]
+        return SyncChange(
+            item_type=item_type,
+            id=data.get("id", item_id),
+            action="deleted" if deleted else "updated",
+            timestamp=timestamp,
+            data=data
+        )
+
+    @staticmethod
+    def _save_sync_state(state_file: str, state: Dict[str, Any]) -> None:
+        """Atomically persist sync positions."""
+        tmp_file = f"{state_file}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_file, state_file)
@@ -3,8 +3,13 @@ Salesforce Sb API Client
 API Documentation: https://developer.salesforce.com/docs/api/rest/
 """
 
+import csv
+import io
+import tempfile
+import time
 import requests
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Tuple
 
 
 class SalesforceSbAPIError(Exception):
@@ -15,6 +20,15 @@ class SalesforceSbAPIError(Exception):
 class SalesforceSbClient:
     """Client for Salesforce S&B (Sales & Business integration) API."""
 
+    # Bulk API 2.0 accepts at most 150 MB (base64) per upload; 100 MB raw is the documented safe size
+    BULK_MAX_BYTES = 100 * 1024 * 1024
+    BULK_MAX_CHARS = 150_000_000
+    BULK_SPOOL_SIZE = 8 * 1024 * 1024
+    BULK_NULL = "#N/A"
+    BULK_TERMINAL_STATES = ("JobComplete", "Failed", "Aborted")
+    COLLECTION_SIZE = 200
+    COMPOSITE_SIZE = 25
+
     def __init__(
         self,
         instance_url: str,
@@ -52,18 +66,29 @@ class SalesforceSbClient:
         Returns:
             Response data
         """
-        url = f"{self.base_url}{endpoint}"
+        response = self._send(method, endpoint, **kwargs)
+        return {
+            "status": "success",
+            "data": response.json() if response.content else {},
+            "status_code": response.status_code
+        }
+
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """
+        Send a request and return the raw response, raising on HTTP errors.
+
+        endpoint may be a path under base_url or a path starting with
+        /services/ (as in nextRecordsUrl).
+        """
+        if endpoint.startswith("/services/"):
+            url = f"{self.instance_url}{endpoint}"
+        else:
+            url = f"{self.base_url}{endpoint}"
 
         try:
             response = self.session.request(method, url, **kwargs)
             response.raise_for_status()
-
-            data = response.json()
-            return {
-                "status": "success",
-                "data": data,
-                "status_code": response.status_code
-            }
+            return response
 
         except requests.exceptions.HTTPError as e:
             error_data = self._parse_error(response)
@@ -76,7 +101,11 @@ class SalesforceSbClient:
     def _parse_error(self, response: requests.Response) -> Dict[str, Any]:
         """Parse error response."""
         try:
-            return response.json() if response.content else {"message": response.text}
+            data = response.json() if response.content else {"message": response.text}
+            # Salesforce returns errors as a list of {message, errorCode}
+            if isinstance(data, list) and data:
+                return data[0]
+            return data
         except Exception:
             return {"message": response.text}
 
@@ -90,10 +119,9 @@ class SalesforceSbClient:
             soql: SOQL query string
 
         Returns:
-            Query results
+            Query results (first batch; see iter_query for all records)
         """
-        endpoint = f"/query?q={soql}"
-        return self._make_request("GET", endpoint)
+        return self._make_request("GET", "/query", params={"q": soql})
 
     def query_all(self, soql: str) -> Dict[str, Any]:
         """
@@ -103,10 +131,30 @@ class SalesforceSbClient:
             soql: SOQL query string
 
         Returns:
-            Query results including deleted/archived records
+            Query results including deleted/archived records (first batch)
         """
-        endpoint = f"/queryAll?q={soql}"
-        return self._make_request("GET", endpoint)
+        return self._make_request("GET", "/queryAll", params={"q": soql})
+
+    def iter_query(self, soql: str, include_deleted: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all records of a SOQL query, following nextRecordsUrl.
+
+        Args:
+            soql: SOQL query string
+            include_deleted: Use queryAll to include deleted/archived records
+
+        Yields:
+            Record dicts, one batch (up to 2,000 records) in memory at a time
+        """
+        response = self._make_request(
+            "GET", "/queryAll" if include_deleted else "/query", params={"q": soql}
+        )
+        while True:
+            data = response["data"]
+            yield from data.get("records", [])
+            if data.get("done", True) or not data.get("nextRecordsUrl"):
+                break
+            response = self._make_request("GET", data["nextRecordsUrl"])
 
     def create_object(
         self,
@@ -206,6 +254,212 @@ class SalesforceSbClient:
         endpoint = f"/sobjects/{object_type}/{external_id_field}/{external_id}"
         return self._make_request("PATCH", endpoint, json=data)
 
+    def create_records(
+        self,
+        object_type: str,
+        records: List[Dict[str, Any]],
+        all_or_none: bool = False,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Create records with sObject Collections, 200 per request.
+
+        Args:
+            object_type: Salesforce object type
+            records: Field data of the records to create
+            all_or_none: Roll back a request (up to 200 records) if any record in it fails
+            max_workers: Collection requests sent concurrently
+
+        Returns:
+            One {id, success, errors} result per record, in input order
+        """
+        payloads = [
+            {"allOrNone": all_or_none, "records": [self._collection_record(object_type, record) for record in chunk]}
+            for chunk in self._chunks(records, self.COLLECTION_SIZE)
+        ]
+        return self._collection_calls(
+            [("POST", "/composite/sobjects", {"json": payload}) for payload in payloads], max_workers
+        )
+
+    def update_records(
+        self,
+        object_type: str,
+        records: List[Dict[str, Any]],
+        all_or_none: bool = False,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Update records with sObject Collections, 200 per request.
+
+        Args:
+            object_type: Salesforce object type
+            records: Fields to update; each record must include "Id"
+            all_or_none: Roll back a request (up to 200 records) if any record in it fails
+            max_workers: Collection requests sent concurrently
+
+        Returns:
+            One {id, success, errors} result per record, in input order
+        """
+        if any("Id" not in record for record in records):
+            raise ValueError("Every record must include Id")
+
+        payloads = [
+            {"allOrNone": all_or_none, "records": [self._collection_record(object_type, record) for record in chunk]}
+            for chunk in self._chunks(records, self.COLLECTION_SIZE)
+        ]
+        return self._collection_calls(
+            [("PATCH", "/composite/sobjects", {"json": payload}) for payload in payloads], max_workers
+        )
+
+    def upsert_records(
+        self,
+        object_type: str,
+        external_id_field: str,
+        records: List[Dict[str, Any]],
+        all_or_none: bool = False,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Upsert records by external ID with sObject Collections, 200 per request.
+
+        Args:
+            object_type: Salesforce object type
+            external_id_field: External ID field name; each record must include it
+            records: Object field data
+            all_or_none: Roll back a request (up to 200 records) if any record in it fails
+            max_workers: Collection requests sent concurrently
+
+        Returns:
+            One {id, success, created, errors} result per record, in input order
+        """
+        if any(external_id_field not in record for record in records):
+            raise ValueError(f"Every record must include {external_id_field}")
+
+        endpoint = f"/composite/sobjects/{object_type}/{external_id_field}"
+        payloads = [
+            {"allOrNone": all_or_none, "records": [self._collection_record(object_type, record) for record in chunk]}
+            for chunk in self._chunks(records, self.COLLECTION_SIZE)
+        ]
+        return self._collection_calls(
+            [("PATCH", endpoint, {"json": payload}) for payload in payloads], max_workers
+        )
+
+    def delete_records(
+        self,
+        record_ids: List[str],
+        all_or_none: bool = False,
+        max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Delete records of any type with sObject Collections, 200 IDs per request.
+
+        Args:
+            record_ids: Record IDs to delete
+            all_or_none: Roll back a request (up to 200 records) if any deletion in it fails
+            max_workers: Collection requests sent concurrently
+
+        Returns:
+            One {id, success, errors} result per ID, in input order
+        """
+        calls = [
+            ("DELETE", "/composite/sobjects", {
+                "params": {"ids": ",".join(chunk), "allOrNone": str(all_or_none).lower()}
+            })
+            for chunk in self._chunks(record_ids, self.COLLECTION_SIZE)
+        ]
+        return self._collection_calls(calls, max_workers)
+
+    def composite(
+        self,
+        subrequests: List[Dict[str, Any]],
+        all_or_none: bool = True,
+        collate_subrequests: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute up to 25 dependent subrequests in one call (Composite API).
+
+        Later subrequests can use earlier results through their referenceId,
+        e.g. "@{newAccount.id}". URLs may be relative to the API version
+        ("/sobjects/Account") or full ("/services/data/v56.0/...").
+
+        Args:
+            subrequests: {method, url, referenceId, body} dicts
+            all_or_none: Roll back everything if any subrequest fails
+            collate_subrequests: Let Salesforce group independent subrequests
+
+        Returns:
+            compositeResponse with one entry per subrequest
+        """
+        if len(subrequests) > self.COMPOSITE_SIZE:
+            raise ValueError(f"Composite requests allow at most {self.COMPOSITE_SIZE} subrequests")
+
+        return self._make_request("POST", "/composite", json={
+            "allOrNone": all_or_none,
+            "collateSubrequests": collate_subrequests,
+            "compositeRequest": [self._subrequest(subrequest) for subrequest in subrequests]
+        })
+
+    def composite_graph(self, graphs: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Execute independent graphs of dependent subrequests (Composite Graph API).
+
+        Each graph has up to 500 nodes and succeeds or rolls back as a unit.
+        One failing graph does not affect the others.
+
+        Args:
+            graphs: Mapping of graph ID to its {method, url, referenceId, body} subrequests
+
+        Returns:
+            graphs with isSuccessful and graphResponse per graph
+        """
+        return self._make_request("POST", "/composite/graph", json={
+            "graphs": [
+                {
+                    "graphId": graph_id,
+                    "compositeRequest": [self._subrequest(subrequest) for subrequest in subrequests]
+                }
+                for graph_id, subrequests in graphs.items()
+            ]
+        })
+
+    def _subrequest(self, subrequest: Dict[str, Any]) -> Dict[str, Any]:
+        url = subrequest["url"]
+        if not url.startswith("/services/"):
+            url = f"/services/data/v{self.api_version}{url}"
+        return {**subrequest, "url": url}
+
+    def _collection_calls(
+        self,
+        calls: List[Tuple[str, str, Dict[str, Any]]],
+        max_workers: int
+    ) -> Dict[str, Any]:
+        """Send independent collection requests concurrently and concatenate their results."""
+        def send(call):
+            method, endpoint, kwargs = call
+            return self._make_request(method, endpoint, **kwargs)["data"]
+
+        if max_workers <= 1 or len(calls) <= 1:
+            responses = [send(call) for call in calls]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                responses = list(executor.map(send, calls))
+
+        results = [result for response in responses for result in response]
+        # Per-record failures are reported in each result's success/errors
+        return {
+            "status": "success",
+            "data": results,
+            "status_code": 200
+        }
+
+    @staticmethod
+    def _collection_record(object_type: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        return {"attributes": {"type": object_type}, **record}
+
+    @staticmethod
+    def _chunks(items: List[Any], size: int) -> List[List[Any]]:
+        return [items[start:start + size] for start in range(0, len(items), size)]
+
     def create_account(
         self,
         name: str,
@@ -762,36 +1016,277 @@ class SalesforceSbClient:
     def bulk_insert(
         self,
         object_type: str,
-        records: List[Dict[str, Any]]
+        records: Iterable[Dict[str, Any]]
     ) -> Dict[str, Any]:
         """
-        Bulk insert records using Bulk API.
+        Bulk insert records using Bulk API 2.0.
 
         Args:
             object_type: Salesforce object type
-            records: List of record data to insert
+            records: Records to insert (any iterable; consumed lazily)
 
         Returns:
-            Bulk job information
+            Finished job information for every ingest job used
         """
-        endpoint = f"/jobs/ingest"
-        data = {
-            "object": object_type,
-            "contentType": "JSON",
-            "operation": "insert"
+        jobs = self.bulk_ingest(object_type, records, operation="insert")
+        return {
+            "status": "success",
+            "data": {
+                "jobs": jobs,
+                "numberRecordsProcessed": sum(job.get("numberRecordsProcessed", 0) for job in jobs),
+                "numberRecordsFailed": sum(job.get("numberRecordsFailed", 0) for job in jobs)
+            },
+            "status_code": 200
         }
-        job_response = self._make_request("POST", endpoint, json=data)
-        job_id = job_response.get('data', {}).get('id')
-
-        # Upload data
-        upload_endpoint = f"/jobs/ingest/{job_id}/batches"
-        import json as json_module
-        csv_data = "\n".join([json_module.dumps(record) for record in records])
-        self._make_request("PUT", upload_endpoint, data=csv_data, headers={"Content-Type": "text/csv"})
-
-        # Close job
-        close_endpoint = f"/jobs/ingest/{job_id}"
-        return self._make_request("PATCH", close_endpoint, json={"state": "UploadComplete"})
+
+    def bulk_ingest(
+        self,
+        object_type: str,
+        records: Iterable[Dict[str, Any]],
+        operation: str = "insert",
+        external_id_field: Optional[str] = None,
+        fields: Optional[List[str]] = None,
+        wait: bool = True,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Load records with Bulk API 2.0 ingest jobs.
+
+        Records are encoded as CSV into a disk-backed buffer. When the
+        buffer would exceed the upload limits (100 MB / 150M characters), it
+        is uploaded as one job and a new one is started. Memory use stays
+        bounded whatever the number of records.
+        None values are sent as #N/A, which clears the field; fields missing
+        from a record are sent empty, which leaves them unchanged.
+
+        Args:
+            object_type: Salesforce object type
+            records: Records to load (any iterable; consumed lazily)
+            operation: insert, update, upsert, delete or hardDelete
+            external_id_field: External ID field (required for upsert)
+            fields: CSV columns (default: keys of the first record)
+            wait: Poll jobs until they finish
+            poll_interval: Initial poll interval in seconds (doubles up to max_poll_interval)
+            max_poll_interval: Maximum poll interval in seconds
+            timeout: Give up waiting after this many seconds
+            max_bytes: Upload size per job (default BULK_MAX_BYTES)
+
+        Returns:
+            Job information for each job, final state if wait is True
+
+        Raises:
+            SalesforceSbAPIError: If a job cannot be created, uploaded or finishes Failed/Aborted
+            ValueError: If a record has fields outside the CSV columns
+        """
+        if operation == "upsert" and not external_id_field:
+            raise ValueError("external_id_field is required for upsert")
+
+        job_ids = []
+        for part, size in self._iter_csv_parts(records, fields, max_bytes or self.BULK_MAX_BYTES):
+            try:
+                job_config = {
+                    "object": object_type,
+                    "operation": operation,
+                    "contentType": "CSV",
+                    "lineEnding": "LF"
+                }
+                if external_id_field:
+                    job_config["externalIdFieldName"] = external_id_field
+
+                job_id = self._make_request("POST", "/jobs/ingest", json=job_config)["data"]["id"]
+                self._send(
+                    "PUT", f"/jobs/ingest/{job_id}/batches", data=part,
+                    headers={"Content-Type": "text/csv", "Content-Length": str(size)}
+                )
+                self._make_request("PATCH", f"/jobs/ingest/{job_id}", json={"state": "UploadComplete"})
+                job_ids.append(job_id)
+            finally:
+                part.close()
+
+        if not wait:
+            return [self._make_request("GET", f"/jobs/ingest/{job_id}")["data"] for job_id in job_ids]
+
+        # Jobs process in parallel on the server; wait for all of them
+        return [
+            self.wait_for_bulk_job(
+                f"/jobs/ingest/{job_id}", poll_interval, max_poll_interval, timeout
+            )
+            for job_id in job_ids
+        ]
+
+    def iter_bulk_results(self, job_id: str, result_type: str = "failedResults") -> Iterator[Dict[str, str]]:
+        """
+        Stream the result CSV of an ingest job.
+
+        Args:
+            job_id: Ingest job ID
+            result_type: successfulResults, failedResults or unprocessedrecords
+
+        Yields:
+            Row dicts (sf__Id, sf__Created / sf__Error plus the original columns)
+        """
+        response = self._send(
+            "GET", f"/jobs/ingest/{job_id}/{result_type}/",
+            headers={"Accept": "text/csv"}, stream=True
+        )
+        yield from self._iter_csv_response(response)
+
+    def bulk_query(
+        self,
+        soql: str,
+        include_deleted: bool = False,
+        max_records: int = 50000,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Run a Bulk API 2.0 query job and stream its records.
+
+        Results are fetched max_records at a time, following the
+        Sforce-Locator header, and parsed from the CSV response as it
+        arrives. Only one row is held in memory at a time.
+
+        Args:
+            soql: SOQL query string
+            include_deleted: Use queryAll to include deleted/archived records
+            max_records: Records per result request
+            poll_interval: Initial poll interval in seconds (doubles up to max_poll_interval)
+            max_poll_interval: Maximum poll interval in seconds
+            timeout: Give up waiting after this many seconds
+
+        Yields:
+            Record dicts with string values (empty string for null)
+        """
+        job = self._make_request(
+            "POST", "/jobs/query",
+            json={"operation": "queryAll" if include_deleted else "query", "query": soql}
+        )["data"]
+        job_path = f"/jobs/query/{job['id']}"
+        self.wait_for_bulk_job(job_path, poll_interval, max_poll_interval, timeout)
+
+        locator = None
+        while True:
+            params = {"maxRecords": max_records}
+            if locator:
+                params["locator"] = locator
+            response = self._send(
+                "GET", f"{job_path}/results", params=params,
+                headers={"Accept": "text/csv"}, stream=True
+            )
+            yield from self._iter_csv_response(response)
+
+            locator = response.headers.get("Sforce-Locator")
+            if not locator or locator == "null":
+                break
+
+    def wait_for_bulk_job(
+        self,
+        job_path: str,
+        poll_interval: float = 2.0,
+        max_poll_interval: float = 30.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Poll a Bulk API 2.0 job with exponential backoff until it finishes.
+
+        Args:
+            job_path: Job endpoint, e.g. /jobs/ingest/{id} or /jobs/query/{id}
+
+        Returns:
+            Final job information
+
+        Raises:
+            SalesforceSbAPIError: If the job fails, is aborted or times out
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        interval = poll_interval
+        while True:
+            job = self._make_request("GET", job_path)["data"]
+            state = job.get("state")
+            if state == "JobComplete":
+                return job
+            if state in self.BULK_TERMINAL_STATES:
+                raise SalesforceSbAPIError(
+                    f"Bulk job {job.get('id')} {state}: {job.get('errorMessage', '')}"
+                )
+            if deadline and time.monotonic() + interval > deadline:
+                raise SalesforceSbAPIError(f"Bulk job {job.get('id')} still {state} after {timeout}s")
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+
+    def _iter_csv_parts(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fields: Optional[List[str]],
+        max_bytes: int
+    ) -> Iterator[Tuple[Any, int]]:
+        """Encode records into CSV files within the upload limits; yields (file, size)."""
+        iterator = iter(records)
+        record = next(iterator, None)
+        if record is None:
+            return
+
+        fields = list(fields or record.keys())
+        field_set = set(fields)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+
+        def encode_row(values):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerow(values)
+            return buffer.getvalue()
+
+        header = encode_row(fields)
+        while record is not None:
+            part = tempfile.SpooledTemporaryFile(max_size=self.BULK_SPOOL_SIZE)
+            encoded = header.encode("utf-8")
+            part.write(encoded)
+            size, chars, rows = len(encoded), len(header), 0
+
+            while record is not None:
+                if not field_set.issuperset(record):
+                    raise ValueError(f"Record has fields not in {fields}: {sorted(set(record) - field_set)}")
+                # A missing key leaves the field untouched (empty cell); only an
+                # explicit None clears it (#N/A)
+                line = encode_row([
+                    self._bulk_value(record[field]) if field in record else ""
+                    for field in fields
+                ])
+                encoded = line.encode("utf-8")
+                if rows and (size + len(encoded) > max_bytes or chars + len(line) > self.BULK_MAX_CHARS):
+                    break
+                part.write(encoded)
+                size += len(encoded)
+                chars += len(line)
+                rows += 1
+                record = next(iterator, None)
+
+            part.seek(0)
+            yield part, size
+
+    def _bulk_value(self, value: Any) -> str:
+        if value is None:
+            return self.BULK_NULL
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        return str(value)
+
+    @staticmethod
+    def _iter_csv_response(response: requests.Response) -> Iterator[Dict[str, str]]:
+        """Parse a streamed CSV response row by row."""
+        response.raw.decode_content = True
+        text = io.TextIOWrapper(response.raw, encoding="utf-8", newline="")
+        try:
+            yield from csv.DictReader(text)
+        finally:
+            response.close()
 
     def chatter_post(
         self,
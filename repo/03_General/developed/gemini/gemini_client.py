@@ -6,14 +6,19 @@ Supports:
 - Generate Content with URL Context
 - Generate Content with File
 - Generate Content with Google Search
-- Upload File
+- Stream Generate Content
+- Upload File (resumable, cached by content hash)
 """
 
 import aiohttp
+import asyncio
 import json
-import base64
-from typing import Optional, Dict, Any, List, Union
-from dataclasses import dataclass
+import hashlib
+import mimetypes
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List, Union, AsyncIterator
+from dataclasses import dataclass, asdict
 
 
 @dataclass
@@ -34,6 +39,17 @@ class UploadedFile:
     mime_type: str
     size: int
     uri: str
+    state: Optional[str] = None
+    expiration_time: Optional[str] = None
+    sha256: Optional[str] = None
+
+
+@dataclass
+class GenerationChunk:
+    """Incremental piece of a streamed generation"""
+    text: str
+    finish_reason: Optional[str] = None
+    usage: Optional[Dict[str, int]] = None
 
 
 @dataclass
@@ -58,12 +74,15 @@ class GeminiClient:
     """
 
     BASE_URL = "https://generativelanguage.googleapis.com/v1beta"
+    UPLOAD_URL = "https://generativelanguage.googleapis.com/upload/v1beta/files"
+    UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024  # must be a multiple of 256 KiB
 
     def __init__(
         self,
         api_key: str,
         model: str = "gemini-pro",
-        enable_search: bool = False
+        enable_search: bool = False,
+        file_cache_path: Optional[str] = None
     ):
         """
         Initialize Gemini client.
@@ -72,12 +91,21 @@ class GeminiClient:
             api_key: Google Cloud API key
             model: Model name to use (e.g., gemini-pro, gemini-pro-vision)
             enable_search: Whether to enable Google Search integration
+            file_cache_path: JSON file persisting uploaded file URIs by content
+                hash across runs (kept in memory only if omitted)
         """
         self.api_key = api_key
         self.model = model
         self.enable_search = enable_search
+        self.file_cache_path = file_cache_path
         self.session = None
         self._rate_limit_delay = 0.2
+        self._file_cache: Dict[str, UploadedFile] = {}
+        if file_cache_path and os.path.exists(file_cache_path):
+            with open(file_cache_path) as f:
+                self._file_cache = {
+                    digest: UploadedFile(**entry) for digest, entry in json.load(f).items()
+                }
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
@@ -377,22 +405,31 @@ Based on the above context, please answer the following:
     async def generate_content_with_file(
         self,
         prompt: str,
-        file_id: str,
-        file_mime_type: str,
-        file_data: bytes,
+        file_id: Optional[str] = None,
+        file_mime_type: Optional[str] = None,
+        file_data: Optional[bytes] = None,
         temperature: float = 0.7,
-        max_output_tokens: int = 1024
+        max_output_tokens: int = 1024,
+        file_path: Optional[str] = None,
+        uploaded_file: Optional[UploadedFile] = None
     ) -> GenerationResponse:
         """
         Generate content with context from an uploaded file.
 
+        The file is referenced by its Files API URI instead of being inlined
+        as base64. Local paths and bytes are uploaded once and reused by
+        content hash, so repeated prompts against the same file neither
+        re-upload nor re-encode it.
+
         Args:
             prompt: Text prompt for generation
-            file_id: File ID (from upload_file)
+            file_id: File name from upload_file (e.g. "files/abc123")
             file_mime_type: MIME type of the file
-            file_data: File data as bytes
+            file_data: File data as bytes (uploaded if not cached)
             temperature: Sampling temperature (0.0-2.0)
             max_output_tokens: Maximum tokens to generate
+            file_path: Local file to use (uploaded if not cached)
+            uploaded_file: File returned by upload_file / upload_file_from_path
 
         Returns:
             GenerationResponse with generated content
@@ -403,52 +440,23 @@ Based on the above context, please answer the following:
         """
         if not prompt:
             raise ValueError("prompt is required")
-        if not file_id:
-            raise ValueError("file_id is required")
-
-        # Prepare file part for the request
-        if self.model == "gemini-pro-vision":
-            # For vision model, send inline data
-            encoded_data = base64.b64encode(file_data).decode("utf-8")
-
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "inline_data": {
-                                    "mime_type": file_mime_type,
-                                    "data": encoded_data
-                                }
-                            },
-                            {
-                                "text": f"File ID: {file_id}\n\n{prompt}"
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": temperature,
-                    "maxOutputTokens": max_output_tokens
-                }
-            }
-        else:
-            # For text-only model, just use the prompt with file reference
-            payload = {
-                "contents": [
-                    {
-                        "parts": [
-                            {
-                                "text": f"Referencing uploaded file (ID: {file_id})\n\n{prompt}"
-                            }
-                        ]
-                    }
-                ],
-                "generationConfig": {
-                    "temperature": temperature,
-                    "maxOutputTokens": max_output_tokens
+
+        uploaded = await self._resolve_file(file_id, file_mime_type, file_data, file_path, uploaded_file)
+
+        payload = {
+            "contents": [
+                {
+                    "parts": [
+                        self._file_part(uploaded),
+                        {"text": prompt}
+                    ]
                 }
+            ],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_output_tokens
             }
+        }
 
         response_data = await self._make_request(
             "POST",
@@ -475,6 +483,144 @@ Based on the above context, please answer the following:
             usage=response_data.get("usageMetadata")
         )
 
+    async def _resolve_file(
+        self,
+        file_id: Optional[str],
+        file_mime_type: Optional[str],
+        file_data: Optional[bytes],
+        file_path: Optional[str],
+        uploaded_file: Optional[UploadedFile]
+    ) -> UploadedFile:
+        """Turn the file arguments of a generation call into an uploaded file."""
+        if uploaded_file:
+            return uploaded_file
+        if file_path:
+            return await self.upload_file_from_path(file_path, mime_type=file_mime_type)
+        if file_data:
+            return await self.upload_file(
+                file_data, file_id or "upload", mime_type=file_mime_type
+            )
+        if file_id:
+            return await self.get_file(file_id)
+        raise ValueError("One of file_id, file_data, file_path or uploaded_file is required")
+
+    @staticmethod
+    def _file_part(uploaded: UploadedFile) -> Dict[str, Any]:
+        return {"file_data": {"mime_type": uploaded.mime_type, "file_uri": uploaded.uri}}
+
+    # ==================== Stream Generate Content ====================
+
+    async def stream_generate_content(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_output_tokens: int = 1024,
+        top_p: float = 0.95,
+        top_k: int = 40,
+        system_instruction: Optional[str] = None,
+        files: Optional[List[UploadedFile]] = None
+    ) -> AsyncIterator[GenerationChunk]:
+        """
+        Stream generated content as it is produced (streamGenerateContent).
+
+        Args:
+            prompt: Text prompt for generation
+            temperature: Sampling temperature (0.0-2.0)
+            max_output_tokens: Maximum tokens to generate
+            top_p: Nucleus sampling parameter
+            top_k: Top-k sampling parameter
+            system_instruction: Optional system instruction
+            files: Uploaded files to include as context
+
+        Yields:
+            GenerationChunk per streamed response; usage is set on chunks
+            that carry usage metadata (the last one has the totals)
+
+        Raises:
+            Exception: If generation fails
+            ValueError: If parameters are invalid
+
+        Example:
+            async for chunk in client.stream_generate_content("Tell me a story"):
+                print(chunk.text, end="", flush=True)
+        """
+        if not prompt:
+            raise ValueError("prompt is required")
+
+        if temperature < 0 or temperature > 2:
+            raise ValueError("temperature must be between 0 and 2")
+
+        parts = [self._file_part(uploaded) for uploaded in files or []]
+        parts.append({"text": prompt})
+
+        payload = {
+            "contents": [{"parts": parts}],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_output_tokens,
+                "topP": top_p,
+                "topK": top_k
+            }
+        }
+
+        if system_instruction:
+            payload["system_instruction"] = {
+                "parts": [{"text": system_instruction}]
+            }
+
+        try:
+            async with self.session.post(
+                f"{self.BASE_URL}/models/{self.model}:streamGenerateContent",
+                params={"alt": "sse", "key": self.api_key},
+                json=payload
+            ) as response:
+                if response.status >= 400:
+                    try:
+                        error = (await response.json()).get("error", {})
+                    except (aiohttp.ContentTypeError, json.JSONDecodeError):
+                        error = {}
+                    error_message = error.get("message", f"HTTP {response.status} error")
+                    raise Exception(f"Gemini API error: {error_message}")
+
+                async for data in self._iter_sse_data(response):
+                    event = json.loads(data)
+                    if "error" in event:
+                        raise Exception(f"Gemini API error: {event['error'].get('message', event['error'])}")
+
+                    candidates = event.get("candidates") or [{}]
+                    candidate = candidates[0]
+                    text = "".join(
+                        part.get("text", "")
+                        for part in candidate.get("content", {}).get("parts", [])
+                    )
+                    yield GenerationChunk(
+                        text=text,
+                        finish_reason=candidate.get("finishReason"),
+                        usage=event.get("usageMetadata")
+                    )
+
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error: {str(e)}")
+
+    @staticmethod
+    async def _iter_sse_data(response: aiohttp.ClientResponse) -> AsyncIterator[str]:
+        """Yield the data of each server-sent event."""
+        data_lines: List[str] = []
+        async for raw_line in response.content:
+            line = raw_line.decode("utf-8").rstrip("\r\n")
+
+            if not line:
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+                continue
+
+            if line.startswith("data:"):
+                data_lines.append(line[5:].lstrip(" "))
+
+        if data_lines:
+            yield "\n".join(data_lines)
+
     # ==================== Generate Content with Google Search ====================
 
     async def generate_content_with_search(
@@ -562,7 +708,9 @@ Based on the above context, please answer the following:
         self,
         file_data: bytes,
         file_name: str,
-        display_name: Optional[str] = None
+        display_name: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        use_cache: bool = True
     ) -> UploadedFile:
         """
         Upload a file for use with Gemini.
@@ -571,6 +719,8 @@ Based on the above context, please answer the following:
             file_data: File data as bytes
             file_name: Name of the file
             display_name: Optional display name
+            mime_type: MIME type (guessed from file_name if omitted)
+            use_cache: Reuse an earlier upload of the same content
 
         Returns:
             UploadedFile object with file details
@@ -584,41 +734,265 @@ Based on the above context, please answer the following:
         if not file_name:
             raise ValueError("file_name is required")
 
-        # Determine MIME type
-        import mimetypes
-        mime_type, _ = mimetypes.guess_type(file_name)
-        if not mime_type:
-            mime_type = "application/octet-stream"
+        digest = hashlib.sha256(file_data).hexdigest()
+        if use_cache:
+            cached = self._cached_file(digest)
+            if cached:
+                return cached
+
+        async def chunks(offset: int) -> AsyncIterator[bytes]:
+            for start in range(offset, len(file_data), self.UPLOAD_CHUNK_SIZE):
+                yield file_data[start:start + self.UPLOAD_CHUNK_SIZE]
+
+        uploaded = await self._resumable_upload(
+            chunks,
+            len(file_data),
+            mime_type or self._guess_mime_type(file_name),
+            display_name or file_name
+        )
+        return self._cache_file(digest, uploaded)
+
+    async def upload_file_from_path(
+        self,
+        file_path: str,
+        display_name: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        use_cache: bool = True
+    ) -> UploadedFile:
+        """
+        Upload a local file with the resumable Files API protocol.
 
-        url = f"{ self.BASE_URL}/files?key={self.api_key}"
+        The file is streamed from disk in chunks and never held in memory.
+        An interrupted chunk is resumed from the offset the server reports.
+        Uploads are cached by SHA-256 of the content until they expire.
 
-        headers = {"Content-Type": mime_type}
+        Args:
+            file_path: Local path to the file
+            display_name: Optional display name (defaults to the file name)
+            mime_type: MIME type (guessed from the path if omitted)
+            chunk_size: Bytes per upload request (multiple of 256 KiB)
+            use_cache: Reuse an earlier upload of the same content
 
+        Returns:
+            UploadedFile object with file details
+        """
+        loop = asyncio.get_running_loop()
+        digest = await loop.run_in_executor(None, self._hash_file, file_path)
+        if use_cache:
+            cached = self._cached_file(digest)
+            if cached:
+                return cached
+
+        chunk_size = chunk_size or self.UPLOAD_CHUNK_SIZE
+
+        async def chunks(offset: int) -> AsyncIterator[bytes]:
+            with open(file_path, "rb") as f:
+                f.seek(offset)
+                while True:
+                    chunk = await loop.run_in_executor(None, f.read, chunk_size)
+                    if not chunk:
+                        return
+                    yield chunk
+
+        uploaded = await self._resumable_upload(
+            chunks,
+            os.path.getsize(file_path),
+            mime_type or self._guess_mime_type(file_path),
+            display_name or os.path.basename(file_path)
+        )
+        return self._cache_file(digest, uploaded)
+
+    async def _resumable_upload(
+        self,
+        chunks,
+        size: int,
+        mime_type: str,
+        display_name: str,
+        max_retries: int = 3
+    ) -> UploadedFile:
+        """
+        Run the resumable upload protocol: start a session, send chunks, finalize.
+
+        Args:
+            chunks: Callable returning an async iterator of chunks from an offset
+            size: Total size in bytes
+            mime_type: MIME type of the content
+            display_name: Display name of the file
+            max_retries: Resume attempts after a failed chunk
+        """
         try:
             async with self.session.post(
-                url,
-                data=file_data,
-                headers=headers,
-                params={"displayName": display_name or file_name}
+                self.UPLOAD_URL,
+                params={"key": self.api_key},
+                headers={
+                    "X-Goog-Upload-Protocol": "resumable",
+                    "X-Goog-Upload-Command": "start",
+                    "X-Goog-Upload-Header-Content-Length": str(size),
+                    "X-Goog-Upload-Header-Content-Type": mime_type
+                },
+                json={"file": {"display_name": display_name}}
             ) as response:
-                response_data = await response.json()
-
                 if response.status >= 400:
-                    error = response_data.get("error", {})
-                    error_message = error.get("message", f"HTTP {response.status} error")
-                    raise Exception(f"File upload error: {error_message}")
-
-                return UploadedFile(
-                    file_id=response_data.get("name", ""),
-                    name=response_data.get("displayName", display_name or file_name),
-                    mime_type=response_data.get("mimeType", mime_type),
-                    size=response_data.get("sizeBytes", len(file_data)),
-                    uri=response_data.get("uri", "")
-                )
+                    raise Exception(f"File upload error: HTTP {response.status} error")
+                upload_url = response.headers.get("X-Goog-Upload-URL")
+            if not upload_url:
+                raise Exception("File upload error: no upload URL returned")
+
+            offset = 0
+            attempts = 0
+            while True:
+                try:
+                    response_data = await self._send_chunks(upload_url, chunks, offset, size)
+                    break
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    attempts += 1
+                    if attempts > max_retries:
+                        raise
+                    await asyncio.sleep(2 ** attempts)
+                    offset = await self._query_upload_offset(upload_url)
 
         except aiohttp.ClientError as e:
             raise Exception(f"Network error during upload: {str(e)}")
 
+        file_info = response_data.get("file", response_data)
+        uploaded = self._to_uploaded_file(file_info, display_name, mime_type, size)
+        if uploaded.state == "PROCESSING":
+            uploaded = await self.wait_for_file_active(uploaded.file_id)
+        return uploaded
+
+    async def _send_chunks(self, upload_url: str, chunks, offset: int, size: int) -> Dict[str, Any]:
+        """Send chunks from offset; the chunk ending at size finalizes the upload."""
+        if offset >= size:
+            # Every byte arrived before the failure: only the finalize is missing
+            return await self._upload_command(upload_url, b"", offset, "finalize")
+
+        async for chunk in chunks(offset):
+            end = offset + len(chunk)
+            command = "upload, finalize" if end >= size else "upload"
+            response_data = await self._upload_command(upload_url, chunk, offset, command)
+            offset = end
+            if end >= size:
+                return response_data
+        raise Exception("File upload error: source ended before the declared size")
+
+    async def _upload_command(self, upload_url: str, data: bytes, offset: int, command: str) -> Dict[str, Any]:
+        async with self.session.post(
+            upload_url,
+            data=data,
+            headers={
+                "X-Goog-Upload-Command": command,
+                "X-Goog-Upload-Offset": str(offset),
+                "Content-Length": str(len(data))
+            }
+        ) as response:
+            if response.status >= 500:
+                raise aiohttp.ClientResponseError(
+                    response.request_info, response.history,
+                    status=response.status, message="upload chunk failed"
+                )
+            if response.status >= 400:
+                raise Exception(f"File upload error: HTTP {response.status} error")
+            if "finalize" in command:
+                return await response.json()
+            return {}
+
+    async def _query_upload_offset(self, upload_url: str) -> int:
+        """Ask the server how many bytes of an interrupted upload it has."""
+        async with self.session.post(
+            upload_url,
+            headers={"X-Goog-Upload-Command": "query"}
+        ) as response:
+            return int(response.headers.get("X-Goog-Upload-Size-Received", "0"))
+
+    async def get_file(self, file_id: str) -> UploadedFile:
+        """
+        Get metadata of an uploaded file.
+
+        Args:
+            file_id: File name (e.g. "files/abc123")
+        """
+        name = file_id if file_id.startswith("files/") else f"files/{file_id}"
+        response_data = await self._make_request("GET", f"{self.BASE_URL}/{name}")
+        return self._to_uploaded_file(response_data)
+
+    async def wait_for_file_active(
+        self,
+        file_id: str,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 10.0,
+        timeout: float = 600.0
+    ) -> UploadedFile:
+        """Poll a file until processing finishes, backing off between polls."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        interval = poll_interval
+        while True:
+            uploaded = await self.get_file(file_id)
+            if uploaded.state == "ACTIVE":
+                return uploaded
+            if uploaded.state == "FAILED":
+                raise Exception(f"File processing failed: {file_id}")
+            if loop.time() + interval > deadline:
+                raise Exception(f"File {file_id} not active after {timeout} seconds")
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+
+    def _to_uploaded_file(
+        self,
+        file_info: Dict[str, Any],
+        display_name: Optional[str] = None,
+        mime_type: Optional[str] = None,
+        size: int = 0
+    ) -> UploadedFile:
+        return UploadedFile(
+            file_id=file_info.get("name", ""),
+            name=file_info.get("displayName", display_name or ""),
+            mime_type=file_info.get("mimeType", mime_type or ""),
+            size=int(file_info.get("sizeBytes", size)),
+            uri=file_info.get("uri", ""),
+            state=file_info.get("state"),
+            expiration_time=file_info.get("expirationTime"),
+            sha256=file_info.get("sha256Hash")
+        )
+
+    def _cached_file(self, digest: str) -> Optional[UploadedFile]:
+        """Return a cached upload that stays valid for at least another hour."""
+        cached = self._file_cache.get(digest)
+        if not cached:
+            return None
+        if cached.expiration_time:
+            # e.g. "2024-05-01T12:00:00.123456789Z"; drop the fraction for fromisoformat
+            expires = datetime.fromisoformat(
+                cached.expiration_time.split(".")[0].rstrip("Z")
+            ).replace(tzinfo=timezone.utc)
+            if expires - datetime.now(timezone.utc) < timedelta(hours=1):
+                self._file_cache.pop(digest, None)
+                return None
+        return cached
+
+    def _cache_file(self, digest: str, uploaded: UploadedFile) -> UploadedFile:
+        self._file_cache[digest] = uploaded
+        if self.file_cache_path:
+            tmp_path = f"{self.file_cache_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({key: asdict(value) for key, value in self._file_cache.items()}, f)
+            os.replace(tmp_path, self.file_cache_path)
+        return uploaded
+
+    @staticmethod
+    def _hash_file(file_path: str, block_size: int = 1024 * 1024) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _guess_mime_type(file_name: str) -> str:
+        mime_type, _ = mimetypes.guess_type(file_name)
+        return mime_type or "application/octet-stream"
+
     # ==================== Utility Methods ====================
 
     async def count_tokens(
@@ -718,5 +1092,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -4,6 +4,7 @@ Gmail API - Email Management Client
 Supports:
 - Search Emails
 - Get Specific Message
+- Get Messages (concurrent or batched hydration)
 - Add Labels to Message
 - Remove Labels from Message
 - Move Message to Trash
@@ -11,9 +12,12 @@ Supports:
 """
 
 import aiohttp
+import asyncio
 import json
 import base64
+import uuid
 from typing import Optional, Dict, Any, List
+from urllib.parse import urlencode
 from datetime import datetime
 from dataclasses import dataclass
 
@@ -70,11 +74,15 @@ class GmailClient:
     """
 
     BASE_URL = "https://gmail.googleapis.com/gmail/v1/users/me"
+    BATCH_URL = "https://gmail.googleapis.com/batch/gmail/v1"
+    BATCH_PATH = "/gmail/v1/users/me"
+    MAX_BATCH_SIZE = 100
 
     def __init__(
         self,
         access_token: str,
-        webhook_secret: Optional[str] = None
+        webhook_secret: Optional[str] = None,
+        max_concurrency: int = 10
     ):
         """
         Initialize Gmail client.
@@ -82,9 +90,11 @@ class GmailClient:
         Args:
             access_token: OAuth access token
             webhook_secret: Optional secret for webhook signature verification
+            max_concurrency: Maximum concurrent requests when hydrating message lists
         """
         self.access_token = access_token
         self.webhook_secret = webhook_secret
+        self.max_concurrency = max_concurrency
         self.session = None
         self._rate_limit_delay = 0.1
 
@@ -166,15 +176,23 @@ class GmailClient:
         self,
         query: str,
         max_results: int = 10,
-        label_ids: Optional[List[str]] = None
+        label_ids: Optional[List[str]] = None,
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        use_batch: bool = False
     ) -> List[Message]:
         """
         Search for emails.
 
+        Matching messages are hydrated concurrently (see get_messages).
+
         Args:
             query: Search query (Gmail search syntax)
             max_results: Maximum number of results to return
             label_ids: Filter by label IDs
+            format: Message format (full, metadata, minimal)
+            metadata_headers: Headers to return with format="metadata"
+            use_batch: Hydrate through the batch endpoint instead of parallel requests
 
         Returns:
             List of Message objects
@@ -197,31 +215,35 @@ class GmailClient:
         )
 
         messages_list = response_data.get("messages", [])
-        messages = []
 
-        # Fetch full message details for each
-        for msg in messages_list:
-            try:
-                full_message = await self.get_message(msg["id"])
-                messages.append(full_message)
-            except Exception:
-                continue
-
-        return messages
+        return await self.get_messages(
+            [msg["id"] for msg in messages_list],
+            format=format,
+            metadata_headers=metadata_headers,
+            use_batch=use_batch
+        )
 
     async def list_messages(
         self,
         max_results: int = 10,
         label_ids: Optional[List[str]] = None,
-        include_spam_trash: bool = False
+        include_spam_trash: bool = False,
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        use_batch: bool = False
     ) -> List[Message]:
         """
         List messages in the mailbox.
 
+        Messages are hydrated concurrently (see get_messages).
+
         Args:
             max_results: Maximum number of results
             label_ids: Filter by label IDs
             include_spam_trash: Include messages in spam and trash
+            format: Message format (full, metadata, minimal)
+            metadata_headers: Headers to return with format="metadata"
+            use_batch: Hydrate through the batch endpoint instead of parallel requests
 
         Returns:
             List of Message objects
@@ -245,30 +267,32 @@ class GmailClient:
         )
 
         messages_list = response_data.get("messages", [])
-        messages = []
 
-        for msg in messages_list:
-            try:
-                full_message = await self.get_message(msg["id"])
-                messages.append(full_message)
-            except Exception:
-                continue
-
-        return messages
+        return await self.get_messages(
+            [msg["id"] for msg in messages_list],
+            format=format,
+            metadata_headers=metadata_headers,
+            use_batch=use_batch
+        )
 
     # ==================== Get Specific Message ====================
 
     async def get_message(
         self,
         message_id: str,
-        format: str = "full"
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None
     ) -> Message:
         """
         Get details of a specific message.
 
         Args:
             message_id: Message ID
-            format: Format of the message (minimal, raw, full)
+            format: Format of the message (minimal, metadata, raw, full)
+            metadata_headers: Headers to return with format="metadata",
+                e.g. ["Subject", "From", "To", "Date"]
+            fields: Partial response field mask, e.g. "id,threadId,labelIds,snippet"
 
         Returns:
             Message object with full details
@@ -280,14 +304,207 @@ class GmailClient:
         if not message_id:
             raise ValueError("message_id is required")
 
-        params = {"format": format}
-
         response_data = await self._make_request(
             "GET",
             f"/messages/{message_id}",
-            params=params
+            params=self._message_params(format, metadata_headers, fields)
         )
 
+        return self._parse_message(response_data)
+
+    async def get_messages(
+        self,
+        message_ids: List[str],
+        format: str = "full",
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+        use_batch: bool = False,
+        batch_size: int = 50
+    ) -> List[Message]:
+        """
+        Fetch many messages at once.
+
+        By default messages are fetched in parallel, at most max_concurrency at
+        a time. With use_batch=True they are fetched through Gmail's multipart
+        batch endpoint, batch_size sub-requests per call. Use format="metadata"
+        with metadata_headers to skip message bodies when scanning a mailbox.
+
+        Args:
+            message_ids: Message IDs to fetch
+            format: Format of the messages (minimal, metadata, full)
+            metadata_headers: Headers to return with format="metadata"
+            fields: Partial response field mask
+            max_concurrency: Parallel requests (defaults to the client setting)
+            use_batch: Use the batch endpoint instead of parallel requests
+            batch_size: Sub-requests per batch call (at most 100)
+
+        Returns:
+            List of Message objects in the order of message_ids; messages that
+            could not be fetched are skipped
+        """
+        if not message_ids:
+            return []
+
+        if use_batch:
+            results = await self._batch_get_messages(
+                message_ids, format, metadata_headers, fields, batch_size
+            )
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+
+            async def fetch(message_id: str) -> Optional[Message]:
+                async with semaphore:
+                    try:
+                        return await self.get_message(
+                            message_id, format, metadata_headers, fields
+                        )
+                    except Exception:
+                        return None
+
+            results = await asyncio.gather(*(fetch(message_id) for message_id in message_ids))
+
+        return [message for message in results if message is not None]
+
+    async def _batch_get_messages(
+        self,
+        message_ids: List[str],
+        format: str,
+        metadata_headers: Optional[List[str]],
+        fields: Optional[str],
+        batch_size: int
+    ) -> List[Optional[Message]]:
+        """Fetch messages through the batch endpoint; failed items are retried singly."""
+        batch_size = max(1, min(batch_size, self.MAX_BATCH_SIZE))
+        query = urlencode(self._message_params(format, metadata_headers, fields), doseq=True)
+        results: List[Optional[Message]] = [None] * len(message_ids)
+        retry: List[int] = []
+
+        for start in range(0, len(message_ids), batch_size):
+            indexes = list(range(start, min(start + batch_size, len(message_ids))))
+            requests = [
+                f"GET {self.BATCH_PATH}/messages/{message_ids[i]}?{query}" for i in indexes
+            ]
+            try:
+                responses = await self._batch_request(requests)
+            except Exception:
+                retry.extend(indexes)
+                continue
+
+            for i, (status, data) in zip(indexes, responses):
+                if status == 200 and data:
+                    results[i] = self._parse_message(data)
+                elif status != 404:
+                    # Rate limited or transient failure of a single sub-request
+                    retry.append(i)
+
+        if retry:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def refetch(i: int) -> None:
+                async with semaphore:
+                    try:
+                        results[i] = await self.get_message(
+                            message_ids[i], format, metadata_headers, fields
+                        )
+                    except Exception:
+                        pass
+
+            await asyncio.gather(*(refetch(i) for i in retry))
+
+        return results
+
+    async def _batch_request(self, requests: List[str]) -> List[tuple]:
+        """
+        Send sub-requests through the multipart batch endpoint.
+
+        Args:
+            requests: Request lines, e.g. "GET /gmail/v1/users/me/messages/ID"
+
+        Returns:
+            (status, data) per sub-request, in request order
+        """
+        boundary = f"batch_{uuid.uuid4().hex}"
+        parts = [
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            f"Content-ID: <item-{index}>\r\n\r\n"
+            f"{request}\r\n\r\n"
+            for index, request in enumerate(requests)
+        ]
+        body = "".join(parts) + f"--{boundary}--\r\n"
+
+        try:
+            async with self.session.post(
+                self.BATCH_URL,
+                data=body.encode("utf-8"),
+                headers={"Content-Type": f"multipart/mixed; boundary={boundary}"}
+            ) as response:
+                text = await response.text()
+                if response.status >= 400:
+                    raise Exception(f"Gmail API error: HTTP {response.status} error")
+                content_type = response.headers.get("Content-Type", "")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Network error: {str(e)}")
+
+        return self._parse_batch_response(text, content_type, len(requests))
+
+    @staticmethod
+    def _parse_batch_response(text: str, content_type: str, count: int) -> List[tuple]:
+        """Split a multipart/mixed batch response into (status, data) per sub-request."""
+        boundary = None
+        for param in content_type.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "boundary":
+                boundary = value.strip('"')
+        if not boundary:
+            raise Exception("Invalid batch response: missing boundary")
+
+        results: List[tuple] = [(0, None)] * count
+        for part in text.split(f"--{boundary}"):
+            part = part.strip()
+            if not part or part == "--":
+                continue
+
+            # Outer part headers, then the embedded HTTP response
+            outer_headers, _, http_response = part.replace("\r\n", "\n").partition("\n\n")
+            index = None
+            for line in outer_headers.split("\n"):
+                name, _, value = line.partition(":")
+                if name.strip().lower() == "content-id":
+                    content_id = value.strip().strip("<>")
+                    suffix = content_id.rsplit("item-", 1)[-1]
+                    if suffix.isdigit():
+                        index = int(suffix)
+            if index is None or index >= count:
+                continue
+
+            status_block, _, payload = http_response.partition("\n\n")
+            status_fields = status_block.split("\n", 1)[0].split()
+            status = int(status_fields[1]) if len(status_fields) > 1 and status_fields[1].isdigit() else 0
+            try:
+                data = json.loads(payload) if payload.strip() else None
+            except json.JSONDecodeError:
+                data = None
+            results[index] = (status, data)
+
+        return results
+
+    @staticmethod
+    def _message_params(
+        format: str,
+        metadata_headers: Optional[List[str]] = None,
+        fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"format": format}
+        if metadata_headers and format == "metadata":
+            params["metadataHeaders"] = list(metadata_headers)
+        if fields:
+            params["fields"] = fields
+        return params
+
+    def _parse_message(self, response_data: Dict[str, Any]) -> Message:
+        """Build a Message from a users.messages resource."""
         # Parse message headers
         headers = {}
         payload = response_data.get("payload", {})
@@ -368,17 +585,11 @@ class GmailClient:
             params={"format": "full"}
         )
 
-        messages_list = response_data.get("messages", [])
-        messages = []
-
-        for msg in messages_list:
-            try:
-                full_message = await self.get_message(msg["id"])
-                messages.append(full_message)
-            except Exception:
-                continue
-
-        return messages
+        # The thread resource already embeds full messages
+        return [
+            self._parse_message(msg)
+            for msg in response_data.get("messages", [])
+        ]
 
     # ==================== Add Labels to Message ====================
 
@@ -756,5 +967,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
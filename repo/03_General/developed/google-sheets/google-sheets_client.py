@@ -9,8 +9,12 @@ Version: 1.0.0
 """
 
 import os
+import sys
+import copy
+import time
 import base64
 import logging
+from pathlib import Path
 from typing import Optional, Dict, List, Any, Union
 from decimal import Decimal
 from datetime import datetime
@@ -25,42 +29,14 @@ try:
 except ImportError:
     GOOGLE_API_AVAILABLE = False
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.rate_limit import credential_key, get_rate_limiter  # noqa: E402
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
-    """Simple rate limiter for Google Sheets API calls."""
-    
-    def __init__(self, max_calls: int = 100, period: int = 100):
-        """
-        Initialize rate limiter.
-        
-        Args:
-            max_calls: Maximum calls allowed in the period
-            period: Time period in seconds
-        """
-        self.max_calls = max_calls
-        self.period = period
-        self.calls = []
-    
-    def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
-        import time
-        now = time.time()
-        # Remove old calls outside the period
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.period]
-        
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0]) + 1
-            logger.warning(f"Rate limit approaching, sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-            self.calls = []
-        
-        self.calls.append(now)
-
-
 class GoogleSheetsClient:
     """
     Google Sheets API v4 Client
@@ -75,12 +51,15 @@ class GoogleSheetsClient:
     
     # OAuth 2.0 scopes
     SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+    RATE_LIMIT_CALLS = 100
+    RATE_LIMIT_PERIOD = 100  # seconds
     
     def __init__(
         self,
         credentials: Optional[Dict[str, str]] = None,
         token_file: Optional[str] = None,
-        credentials_file: Optional[str] = None
+        credentials_file: Optional[str] = None,
+        metadata_ttl: float = 300.0
     ):
         """
         Initialize Google Sheets client.
@@ -89,6 +68,7 @@ class GoogleSheetsClient:
             credentials: OAuth credentials dict with access_token, refresh_token, etc.
             token_file: Path to token file for persistent authentication
             credentials_file: Path to OAuth 2.0 client secrets JSON file
+            metadata_ttl: Seconds to cache spreadsheet metadata (0 disables caching)
         
         Raises:
             ImportError: If google-api-python-client is not installed
@@ -100,7 +80,8 @@ class GoogleSheetsClient:
                 "Install it with: pip install google-api-python-client google-auth-oauthlib"
             )
         
-        self.rate_limiter = RateLimiter(max_calls=100, period=100)
+        self.metadata_ttl = metadata_ttl
+        self._metadata_cache: Dict[str, Any] = {}
         self._service = None
         self._credentials = None
         
@@ -115,6 +96,18 @@ class GoogleSheetsClient:
         if not self._credentials:
             raise ValueError("Authentication failed. Provide credentials, token_file, or credentials_file.")
         
+        # Quota is per Cloud project, so every client using the same OAuth
+        # client (or, failing that, the same token) shares one bucket
+        quota_key = credential_key(*(
+            getattr(self._credentials, attr, None)
+            for attr in ('client_id', 'service_account_email', 'refresh_token', 'token')
+        ))
+        self.rate_limiter = get_rate_limiter(
+            f"google-sheets:{quota_key}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD
+        )
+        
         # Build service
         self._service = build('sheets', 'v4', credentials=self._credentials)
         logger.info("Google Sheets client initialized successfully")
@@ -189,6 +182,21 @@ class GoogleSheetsClient:
             logger.error(f"API error in {operation}: {error}")
         raise
     
+    def _execute(self, request):
+        """Execute an API request, counting it once against the rate limiter."""
+        self.rate_limiter.wait_if_needed()
+        start = time.monotonic()
+        try:
+            response = request.execute()
+        except HttpError as error:
+            status = error.resp.status
+            if status == 403 and b'ateLimitExceeded' in (error.content or b''):
+                status = 429
+            self.rate_limiter.record_response(status, error.resp, time.monotonic() - start)
+            raise
+        self.rate_limiter.record_response(200, elapsed=time.monotonic() - start)
+        return response
+    
     # ============================================
     # API Actions (21 total)
     # ============================================
@@ -213,8 +221,6 @@ class GoogleSheetsClient:
         Raises:
             HttpError: If API call fails
         """
-        self.rate_limiter.wait_if_needed()
-        
         spreadsheet_body = {
             'properties': {
                 'title': title
@@ -237,7 +243,7 @@ class GoogleSheetsClient:
         
         try:
             request = self._service.spreadsheets().create(body=spreadsheet_body)
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Created spreadsheet: {response['spreadsheetId']} - {title}")
             return {
@@ -259,16 +265,20 @@ class GoogleSheetsClient:
     def get_spreadsheet_info(
         self,
         spreadsheet_id: str,
-        include_grid_data: bool = False
+        include_grid_data: bool = False,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         13. スプレッドシートの情報を取得する (Get Spreadsheet Information)
         
-        Retrieves metadata about a spreadsheet.
+        Retrieves metadata about a spreadsheet. Metadata (without grid data)
+        is cached per spreadsheet for metadata_ttl seconds and invalidated
+        by structural changes made through this client.
         
         Args:
             spreadsheet_id: The spreadsheet ID (from URL or returned from create)
             include_grid_data: Whether to include grid data
+            use_cache: Return cached metadata when still fresh
         
         Returns:
             Dictionary containing spreadsheet metadata and sheet information
@@ -276,16 +286,19 @@ class GoogleSheetsClient:
         Raises:
             HttpError: If spreadsheet not found or access denied
         """
-        self.rate_limiter.wait_if_needed()
+        if use_cache and not include_grid_data:
+            cached = self._metadata_cache.get(spreadsheet_id)
+            if cached and time.monotonic() - cached[0] < self.metadata_ttl:
+                return copy.deepcopy(cached[1])
         
         try:
             request = self._service.spreadsheets().get(
                 spreadsheetId=spreadsheet_id,
                 includeGridData=include_grid_data
             )
-            response = request.execute()
+            response = self._execute(request)
             
-            return {
+            info = {
                 'spreadsheetId': response['spreadsheetId'],
                 'title': response['properties']['title'],
                 'url': f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}",
@@ -297,11 +310,18 @@ class GoogleSheetsClient:
                         'title': sheet['properties']['title'],
                         'index': sheet['properties']['index'],
                         'sheetType': sheet['properties'].get('sheetType', 'GRID'),
-                        'hidden': sheet['properties'].get('hidden', False)
+                        'hidden': sheet['properties'].get('hidden', False),
+                        'rowCount': sheet['properties'].get('gridProperties', {}).get('rowCount'),
+                        'columnCount': sheet['properties'].get('gridProperties', {}).get('columnCount')
                     }
                     for sheet in response.get('sheets', [])
                 ]
             }
+            
+            if not include_grid_data and self.metadata_ttl > 0:
+                self._metadata_cache[spreadsheet_id] = (time.monotonic(), copy.deepcopy(info))
+            
+            return info
         except HttpError as error:
             self._handle_api_error(error, 'get_spreadsheet_info')
             raise
@@ -327,8 +347,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with sheet details
         """
-        self.rate_limiter.wait_if_needed()
-        
         request_body = {
             'requests': [
                 {
@@ -350,9 +368,10 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             added_sheet = response['replies'][0]['addSheet']['properties']
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Added sheet '{title}' to {spreadsheet_id}")
             
             return {
@@ -383,8 +402,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -407,8 +424,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Deleted sheet {sheet_id} from {spreadsheet_id}")
             return {'success': True, 'sheetId': sheet_id}
         except HttpError as error:
@@ -436,8 +454,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with new sheet details
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -451,7 +467,7 @@ class GoogleSheetsClient:
                 sheetId=sheet_id,
                 body={}
             )
-            response = request.execute()
+            response = self._execute(request)
             
             copied_sheet_id = response['sheetId']
             
@@ -470,11 +486,12 @@ class GoogleSheetsClient:
                         }
                     ]
                 }
-                self._service.spreadsheets().batchUpdate(
+                self._execute(self._service.spreadsheets().batchUpdate(
                     spreadsheetId=spreadsheet_id,
                     body=request_body
-                ).execute()
+                ))
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Copied sheet {sheet_id} to {copied_sheet_id} in {spreadsheet_id}")
             
             return {
@@ -507,8 +524,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -535,8 +550,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Renamed sheet {sheet_id} to '{new_title}' in {spreadsheet_id}")
             return {'success': True, 'sheetId': sheet_id, 'newTitle': new_title}
         except HttpError as error:
@@ -558,8 +574,6 @@ class GoogleSheetsClient:
         Returns:
             List of dictionaries with sheet names and IDs
         """
-        self.rate_limiter.wait_if_needed()
-        
         info = self.get_spreadsheet_info(spreadsheet_id)
         return info['sheets']
     
@@ -582,8 +596,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -610,8 +622,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Hidden sheet {sheet_id} in {spreadsheet_id}")
             return {'success': True, 'sheetId': sheet_id}
         except HttpError as error:
@@ -639,8 +652,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with values in the specified format
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.spreadsheets().values().get(
                 spreadsheetId=spreadsheet_id,
@@ -648,7 +659,7 @@ class GoogleSheetsClient:
                 majorDimension=major_dimension,
                 valueRenderOption=value_render_option
             )
-            response = request.execute()
+            response = self._execute(request)
             
             return {
                 'range': response.get('range'),
@@ -680,8 +691,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with update details
         """
-        self.rate_limiter.wait_if_needed()
-        
         body = {
             'values': [[value]]
         }
@@ -693,7 +702,7 @@ class GoogleSheetsClient:
                 valueInputOption=value_input_option,
                 body=body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.debug(f"Set value in {range_a1}: {value}")
             return {
@@ -726,8 +735,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with update details
         """
-        self.rate_limiter.wait_if_needed()
-        
         body = {
             'values': values
         }
@@ -739,7 +746,7 @@ class GoogleSheetsClient:
                 valueInputOption=value_input_option,
                 body=body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.debug(f"Set values in {range_a1}: {len(values)} rows")
             return {
@@ -775,14 +782,165 @@ class GoogleSheetsClient:
         Returns:
             Dictionary summarizing the updates
         """
-        updates = []
+        prefix = f"{self._quote_sheet_name(sheet_name)}!" if sheet_name else ''
+        data = {}
         for col, values in column_values.items():
-            range_a1 = f"{sheet_name}!{col}{start_row}:{col}{start_row + len(values) - 1}"
-            values_2d = [[v] for v in values]
-            update = self.set_values_in_range(spreadsheet_id, range_a1, values_2d)
-            updates.append({'column': col, 'update': update})
+            range_a1 = f"{prefix}{col}{start_row}:{col}{start_row + len(values) - 1}"
+            data[range_a1] = [[v] for v in values]
+        
+        response = self.batch_update_values(spreadsheet_id, data)
         
-        return {'updates': updates}
+        return {
+            'updates': [
+                {
+                    'column': col,
+                    'update': {
+                        'updatedRows': r.get('updatedRows'),
+                        'updatedColumns': r.get('updatedColumns'),
+                        'updatedCells': r.get('updatedCells')
+                    }
+                }
+                for col, r in zip(column_values, response['responses'])
+            ]
+        }
+    
+    def batch_update_values(
+        self,
+        spreadsheet_id: str,
+        data: Dict[str, List[List[Any]]],
+        value_input_option: str = 'USER_ENTERED'
+    ) -> Dict[str, Any]:
+        """
+        Writes values to several ranges with a single values.batchUpdate call.
+        
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            data: Dict mapping A1 ranges to 2D value arrays
+            value_input_option: 'RAW' or 'USER_ENTERED'
+        
+        Returns:
+            Dictionary with total updated cells and per-range responses
+        """
+        if not data:
+            return {'totalUpdatedCells': 0, 'responses': []}
+        
+        body = {
+            'valueInputOption': value_input_option,
+            'data': [{'range': r, 'values': v} for r, v in data.items()]
+        }
+        
+        try:
+            request = self._service.spreadsheets().values().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body=body
+            )
+            response = self._execute(request)
+            
+            logger.debug(f"Batch updated {len(data)} ranges in {spreadsheet_id}")
+            return {
+                'totalUpdatedCells': response.get('totalUpdatedCells', 0),
+                'responses': response.get('responses', [])
+            }
+        except HttpError as error:
+            self._handle_api_error(error, 'batch_update_values')
+            raise
+    
+    def batch_get_values(
+        self,
+        spreadsheet_id: str,
+        ranges: List[str],
+        major_dimension: str = 'ROWS',
+        value_render_option: str = 'FORMATTED_VALUE'
+    ) -> List[Dict[str, Any]]:
+        """
+        Reads several ranges with a single values.batchGet call.
+        
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            ranges: A1 ranges (a bare quoted sheet name reads its whole used grid)
+            major_dimension: 'ROWS' or 'COLUMNS'
+            value_render_option: 'FORMATTED_VALUE', 'UNFORMATTED_VALUE', or 'FORMULA'
+        
+        Returns:
+            List of dictionaries with range and values, in request order
+        """
+        if not ranges:
+            return []
+        
+        try:
+            request = self._service.spreadsheets().values().batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=ranges,
+                majorDimension=major_dimension,
+                valueRenderOption=value_render_option
+            )
+            response = self._execute(request)
+            
+            return [
+                {
+                    'range': value_range.get('range'),
+                    'majorDimension': value_range.get('majorDimension'),
+                    'values': value_range.get('values', [])
+                }
+                for value_range in response.get('valueRanges', [])
+            ]
+        except HttpError as error:
+            self._handle_api_error(error, 'batch_get_values')
+            raise
+    
+    def batch_update(
+        self,
+        spreadsheet_id: str,
+        requests: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Sends several structural requests in a single spreadsheets.batchUpdate call.
+        
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            requests: List of Sheets API request objects
+        
+        Returns:
+            Dictionary with replies in request order
+        """
+        if not requests:
+            return {'replies': []}
+        
+        try:
+            request = self._service.spreadsheets().batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'requests': requests}
+            )
+            response = self._execute(request)
+            
+            self.invalidate_metadata(spreadsheet_id)
+            logger.debug(f"Applied {len(requests)} batch requests to {spreadsheet_id}")
+            return {'replies': response.get('replies', [])}
+        except HttpError as error:
+            self._handle_api_error(error, 'batch_update')
+            raise
+    
+    def write_buffer(
+        self,
+        spreadsheet_id: str,
+        value_input_option: str = 'USER_ENTERED'
+    ) -> 'SheetsWriteBuffer':
+        """
+        Returns a write buffer that coalesces queued updates.
+        
+        Usage:
+            with client.write_buffer(spreadsheet_id) as buf:
+                buf.set_values('Sheet1!A1:A3', [[1], [2], [3]])
+                buf.add_request({'updateSheetProperties': {...}})
+        
+        Args:
+            spreadsheet_id: The spreadsheet ID
+            value_input_option: 'RAW' or 'USER_ENTERED'
+        
+        Returns:
+            SheetsWriteBuffer bound to this client
+        """
+        return SheetsWriteBuffer(self, spreadsheet_id, value_input_option)
     
     def append_row(
         self,
@@ -805,8 +963,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with append details
         """
-        self.rate_limiter.wait_if_needed()
-        
         body = {
             'values': [values]
         }
@@ -819,7 +975,7 @@ class GoogleSheetsClient:
                 insertDataOption=insert_data_option,
                 body=body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.debug(f"Appended row to {range_a1}")
             return {
@@ -855,60 +1011,80 @@ class GoogleSheetsClient:
             match_entire_cell: Match entire cell content
         
         Returns:
-            Dictionary with replacement count and details
+            Dictionary with replacement count and details; failed_ranges lists
+            ranges skipped because the API rejected them (HTTP 400)
         """
         import re
         
-        if all_sheets:
-            sheet_names = self.get_sheet_names(spreadsheet_id)
-            ranges = [f"{s['title']}!A1:Z1000" for s in sheet_names]
+        if all_sheets or not range_a1:
+            sheets = [
+                s for s in self.get_sheet_names(spreadsheet_id)
+                if s.get('sheetType', 'GRID') == 'GRID'
+            ]
+            if not all_sheets:
+                sheets = sheets[:1]
+            ranges = [self._quote_sheet_name(s['title']) for s in sheets]
         else:
-            ranges = [range_a1] if range_a1 else ['A1:Z1000']
+            ranges = [range_a1]
+        
+        pattern = re.escape(str(find_value))
+        if match_entire_cell:
+            pattern = f'^{pattern}$'
+        flags = 0 if match_case else re.IGNORECASE
         
         total_replacements = 0
+        updates = {}
+        
+        failed_ranges = []
+        try:
+            value_ranges = self.batch_get_values(spreadsheet_id, ranges)
+        except HttpError as e:
+            if e.resp.status != 400:
+                raise
+            # One invalid range fails the whole batchGet; retry the ranges
+            # one by one so only the invalid ones are skipped
+            value_ranges = []
+            if len(ranges) == 1:
+                failed_ranges = list(ranges)
+            else:
+                for r in ranges:
+                    try:
+                        value_ranges.extend(self.batch_get_values(spreadsheet_id, [r]))
+                    except HttpError as range_error:
+                        if range_error.resp.status != 400:
+                            raise
+                        failed_ranges.append(r)
+            if failed_ranges:
+                logger.warning(f"Skipped invalid ranges: {failed_ranges}")
+        
+        for value_range in value_ranges:
+            rows = value_range.get('values', [])
+            
+            new_values = []
+            replacements = 0
+            
+            for row in rows:
+                new_row = []
+                for cell in row:
+                    if isinstance(cell, str) and re.search(pattern, cell, flags):
+                        new_row.append(cell.replace(str(find_value), str(replace_value)))
+                        replacements += 1
+                    else:
+                        new_row.append(cell)
+                new_values.append(new_row)
+            
+            if replacements > 0:
+                updates[value_range['range']] = new_values
+                total_replacements += replacements
         
-        for r in ranges:
-            try:
-                values = self.get_values(spreadsheet_id, r)
-                rows = values.get('values', [])
-                
-                new_values = []
-                replacements = 0
-                
-                for row in rows:
-                    new_row = []
-                    for cell in row:
-                        if isinstance(cell, str):
-                            pattern = re.escape(str(find_value))
-                            flags = 0 if match_case else re.IGNORECASE
-                            if not match_entire_cell:
-                                pattern = pattern
-                            else:
-                                pattern = f'^{pattern}$'
-                            
-                            if re.search(pattern, cell, flags):
-                                new_cell = str(cell).replace(str(find_value), str(replace_value))
-                                replacements += 1
-                                new_row.append(new_cell)
-                            else:
-                                new_row.append(cell)
-                        else:
-                            new_row.append(cell)
-                    new_values.append(new_row)
-                
-                if replacements > 0:
-                    self.set_values_in_range(spreadsheet_id, r, new_values)
-                    total_replacements += replacements
-                    
-            except HttpError as e:
-                if e.resp.status != 400:  # Skip invalid ranges
-                    raise
+        self.batch_update_values(spreadsheet_id, updates)
         
         logger.info(f"Replaced {total_replacements} occurrences")
         return {
             'replacements': total_replacements,
             'find': find_value,
-            'replace': replace_value
+            'replace': replace_value,
+            'failed_ranges': failed_ranges
         }
     
     def delete_values(
@@ -928,14 +1104,12 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with clear details
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.spreadsheets().values().clear(
                 spreadsheetId=spreadsheet_id,
                 range=range_a1
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.debug(f"Cleared values in {range_a1}")
             return {
@@ -968,8 +1142,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -997,8 +1169,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Added {number_of_rows} row(s) to sheet {sheet_id} in {spreadsheet_id}")
             return {'success': True, 'rowsAdded': number_of_rows}
         except HttpError as error:
@@ -1028,8 +1201,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1057,8 +1228,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Deleted {number_of_rows} row(s) starting at {start_index} in {spreadsheet_id}")
             return {'success': True, 'rowsDeleted': number_of_rows}
         except HttpError as error:
@@ -1088,8 +1260,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1117,8 +1287,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Added {number_of_columns} column(s) to sheet {sheet_id} in {spreadsheet_id}")
             return {'success': True, 'columnsAdded': number_of_columns}
         except HttpError as error:
@@ -1148,8 +1319,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1177,8 +1346,9 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
+            self.invalidate_metadata(spreadsheet_id)
             logger.info(f"Deleted {number_of_columns} column(s) starting at {start_index} in {spreadsheet_id}")
             return {'success': True, 'columnsDeleted': number_of_columns}
         except HttpError as error:
@@ -1210,8 +1380,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1244,7 +1412,7 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Sorted {range_a1} by column {sort_column}")
             return {'success': True, 'sortedBy': sort_column, 'ascending': ascending}
@@ -1275,8 +1443,6 @@ class GoogleSheetsClient:
         Returns:
             Confirmation dictionary
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1315,7 +1481,7 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Added note to {cell} in {spreadsheet_id}")
             return {'success': True, 'cell': cell, 'note': note}
@@ -1348,8 +1514,6 @@ class GoogleSheetsClient:
         Returns:
             Dictionary with image reference
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get sheet_id from name if not provided
         if sheet_id is None and sheet_name:
             sheet_id = self._get_sheet_id_by_name(spreadsheet_id, sheet_name)
@@ -1385,7 +1549,7 @@ class GoogleSheetsClient:
                 spreadsheetId=spreadsheet_id,
                 body=request_body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Embedded image in {spreadsheet_id}")
             return {
@@ -1429,14 +1593,30 @@ class GoogleSheetsClient:
     # Helper Methods
     # ============================================
     
+    def invalidate_metadata(self, spreadsheet_id: Optional[str] = None) -> None:
+        """Drop cached metadata for one spreadsheet, or for all when omitted."""
+        if spreadsheet_id is None:
+            self._metadata_cache.clear()
+        else:
+            self._metadata_cache.pop(spreadsheet_id, None)
+    
     def _get_sheet_id_by_name(self, spreadsheet_id: str, sheet_name: str) -> int:
-        """Get sheet ID by name."""
+        """Get sheet ID by name (served from the metadata cache when fresh)."""
         info = self.get_spreadsheet_info(spreadsheet_id)
+        for sheet in info.get('sheets', []):
+            if sheet['title'] == sheet_name:
+                return sheet['sheetId']
+        # The sheet may have been added outside this client; refresh once
+        info = self.get_spreadsheet_info(spreadsheet_id, use_cache=False)
         for sheet in info.get('sheets', []):
             if sheet['title'] == sheet_name:
                 return sheet['sheetId']
         raise ValueError(f"Sheet '{sheet_name}' not found")
     
+    def _quote_sheet_name(self, sheet_name: str) -> str:
+        """Quote a sheet name for use in A1 notation."""
+        return "'" + sheet_name.replace("'", "''") + "'"
+    
     def _parse_row_from_range(self, range_a1: str) -> int:
         """Extract start row from A1 notation."""
         import re
@@ -1498,6 +1678,65 @@ class GoogleSheetsClient:
         return letter
 
 
+class SheetsWriteBuffer:
+    """
+    Coalesces queued writes to one spreadsheet.
+    
+    Value updates are merged (last write per range wins) and sent as one
+    values.batchUpdate; structural requests are sent as one
+    spreadsheets.batchUpdate. Flushed on exit of the with-block unless an
+    exception was raised.
+    """
+    
+    def __init__(
+        self,
+        client: GoogleSheetsClient,
+        spreadsheet_id: str,
+        value_input_option: str = 'USER_ENTERED'
+    ):
+        self.client = client
+        self.spreadsheet_id = spreadsheet_id
+        self.value_input_option = value_input_option
+        self._values: Dict[str, List[List[Any]]] = {}
+        self._requests: List[Dict[str, Any]] = []
+    
+    def __enter__(self) -> 'SheetsWriteBuffer':
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.flush()
+    
+    def set_values(self, range_a1: str, values: List[List[Any]]) -> None:
+        """Queue a value update for a range."""
+        self._values[range_a1] = values
+    
+    def set_value(self, range_a1: str, value: Any) -> None:
+        """Queue a single-cell value update."""
+        self._values[range_a1] = [[value]]
+    
+    def add_request(self, request: Dict[str, Any]) -> None:
+        """Queue a structural request (e.g., {'insertDimension': {...}})."""
+        self._requests.append(request)
+    
+    def flush(self) -> Dict[str, Any]:
+        """Send queued structural requests, then queued value updates."""
+        result = {'replies': [], 'totalUpdatedCells': 0}
+        
+        if self._requests:
+            requests, self._requests = self._requests, []
+            result['replies'] = self.client.batch_update(self.spreadsheet_id, requests)['replies']
+        
+        if self._values:
+            values, self._values = self._values, {}
+            response = self.client.batch_update_values(
+                self.spreadsheet_id, values, self.value_input_option
+            )
+            result['totalUpdatedCells'] = response['totalUpdatedCells']
+        
+        return result
+
+
 # Webhook Handlers (for Triggers)
 class GoogleSheetsWebhooks:
     """
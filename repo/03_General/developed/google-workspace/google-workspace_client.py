@@ -9,7 +9,10 @@ Version: 1.0.0
 """
 
 import os
+import sys
 import logging
+import time
+from pathlib import Path
 from typing import Optional, Dict, List, Any, Union
 from datetime import datetime
 
@@ -23,42 +26,14 @@ try:
 except ImportError:
     GOOGLE_API_AVAILABLE = False
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.rate_limit import credential_key, get_rate_limiter  # noqa: E402
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
-    """Simple rate limiter for Google Workspace API calls."""
-    
-    def __init__(self, max_calls: int = 100, period: int = 100):
-        """
-        Initialize rate limiter.
-        
-        Args:
-            max_calls: Maximum calls allowed in the period
-            period: Time period in seconds
-        """
-        self.max_calls = max_calls
-        self.period = period
-        self.calls = []
-    
-    def wait_if_needed(self):
-        """Wait if rate limit would be exceeded."""
-        import time
-        now = time.time()
-        # Remove old calls outside the period
-        self.calls = [call_time for call_time in self.calls if now - call_time < self.period]
-        
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0]) + 1
-            logger.warning(f"Rate limit approaching, sleeping for {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-            self.calls = []
-        
-        self.calls.append(now)
-
-
 class GoogleWorkspaceClient:
     """
     Google Workspace Admin SDK Client
@@ -75,6 +50,8 @@ class GoogleWorkspaceClient:
         'https://www.googleapis.com/auth/admin.directory.group',
         'https://www.googleapis.com/auth/admin.directory.group.member'
     ]
+    RATE_LIMIT_CALLS = 100
+    RATE_LIMIT_PERIOD = 100  # seconds
     
     def __init__(
         self,
@@ -108,7 +85,6 @@ class GoogleWorkspaceClient:
             raise ValueError("Domain is required")
         
         self.domain = domain
-        self.rate_limiter = RateLimiter(max_calls=100, period=100)
         self._service_user = None
         self._service_group = None
         self._credentials = None
@@ -124,6 +100,18 @@ class GoogleWorkspaceClient:
         if not self._credentials:
             raise ValueError("Authentication failed. Provide credentials, token_file, or credentials_file.")
         
+        # Quota is per Cloud project, so every client using the same OAuth
+        # client (or, failing that, the same token) shares one bucket
+        quota_key = credential_key(*(
+            getattr(self._credentials, attr, None)
+            for attr in ('client_id', 'service_account_email', 'refresh_token', 'token')
+        ))
+        self.rate_limiter = get_rate_limiter(
+            f"google-workspace:{quota_key}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD
+        )
+        
         # Build services
         self._service_user = build('admin', 'directory_v1', credentials=self._credentials)
         self._service_group = build('admin', 'directory_v1', credentials=self._credentials)
@@ -207,6 +195,21 @@ class GoogleWorkspaceClient:
             logger.error(f"API error in {operation}: {error}")
         raise
     
+    def _execute(self, request):
+        """Execute an API request, counting it once against the rate limiter."""
+        self.rate_limiter.wait_if_needed()
+        start = time.monotonic()
+        try:
+            response = request.execute()
+        except HttpError as error:
+            status = error.resp.status
+            if status == 403 and b'ateLimitExceeded' in (error.content or b''):
+                status = 429
+            self.rate_limiter.record_response(status, error.resp, time.monotonic() - start)
+            raise
+        self.rate_limiter.record_response(200, elapsed=time.monotonic() - start)
+        return response
+    
     # ============================================
     # User Management (6 actions)
     # ============================================
@@ -239,8 +242,6 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If user already exists or validation fails
         """
-        self.rate_limiter.wait_if_needed()
-        
         user_body = {
             'primaryEmail': primary_email,
             'name': {
@@ -258,7 +259,7 @@ class GoogleWorkspaceClient:
                 body=user_body,
                 domain=self.domain
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Created user: {primary_email}")
             return {
@@ -290,11 +291,9 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If user not found or permission denied
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service_user.users().delete(userKey=user_key)
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Deleted user: {user_key}")
             return {'success': True, 'userKey': user_key}
@@ -320,8 +319,6 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If user not found
         """
-        self.rate_limiter.wait_if_needed()
-        
         user_body = {
             'suspended': True
         }
@@ -331,7 +328,7 @@ class GoogleWorkspaceClient:
                 userKey=user_key,
                 body=user_body
             )
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Suspended user: {user_key}")
             return {'success': True, 'userKey': user_key, 'suspended': True}
@@ -357,8 +354,6 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If user not found
         """
-        self.rate_limiter.wait_if_needed()
-        
         user_body = {
             'changePasswordAtNextLogin': True
         }
@@ -368,7 +363,7 @@ class GoogleWorkspaceClient:
                 userKey=user_key,
                 body=user_body
             )
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Required password change for user: {user_key}")
             return {'success': True, 'userKey': user_key, 'changePasswordAtNextLogin': True}
@@ -396,15 +391,13 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If query is invalid
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service_user.users().list(
                 domain=self.domain,
                 query=query,
                 maxResults=max_results
             )
-            response = request.execute()
+            response = self._execute(request)
             
             users = response.get('users', [])
             logger.info(f"Found {len(users)} users matching query: {query}")
@@ -447,8 +440,6 @@ class GoogleWorkspaceClient:
         Returns:
             Dictionary with users list and pagination info
         """
-        self.rate_limiter.wait_if_needed()
-        
         kwargs = {
             'domain': self.domain,
             'maxResults': max_results,
@@ -462,7 +453,7 @@ class GoogleWorkspaceClient:
         
         try:
             request = self._service_user.users().list(**kwargs)
-            response = request.execute()
+            response = self._execute(request)
             
             users = response.get('users', [])
             
@@ -505,12 +496,10 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If user not found or validation fails
         """
-        self.rate_limiter.wait_if_needed()
-        
         # Get current user info first
         try:
             request = self._service_user.users().get(userKey=user_key)
-            current = request.execute()
+            current = self._execute(request)
         except HttpError as error:
             if error.resp.status == 404:
                 logger.error(f"User not found: {user_key}")
@@ -538,7 +527,7 @@ class GoogleWorkspaceClient:
                 userKey=user_key,
                 body=update_body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Updated user: {user_key}")
             return {
@@ -578,8 +567,6 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If group already exists or validation fails
         """
-        self.rate_limiter.wait_if_needed()
-        
         group_body = {
             'email': email,
             'name': name
@@ -593,7 +580,7 @@ class GoogleWorkspaceClient:
                 body=group_body,
                 domain=self.domain
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Created group: {email}")
             return {
@@ -626,8 +613,6 @@ class GoogleWorkspaceClient:
         Returns:
             Dictionary with groups list and pagination info
         """
-        self.rate_limiter.wait_if_needed()
-        
         kwargs = {
             'domain': self.domain,
             'maxResults': max_results,
@@ -639,7 +624,7 @@ class GoogleWorkspaceClient:
         
         try:
             request = self._service_group.groups().list(**kwargs)
-            response = request.execute()
+            response = self._execute(request)
             
             groups = response.get('groups', [])
             
@@ -678,15 +663,13 @@ class GoogleWorkspaceClient:
         Returns:
             Dictionary with list of matching groups
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service_group.groups().list(
                 domain=self.domain,
                 query=query,
                 maxResults=max_results
             )
-            response = request.execute()
+            response = self._execute(request)
             
             groups = response.get('groups', [])
             logger.info(f"Found {len(groups)} groups matching query: {query}")
@@ -730,8 +713,6 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If group or user not found
         """
-        self.rate_limiter.wait_if_needed()
-        
         member_body = {
             'email': member_email,
             'role': role
@@ -742,7 +723,7 @@ class GoogleWorkspaceClient:
                 groupKey=group_key,
                 body=member_body
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Added member {member_email} to group {group_key}")
             return {
@@ -776,14 +757,12 @@ class GoogleWorkspaceClient:
         Raises:
             HttpError: If group or member not found
         """
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service_group.members().delete(
                 groupKey=group_key,
                 memberKey=member_key
             )
-            request.execute()
+            self._execute(request)
             
             logger.info(f"Removed member {member_key} from group {group_key}")
             return {'success': True, 'groupKey': group_key, 'memberKey': member_key}
@@ -812,8 +791,6 @@ class GoogleWorkspaceClient:
         Returns:
             Dictionary with members list and pagination info
         """
-        self.rate_limiter.wait_if_needed()
-        
         kwargs = {
             'groupKey': group_key,
             'maxResults': max_results
@@ -826,7 +803,7 @@ class GoogleWorkspaceClient:
         
         try:
             request = self._service_group.members().list(**kwargs)
-            response = request.execute()
+            response = self._execute(request)
             
             members = response.get('members', [])
             
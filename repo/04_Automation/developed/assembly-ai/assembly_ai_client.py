@@ -3,10 +3,11 @@ Assembly AI API Client
 
 AssemblyAI provides AI-powered speech-to-text and audio intelligence APIs.
 
-API Actions (3):
+API Actions (4):
 1. Transcribe Audio
 2. Upload Media File
 3. Get Transcription Result
+4. Transcribe Files (batch)
 
 Triggers (0):
 
@@ -18,9 +19,12 @@ Rate Limiting: Varies by plan
 
 import aiohttp
 import asyncio
+import json
+import os
+from aiohttp import web
 from datetime import datetime
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, AsyncIterator, Union
+from dataclasses import dataclass, field, fields
 import hashlib
 
 
@@ -39,6 +43,7 @@ class Transcript:
     utterances: List[Dict[str, Any]] = field(default_factory=list)
     speakers_expected: Optional[int] = None
     speakers: Optional[int] = None
+    error: Optional[str] = None
 
 
 @dataclass
@@ -68,6 +73,102 @@ class Utterance:
     confidence: float
 
 
+class TranscriptWebhookReceiver:
+    """
+    Local webhook server that receives transcript completion notifications.
+
+    AssemblyAI POSTs {"transcript_id", "status"} to the webhook URL when a
+    transcript is completed or failed, so waiting costs no status requests.
+    public_url must reach this server (e.g. through a tunnel or load balancer).
+    """
+
+    def __init__(
+        self,
+        public_url: str,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        path: str = "/assemblyai/webhook",
+        auth_header_name: Optional[str] = None,
+        auth_header_value: Optional[str] = None
+    ):
+        """
+        Initialize webhook receiver.
+
+        Args:
+            public_url: URL AssemblyAI calls, routed to host:port/path
+            host: Interface to listen on
+            port: Port to listen on
+            path: Request path to accept
+            auth_header_name: Header AssemblyAI sends for authentication
+            auth_header_value: Expected value of that header
+        """
+        self.webhook_url = public_url
+        self.host = host
+        self.port = port
+        self.path = path
+        self.auth_header_name = auth_header_name
+        self.auth_header_value = auth_header_value
+        self._statuses: Dict[str, asyncio.Future] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start listening for webhooks."""
+        app = web.Application()
+        app.router.add_post(self.path, self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _status_future(self, transcript_id: str) -> asyncio.Future:
+        future = self._statuses.get(transcript_id)
+        if future is None:
+            future = self._statuses[transcript_id] = asyncio.get_running_loop().create_future()
+        return future
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        if self.auth_header_name and request.headers.get(self.auth_header_name) != self.auth_header_value:
+            return web.Response(status=401)
+
+        try:
+            payload = await request.json()
+        except json.JSONDecodeError:
+            return web.Response(status=400)
+
+        transcript_id = payload.get("transcript_id")
+        if transcript_id:
+            future = self._status_future(transcript_id)
+            if not future.done():
+                future.set_result(payload.get("status", ""))
+        return web.Response(text="ok")
+
+    async def wait(self, transcript_id: str, timeout: Optional[float] = None) -> str:
+        """
+        Wait for the completion notification of a transcript.
+
+        Returns:
+            Final status ("completed" or "error")
+        """
+        future = self._status_future(transcript_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if future.done():
+                self._statuses.pop(transcript_id, None)
+
+
 class AssemblyAIClient:
     """
     AssemblyAI API client for audio transcription.
@@ -77,6 +178,7 @@ class AssemblyAIClient:
     """
 
     BASE_URL = "https://api.assemblyai.com/v2"
+    UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024
 
     def __init__(self, api_key: str):
         """
@@ -158,15 +260,20 @@ class AssemblyAIClient:
         self,
         file_url: Optional[str] = None,
         file_path: Optional[str] = None,
-        file_content: Optional[bytes] = None
+        file_content: Optional[bytes] = None,
+        chunk_size: Optional[int] = None
     ) -> UploadResponse:
         """
         Upload a media file for transcription.
 
+        Local files are streamed from disk in chunks, so memory use does not
+        depend on the recording length.
+
         Args:
             file_url: URL of the media file
             file_path: Local path to the media file
             file_content: Raw file content as bytes
+            chunk_size: Bytes read from disk per chunk
 
         Returns:
             UploadResponse with upload_url
@@ -179,11 +286,10 @@ class AssemblyAIClient:
             return UploadResponse(upload_url=file_url)
 
         elif file_path:
-            # Upload local file
-            with open(file_path, "rb") as f:
-                file_content = f.read()
-
-            return await self._upload_content(file_content)
+            # Stream local file
+            return await self._upload_content(
+                self._read_file_chunks(file_path, chunk_size or self.UPLOAD_CHUNK_SIZE)
+            )
 
         elif file_content:
             # Upload content directly
@@ -192,12 +298,23 @@ class AssemblyAIClient:
         else:
             raise ValueError("Either file_url, file_path, or file_content must be provided")
 
-    async def _upload_content(self, content: bytes) -> UploadResponse:
+    async def _read_file_chunks(self, file_path: str, chunk_size: int) -> AsyncIterator[bytes]:
+        """Read a file in chunks without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = await loop.run_in_executor(None, f.read, chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def _upload_content(self, content: Union[bytes, AsyncIterator[bytes]]) -> UploadResponse:
         """
         Upload content bytes.
 
         Args:
-            content: File content as bytes
+            content: File content as bytes, or an async iterator of chunks
+                (sent with chunked transfer encoding)
 
         Returns:
             UploadResponse
@@ -239,7 +356,11 @@ class AssemblyAIClient:
         summary_type: str = "bullets",
         poll: bool = True,
         poll_interval: float = 1.0,
-        timeout: int = 300
+        timeout: Optional[int] = 300,
+        webhook_url: Optional[str] = None,
+        webhook_auth_header_name: Optional[str] = None,
+        webhook_auth_header_value: Optional[str] = None,
+        max_poll_interval: float = 30.0
     ) -> Transcript:
         """
         Transcribe audio file.
@@ -256,8 +377,12 @@ class AssemblyAIClient:
             summary_model: Summary model ("conversational", "generic")
             summary_type: Summary type ("bullets", "paragraph", "headline")
             poll: Whether to poll for completion
-            poll_interval: Seconds between polls
-            timeout: Maximum seconds to wait
+            poll_interval: Seconds before the first poll (grows with backoff)
+            timeout: Maximum seconds to wait (None for no limit)
+            webhook_url: URL AssemblyAI notifies on completion
+            webhook_auth_header_name: Header sent with the webhook
+            webhook_auth_header_value: Value of that header
+            max_poll_interval: Upper bound of the poll interval
 
         Returns:
             Transcript object
@@ -289,14 +414,21 @@ class AssemblyAIClient:
             data["summary_model"] = summary_model
             data["summary_type"] = summary_type
 
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+            if webhook_auth_header_name:
+                data["webhook_auth_header_name"] = webhook_auth_header_name
+                data["webhook_auth_header_value"] = webhook_auth_header_value
+
         response = await self._make_request("POST", "/transcript", json_data=data)
-        transcript = Transcript(**response)
+        transcript = self._to_transcript(response)
 
         if poll:
             transcript = await self._poll_transcription(
                 transcript.id,
                 poll_interval=poll_interval,
-                timeout=timeout
+                timeout=timeout,
+                max_poll_interval=max_poll_interval
             )
 
         return transcript
@@ -318,21 +450,45 @@ class AssemblyAIClient:
             Exception: If retrieval fails
         """
         response = await self._make_request("GET", f"/transcript/{transcript_id}")
-        return Transcript(**response)
+        return self._to_transcript(response)
+
+    @staticmethod
+    def _to_transcript(response: Dict[str, Any]) -> Transcript:
+        """Build a Transcript, ignoring fields the model does not define."""
+        names = {f.name for f in fields(Transcript)}
+        values = {k: v for k, v in response.items() if k in names}
+        for required in ("id", "status", "text", "audio_url", "language_code", "created"):
+            values.setdefault(required, "")
+            if values[required] is None:
+                values[required] = ""
+        if values.get("confidence") is None:
+            values["confidence"] = 0.0
+        for name in ("words", "utterances"):
+            if values.get(name) is None:
+                values[name] = []
+        return Transcript(**values)
 
     async def _poll_transcription(
         self,
         transcript_id: str,
         poll_interval: float = 1.0,
-        timeout: int = 300
+        timeout: Optional[int] = 300,
+        max_poll_interval: float = 30.0,
+        backoff_factor: float = 1.5
     ) -> Transcript:
         """
-        Poll for transcription completion.
+        Poll for transcription completion with exponential backoff.
+
+        The interval starts at poll_interval and grows by backoff_factor up to
+        max_poll_interval, so long recordings cost a few dozen status requests
+        instead of one per second.
 
         Args:
             transcript_id: Transcript ID
-            poll_interval: Seconds between polls
-            timeout: Maximum seconds to wait
+            poll_interval: Seconds before the first poll
+            timeout: Maximum seconds to wait (None for no limit)
+            max_poll_interval: Upper bound of the interval
+            backoff_factor: Interval multiplier after each poll
 
         Returns:
             Completed Transcript object
@@ -340,7 +496,9 @@ class AssemblyAIClient:
         Raises:
             Exception: If timeout or error occurs
         """
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        interval = poll_interval
 
         while True:
             transcript = await self.get_transcription_result(transcript_id)
@@ -348,13 +506,128 @@ class AssemblyAIClient:
             if transcript.status == "completed":
                 return transcript
             elif transcript.status == "error":
-                raise Exception(f"Transcription failed: {transcript.status}")
+                raise Exception(f"Transcription failed: {transcript.error or transcript.status}")
 
-            elapsed = asyncio.get_event_loop().time() - start_time
-            if elapsed >= timeout:
+            elapsed = loop.time() - start_time
+            if timeout is not None and elapsed >= timeout:
                 raise Exception(f"Transcription timeout after {timeout} seconds")
 
-            await asyncio.sleep(poll_interval)
+            if timeout is not None:
+                interval = min(interval, max(0.0, timeout - elapsed))
+            await asyncio.sleep(interval)
+            interval = min(interval * backoff_factor, max_poll_interval)
+
+    async def wait_for_transcript(
+        self,
+        transcript_id: str,
+        webhook_receiver: Optional[TranscriptWebhookReceiver] = None,
+        timeout: Optional[int] = None,
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0
+    ) -> Transcript:
+        """
+        Wait for a submitted transcript to finish.
+
+        With a webhook receiver the completion notification is awaited and
+        the transcript fetched once; otherwise status is polled with backoff.
+        """
+        if webhook_receiver is None:
+            return await self._poll_transcription(
+                transcript_id,
+                poll_interval=poll_interval,
+                timeout=timeout,
+                max_poll_interval=max_poll_interval
+            )
+
+        # A resumed batch may wait on transcripts whose webhook already fired
+        transcript = await self.get_transcription_result(transcript_id)
+        if transcript.status not in ("completed", "error"):
+            try:
+                await webhook_receiver.wait(transcript_id, timeout)
+            except asyncio.TimeoutError:
+                raise Exception(f"Transcription timeout after {timeout} seconds")
+            transcript = await self.get_transcription_result(transcript_id)
+
+        if transcript.status == "error":
+            raise Exception(f"Transcription failed: {transcript.error or transcript.status}")
+        return transcript
+
+    async def transcribe_files(
+        self,
+        file_paths: List[str],
+        max_concurrency: int = 4,
+        state_file: Optional[str] = None,
+        webhook_receiver: Optional[TranscriptWebhookReceiver] = None,
+        timeout: Optional[int] = None,
+        **transcribe_options: Any
+    ) -> Dict[str, Union[Transcript, Exception]]:
+        """
+        Upload and transcribe many local files concurrently.
+
+        Each file is streamed from disk, submitted, and awaited with backoff
+        polling or through webhook_receiver. With state_file, upload URLs and
+        transcript IDs are recorded as they are created, so a rerun after an
+        interruption skips finished uploads and submissions.
+
+        Args:
+            file_paths: Local audio files
+            max_concurrency: Files uploaded and submitted at the same time
+            state_file: JSON file recording progress per file
+            webhook_receiver: Receiver for completion webhooks (instead of polling)
+            timeout: Maximum seconds to wait per transcript (None for no limit)
+            **transcribe_options: Options passed to transcribe_audio
+                (language_code, enable_speaker_diarization, ...)
+
+        Returns:
+            Transcript, or the exception raised, per file path
+        """
+        state: Dict[str, Dict[str, str]] = {}
+        if state_file and os.path.exists(state_file):
+            with open(state_file) as f:
+                state = json.load(f)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        if webhook_receiver is not None:
+            transcribe_options.setdefault("webhook_url", webhook_receiver.webhook_url)
+            if webhook_receiver.auth_header_name:
+                transcribe_options.setdefault("webhook_auth_header_name", webhook_receiver.auth_header_name)
+                transcribe_options.setdefault("webhook_auth_header_value", webhook_receiver.auth_header_value)
+
+        def record(path: str, **values: str) -> None:
+            state.setdefault(path, {}).update(values)
+            if state_file:
+                tmp_file = f"{state_file}.tmp"
+                with open(tmp_file, "w") as f:
+                    json.dump(state, f)
+                os.replace(tmp_file, state_file)
+
+        async def process(path: str) -> Transcript:
+            entry = state.get(path, {})
+            transcript_id = entry.get("transcript_id")
+
+            if not transcript_id:
+                async with semaphore:
+                    upload_url = entry.get("upload_url")
+                    if not upload_url:
+                        upload_url = (await self.upload_media_file(file_path=path)).upload_url
+                        record(path, upload_url=upload_url)
+
+                    transcript = await self.transcribe_audio(
+                        upload_url, poll=False, **transcribe_options
+                    )
+                    transcript_id = transcript.id
+                    record(path, transcript_id=transcript_id)
+
+            # Waiting does not hold a slot: only uploads and submissions are bounded
+            return await self.wait_for_transcript(
+                transcript_id, webhook_receiver=webhook_receiver, timeout=timeout
+            )
+
+        results = await asyncio.gather(
+            *(process(path) for path in file_paths),
+            return_exceptions=True
+        )
+        return dict(zip(file_paths, results))
 
     async def delete_transcript(self, transcript_id: str) -> bool:
         """
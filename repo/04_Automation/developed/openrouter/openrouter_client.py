@@ -3,11 +3,13 @@ OpenRouter - AI Model Routing API
 
 Supports:
 - Create Chat Completion
+- Stream Chat Completion (server-sent events)
 """
 
 import aiohttp
 import asyncio
-from typing import Optional, Dict, Any, List
+import json
+from typing import Optional, Dict, Any, List, AsyncIterator
 from dataclasses import dataclass
 
 
@@ -27,6 +29,16 @@ class CompletionResponse:
     usage: Dict[str, int]
 
 
+@dataclass
+class StreamChunk:
+    """Incremental piece of a streamed chat completion"""
+    id: str
+    model: str
+    delta: str
+    finish_reason: Optional[str] = None
+    usage: Optional[Dict[str, int]] = None
+
+
 class OpenRouterClient:
     """
     OpenRouter API client for AI model access.
@@ -76,7 +88,8 @@ class OpenRouterClient:
             model: Model identifier
             temperature: Sampling temperature (0-2)
             max_tokens: Maximum tokens to generate
-            stream: Whether to stream the response
+            stream: Consume the response as a stream and assemble it;
+                use stream_chat_completion() to receive deltas as they arrive
 
         Returns:
             CompletionResponse with completion data
@@ -85,16 +98,16 @@ class OpenRouterClient:
             ValueError: If API request fails
             aiohttp.ClientError: If request fails
         """
-        try:
-            payload = {
-                "model": model,
-                "messages": messages,
-                "temperature": temperature,
-                "stream": stream
-            }
+        if stream:
+            try:
+                return await self._collect_stream(
+                    self.stream_chat_completion(messages, model, temperature, max_tokens)
+                )
+            except Exception as e:
+                raise Exception(f"Failed to create chat completion: {str(e)}")
 
-            if max_tokens:
-                payload["max_tokens"] = max_tokens
+        try:
+            payload = self._build_payload(messages, model, temperature, max_tokens, stream)
 
             async with self.session.post(
                 f"{self.BASE_URL}/chat/completions",
@@ -113,4 +126,147 @@ class OpenRouterClient:
                 )
 
         except Exception as e:
-            raise Exception(f"Failed to create chat completion: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Failed to create chat completion: {str(e)}")
+
+    async def stream_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "mistralai/mistral-7b-instruct",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream a chat completion as it is generated.
+
+        The server-sent event body is parsed incrementally, so each token delta
+        is yielded as soon as it arrives. The last chunk carries the usage totals.
+
+        Args:
+            messages: List of message dicts with role and content
+            model: Model identifier
+            temperature: Sampling temperature (0-2)
+            max_tokens: Maximum tokens to generate
+
+        Yields:
+            StreamChunk per delta, then one with usage
+
+        Raises:
+            Exception: If the API returns an error before or during the stream
+            aiohttp.ClientError: If request fails
+
+        Example:
+            async for chunk in client.stream_chat_completion(messages):
+                print(chunk.delta, end="", flush=True)
+        """
+        payload = self._build_payload(messages, model, temperature, max_tokens, True)
+
+        async with self.session.post(
+            f"{self.BASE_URL}/chat/completions",
+            json=payload
+        ) as response:
+            if response.status != 200:
+                try:
+                    data = await response.json(content_type=None)
+                except (aiohttp.ContentTypeError, ValueError):
+                    data = {"error": await response.text()}
+                raise Exception(f"OpenRouter error: {data.get('error', 'Unknown error')}")
+
+            async for data in self._iter_sse_data(response):
+                if data == "[DONE]":
+                    break
+
+                event = json.loads(data)
+                if "error" in event:
+                    raise Exception(f"OpenRouter error: {event['error']}")
+
+                for choice in event.get("choices", []):
+                    delta = choice.get("delta") or {}
+                    content = delta.get("content") or ""
+                    finish_reason = choice.get("finish_reason")
+                    if content or finish_reason:
+                        yield StreamChunk(
+                            id=event.get("id", ""),
+                            model=event.get("model", model),
+                            delta=content,
+                            finish_reason=finish_reason
+                        )
+
+                if event.get("usage"):
+                    yield StreamChunk(
+                        id=event.get("id", ""),
+                        model=event.get("model", model),
+                        delta="",
+                        usage=event["usage"]
+                    )
+
+    @staticmethod
+    def _build_payload(
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        stream: bool
+    ) -> Dict[str, Any]:
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "stream": stream
+        }
+
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        return payload
+
+    @staticmethod
+    async def _iter_sse_data(response: aiohttp.ClientResponse) -> AsyncIterator[str]:
+        """Yield the data of each server-sent event; comment lines are keep-alives."""
+        data_lines: List[str] = []
+        async for raw_line in response.content:
+            line = raw_line.decode("utf-8").rstrip("\r\n")
+
+            if not line:
+                if data_lines:
+                    yield "\n".join(data_lines)
+                    data_lines = []
+                continue
+
+            if line.startswith(":"):
+                continue
+
+            field, _, value = line.partition(":")
+            if field == "data":
+                data_lines.append(value[1:] if value.startswith(" ") else value)
+
+        if data_lines:
+            yield "\n".join(data_lines)
+
+    @staticmethod
+    async def _collect_stream(chunks: AsyncIterator[StreamChunk]) -> CompletionResponse:
+        """Assemble streamed chunks into a regular completion response."""
+        completion_id = ""
+        model = ""
+        parts: List[str] = []
+        finish_reason = None
+        usage: Dict[str, int] = {}
+
+        async for chunk in chunks:
+            completion_id = chunk.id or completion_id
+            model = chunk.model or model
+            parts.append(chunk.delta)
+            if chunk.finish_reason:
+                finish_reason = chunk.finish_reason
+            if chunk.usage:
+                usage = chunk.usage
+
+        return CompletionResponse(
+            id=completion_id,
+            model=model,
+            choices=[{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(parts)},
+                "finish_reason": finish_reason
+            }],
+            usage=usage
+        )
@@ -2,10 +2,16 @@
 GitHub API Client - Version control and collaboration platform
 """
 
-import requests
-import time
+import sys
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.http_adapter import RateLimitedAdapter  # noqa: E402
+from common.rate_limit import credential_key, get_rate_limiter  # noqa: E402
+
 
 class GithubError(Exception):
     """Base exception for GitHub errors"""
@@ -26,14 +32,21 @@ class GithubClient:
     """Client for GitHub API"""
 
     BASE_URL = "https://api.github.com"
+    RATE_LIMIT_CALLS = 5000  # default budget until the API reports its own
+    RATE_LIMIT_PERIOD = 3600  # seconds
 
-    def __init__(self, access_token: str, timeout: int = 30):
+    def __init__(self, access_token: str, timeout: int = 30, max_retries: int = 3,
+                 tenant: Optional[str] = None):
         """
         Initialize GitHub client
 
         Args:
             access_token: GitHub OAuth access token
             timeout: Request timeout in seconds
+            max_retries: Retries after a 429 response
+            tenant: Key of the shared rate limit budget (defaults to the token)
+
+        Clients with the same tenant share one rate limit budget.
         """
         self.access_token = access_token
         self.timeout = timeout
@@ -42,18 +55,12 @@ class GithubClient:
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
         })
-        self.min_delay = 0.1
-        self.last_request_time = 0
-
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < self.min_delay:
-            time.sleep(self.min_delay - time_since_last_request)
-
-        self.last_request_time = time.time()
+        self.rate_limiter = get_rate_limiter(
+            f"github:{tenant or credential_key(access_token)}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD
+        )
+        self.session.mount("https://", RateLimitedAdapter(self.rate_limiter, max_retries))
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and errors"""
@@ -74,7 +81,6 @@ class GithubClient:
         return response.json()
     def get_repos(self, **kwargs) -> Dict[str, Any]:
         """Get repos"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/repos",
@@ -87,7 +93,6 @@ class GithubClient:
 
     def create_repo(self, **kwargs) -> Dict[str, Any]:
         """Create repo"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/repos",
@@ -100,7 +105,6 @@ class GithubClient:
 
     def get_issues(self, **kwargs) -> Dict[str, Any]:
         """Get issues"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/issues",
@@ -113,7 +117,6 @@ class GithubClient:
 
     def create_issue(self, **kwargs) -> Dict[str, Any]:
         """Create issue"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/issues",
@@ -126,7 +129,6 @@ class GithubClient:
 
     def get_pulls(self, **kwargs) -> Dict[str, Any]:
         """Get pulls"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/pulls",
@@ -139,7 +141,6 @@ class GithubClient:
 
     def create_pull(self, **kwargs) -> Dict[str, Any]:
         """Create pull"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/pulls",
@@ -152,7 +153,6 @@ class GithubClient:
 
     def get_users(self, **kwargs) -> Dict[str, Any]:
         """Get users"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/users",
@@ -165,7 +165,6 @@ class GithubClient:
 
     def create_user(self, **kwargs) -> Dict[str, Any]:
         """Create user"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/users",
@@ -5,11 +5,17 @@ Xero is a leading cloud-based accounting platform that provides comprehensive
 APIs for managing invoices, contacts, bank transactions, reports, and more.
 """
 
-import requests
-import time
+import sys
 import uuid
+from pathlib import Path
 from typing import Optional, Dict, Any, List
 
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.http_adapter import RateLimitedAdapter  # noqa: E402
+from common.rate_limit import get_rate_limiter  # noqa: E402
+
 
 class XeroError(Exception):
     """Base exception for Xero errors"""
@@ -27,9 +33,14 @@ class XeroClient:
     """
 
     BASE_URL = "https://api.xero.com/api.xro/2.0"
+    RATE_LIMIT_CALLS = 60  # default budget until the API reports its own
+    RATE_LIMIT_PERIOD = 60  # seconds
+    # Xero reports only the calls left in the current minute
+    RATE_LIMIT_REMAINING_HEADERS = ("X-MinLimit-Remaining", "X-AppMinLimit-Remaining")
 
     def __init__(self, client_id: str, client_secret: str, tenant_id: str,
-                 access_token: Optional[str] = None, timeout: int = 30):
+                 access_token: Optional[str] = None, timeout: int = 30,
+                 max_retries: int = 3):
         """
         Initialize Xero client.
 
@@ -39,6 +50,9 @@ class XeroClient:
             tenant_id: Xero tenant ID (organization)
             access_token: OAuth 2.0 access token (optional)
             timeout: Request timeout in seconds
+            max_retries: Retries after a 429 response
+
+        Clients for the same tenant_id share one rate limit budget.
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -53,15 +67,15 @@ class XeroClient:
         })
         if access_token:
             self.session.headers['Authorization'] = f'Bearer {access_token}'
-        self.min_delay = 0.5
-        self.last_request_time = 0
-
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        current = time.time()
-        if (current - self.last_request_time) < self.min_delay:
-            time.sleep(self.min_delay - (current - self.last_request_time))
-        self.last_request_time = time.time()
+        self.rate_limiter = get_rate_limiter(
+            f"xero:{tenant_id}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD,
+            remaining_headers=self.RATE_LIMIT_REMAINING_HEADERS,
+            limit_headers=(),
+            reset_headers=()
+        )
+        self.session.mount("https://", RateLimitedAdapter(self.rate_limiter, max_retries))
 
     def _handle_response(self, resp: requests.Response) -> Dict[str, Any]:
         """Handle API response and errors"""
@@ -87,7 +101,6 @@ class XeroClient:
         Returns:
             List of invoices
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Invoices",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -103,7 +116,6 @@ class XeroClient:
         Returns:
             Invoice details
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Invoices/{invoice_id}",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -118,7 +130,6 @@ class XeroClient:
         Returns:
             Created invoice
         """
-        self._enforce_rate_limit()
         resp = self.session.put(f"{self.BASE_URL}/Invoices",
                                json={'Invoices': [invoice_data]},
                                timeout=self.timeout)
@@ -135,7 +146,6 @@ class XeroClient:
         Returns:
             Updated invoice
         """
-        self._enforce_rate_limit()
         invoice_data['InvoiceID'] = invoice_id
         resp = self.session.post(f"{self.BASE_URL}/Invoices",
                                 json={'Invoices': [invoice_data]},
@@ -152,7 +162,6 @@ class XeroClient:
         Returns:
             Deletion confirmation
         """
-        self._enforce_rate_limit()
         resp = self.session.delete(f"{self.BASE_URL}/Invoices/{invoice_id}",
                                   timeout=self.timeout)
         return self._handle_response(resp)
@@ -167,7 +176,6 @@ class XeroClient:
         Returns:
             List of contacts
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Contacts",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -182,7 +190,6 @@ class XeroClient:
         Returns:
             Contact details
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Contacts/{contact_id}",
                                timeout=self.timeout)
         return self._handle_response(resp)
@@ -197,7 +204,6 @@ class XeroClient:
         Returns:
             Created contact
         """
-        self._enforce_rate_limit()
         resp = self.session.put(f"{self.BASE_URL}/Contacts",
                                json={'Contacts': [contact_data]},
                                timeout=self.timeout)
@@ -214,7 +220,6 @@ class XeroClient:
         Returns:
             Updated contact
         """
-        self._enforce_rate_limit()
         contact_data['ContactID'] = contact_id
         resp = self.session.post(f"{self.BASE_URL}/Contacts",
                                 json={'Contacts': [contact_data]},
@@ -231,7 +236,6 @@ class XeroClient:
         Returns:
             List of accounts
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Accounts",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -246,7 +250,6 @@ class XeroClient:
         Returns:
             List of bank transactions
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/BankTransactions",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -261,7 +264,6 @@ class XeroClient:
         Returns:
             Created transaction
         """
-        self._enforce_rate_limit()
         resp = self.session.put(f"{self.BASE_URL}/BankTransactions",
                                json={'BankTransactions': [transaction_data]},
                                timeout=self.timeout)
@@ -277,7 +279,6 @@ class XeroClient:
         Returns:
             List of items
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Items",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -292,7 +293,6 @@ class XeroClient:
         Returns:
             Created item
         """
-        self._enforce_rate_limit()
         resp = self.session.put(f"{self.BASE_URL}/Items",
                                json={'Items': [item_data]},
                                timeout=self.timeout)
@@ -308,7 +308,6 @@ class XeroClient:
         Returns:
             List of tracking categories
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/TrackingCategories",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -324,7 +323,6 @@ class XeroClient:
         Returns:
             Report data
         """
-        self._enforce_rate_limit()
         resp = self.session.get(f"{self.BASE_URL}/Reports/{report_id}",
                                params=params, timeout=self.timeout)
         return self._handle_response(resp)
@@ -338,7 +336,6 @@ class XeroClient:
         """
         if not self.access_token:
             raise XeroAuthenticationError("Access token required")
-        self._enforce_rate_limit()
         resp = self.session.get("https://api.xero.com/connections",
                                timeout=self.timeout)
         return self._handle_response(resp)
@@ -353,7 +350,6 @@ class XeroClient:
         Returns:
             Email send confirmation
         """
-        self._enforce_rate_limit()
         resp = self.session.post(f"{self.BASE_URL}/Invoices/{invoice_id}/Email",
                                 timeout=self.timeout)
         return self._handle_response(resp)
\ No newline at end of file
@@ -2,9 +2,17 @@
 Zendesk API Client - Customer support and ticketing platform
 """
 
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Iterator, Sequence
+
 import requests
-import time
-from typing import Optional, Dict, Any, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.http_adapter import RateLimitedAdapter  # noqa: E402
+from common.rate_limit import credential_key, get_rate_limiter  # noqa: E402
 
 
 class ZendeskError(Exception):
@@ -26,14 +34,22 @@ class ZendeskClient:
     """Client for Zendesk API"""
 
     BASE_URL = "https://api.zendesk.com/api/v2"
+    RATE_LIMIT_CALLS = 200  # default budget until the API reports its own
+    RATE_LIMIT_PERIOD = 60  # seconds
+    INCREMENTAL_CALLS_PER_MINUTE = 10
 
-    def __init__(self, access_token: str, timeout: int = 30):
+    def __init__(self, access_token: str, timeout: int = 30, max_retries: int = 3,
+                 tenant: Optional[str] = None):
         """
         Initialize Zendesk client
 
         Args:
             access_token: Zendesk OAuth access token
             timeout: Request timeout in seconds
+            max_retries: Retries after a 429 response
+            tenant: Key of the shared rate limit budget (defaults to the token)
+
+        Clients with the same tenant share one rate limit budget.
         """
         self.access_token = access_token
         self.timeout = timeout
@@ -42,18 +58,19 @@ class ZendeskClient:
             'Authorization': f'Bearer {access_token}',
             'Content-Type': 'application/json'
         })
-        self.min_delay = 0.1
-        self.last_request_time = 0
-
-    def _enforce_rate_limit(self):
-        """Enforce rate limiting between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-
-        if time_since_last_request < self.min_delay:
-            time.sleep(self.min_delay - time_since_last_request)
-
-        self.last_request_time = time.time()
+        tenant_key = tenant or credential_key(access_token)
+        self.rate_limiter = get_rate_limiter(
+            f"zendesk:{tenant_key}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD
+        )
+        # Incremental exports have their own, much lower, per-minute limit
+        self.incremental_rate_limiter = get_rate_limiter(
+            f"zendesk-incremental:{tenant_key}",
+            self.INCREMENTAL_CALLS_PER_MINUTE,
+            60
+        )
+        self.session.mount("https://", RateLimitedAdapter(self.rate_limiter, max_retries))
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle API response and errors"""
@@ -74,7 +91,6 @@ class ZendeskClient:
         return response.json()
     def get_tickets(self, **kwargs) -> Dict[str, Any]:
         """Get tickets"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/tickets",
@@ -87,7 +103,6 @@ class ZendeskClient:
 
     def create_ticket(self, **kwargs) -> Dict[str, Any]:
         """Create ticket"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/tickets",
@@ -100,7 +115,6 @@ class ZendeskClient:
 
     def get_users(self, **kwargs) -> Dict[str, Any]:
         """Get users"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/users",
@@ -113,7 +127,6 @@ class ZendeskClient:
 
     def create_user(self, **kwargs) -> Dict[str, Any]:
         """Create user"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/users",
@@ -126,7 +139,6 @@ class ZendeskClient:
 
     def get_organizations(self, **kwargs) -> Dict[str, Any]:
         """Get organizations"""
-        self._enforce_rate_limit()
         try:
             response = self.session.get(
                 f"{self.BASE_URL}/organizations",
@@ -139,7 +151,6 @@ class ZendeskClient:
 
     def create_organization(self, **kwargs) -> Dict[str, Any]:
         """Create organization"""
-        self._enforce_rate_limit()
         try:
             response = self.session.post(
                 f"{self.BASE_URL}/organizations",
@@ -150,3 +161,133 @@ class ZendeskClient:
         except requests.exceptions.RequestException as e:
             raise ZendeskError(f"Request failed: {str(e)}")
 
+    # ==================== Incremental Export ====================
+
+    def incremental_tickets(
+        self,
+        start_time: Optional[int] = None,
+        checkpoint_file: Optional[str] = None,
+        include: Sequence[str] = ("users",),
+        per_page: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Export tickets changed since start_time, page by page.
+
+        Uses the cursor-based incremental export. Related users are
+        side-loaded in the same call (see include).
+
+        Args:
+            start_time: Unix time to start from on the first run (default 0)
+            checkpoint_file: JSON file that persists the after_cursor, so the
+                next run only returns tickets changed since this one
+            include: Side-loads, e.g. ("users", "groups", "organizations")
+            per_page: Tickets per page (max 1000)
+
+        Yields:
+            Response pages with "tickets" and the side-loaded lists
+        """
+        return self._incremental_cursor_export(
+            "tickets", start_time, checkpoint_file, include, per_page
+        )
+
+    def incremental_users(
+        self,
+        start_time: Optional[int] = None,
+        checkpoint_file: Optional[str] = None,
+        per_page: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Export users changed since start_time, page by page (cursor-based).
+
+        Yields:
+            Response pages with "users"
+        """
+        return self._incremental_cursor_export(
+            "users", start_time, checkpoint_file, (), per_page
+        )
+
+    def incremental_organizations(
+        self,
+        start_time: Optional[int] = None,
+        checkpoint_file: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Export organizations changed since start_time, page by page.
+
+        Organizations only support the time-based export, so the checkpoint
+        stores the end_time of the last page.
+
+        Yields:
+            Response pages with "organizations"
+        """
+        checkpoint = self._load_checkpoint(checkpoint_file)
+        if "start_time" in checkpoint:
+            start_time = checkpoint["start_time"]
+        url = f"{self.BASE_URL}/incremental/organizations.json"
+        params: Optional[Dict[str, Any]] = {"start_time": start_time or 0}
+
+        while True:
+            page = self._incremental_get(url, params)
+            yield page
+
+            # Saved once the caller has consumed the page
+            if checkpoint_file and page.get("end_time"):
+                self._save_checkpoint(checkpoint_file, {"start_time": page["end_time"]})
+            if page.get("end_of_stream") or not page.get("next_page"):
+                break
+            url, params = page["next_page"], None
+
+    def _incremental_cursor_export(
+        self,
+        resource: str,
+        start_time: Optional[int],
+        checkpoint_file: Optional[str],
+        include: Sequence[str],
+        per_page: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Follow after_cursor until end_of_stream, checkpointing every consumed page."""
+        checkpoint = self._load_checkpoint(checkpoint_file)
+        params: Dict[str, Any] = {"per_page": min(per_page, 1000)}
+        if checkpoint.get("cursor"):
+            params["cursor"] = checkpoint["cursor"]
+        else:
+            params["start_time"] = start_time or 0
+        if include:
+            params["include"] = ",".join(include)
+
+        url = f"{self.BASE_URL}/incremental/{resource}/cursor.json"
+        while True:
+            page = self._incremental_get(url, params)
+            yield page
+
+            cursor = page.get("after_cursor")
+            if checkpoint_file and cursor:
+                self._save_checkpoint(checkpoint_file, {"cursor": cursor})
+            if page.get("end_of_stream") or not cursor:
+                break
+            params.pop("start_time", None)
+            params["cursor"] = cursor
+
+    def _incremental_get(self, url: str, params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """GET an incremental export page within the incremental rate limit."""
+        self.incremental_rate_limiter.wait_if_needed()
+        try:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            return self._handle_response(response)
+        except requests.exceptions.RequestException as e:
+            raise ZendeskError(f"Request failed: {str(e)}")
+
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: Optional[str]) -> Dict[str, Any]:
+        if checkpoint_file and os.path.exists(checkpoint_file):
+            with open(checkpoint_file) as f:
+                return json.load(f)
+        return {}
+
+    @staticmethod
+    def _save_checkpoint(checkpoint_file: str, checkpoint: Dict[str, Any]) -> None:
+        """Atomically persist an incremental export checkpoint."""
+        tmp_file = f"{checkpoint_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_file, checkpoint_file)
@@ -5,8 +5,12 @@ This module provides a Python client for interacting with AWS Athena.
 """
 
 import boto3
+import codecs
+import csv
+import re
 import time
-from typing import Dict, List, Optional, Any, Iterator
+from collections import deque
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from botocore.exceptions import ClientError
 
 
@@ -21,6 +25,11 @@ class AthenaClient:
     - Integration with AWS Glue Data Catalog
     """
 
+    TERMINAL_STATES = ('SUCCEEDED', 'FAILED', 'CANCELLED')
+    BATCH_GET_LIMIT = 50
+    THROTTLING_ERRORS = ('TooManyRequestsException', 'ThrottlingException')
+    _SQL_TOKEN = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|\s+|[^'\"\s-]+|-")
+
     def __init__(
         self,
         region_name: str,
@@ -28,9 +37,18 @@ class AthenaClient:
         aws_access_key_id: Optional[str] = None,
         aws_secret_access_key: Optional[str] = None,
         s3_staging_dir: Optional[str] = None,
-        workgroup: Optional[str] = None
+        workgroup: Optional[str] = None,
+        max_concurrent_queries: int = 20,
+        result_cache_ttl: float = 300
     ):
-        """Initialize the Athena client."""
+        """
+        Initialize the Athena client.
+
+        max_concurrent_queries should match the active DML query quota of the
+        account/region the workgroup runs in; batch_query never has more
+        queries running than this. result_cache_ttl is how long (seconds)
+        batch_query serves repeated SQL from the local result cache.
+        """
         session_config = {'region_name': region_name}
         if aws_access_key_id and aws_secret_access_key:
             session_config.update({
@@ -38,20 +56,31 @@ class AthenaClient:
                 'aws_secret_access_key': aws_secret_access_key
             })
 
+        self._session_config = session_config
         self.session = boto3.client('athena', **session_config)
         self.s3_client = boto3.client('s3', **session_config) if s3_staging_dir else None
         self.output_location = output_location
         self.s3_staging_dir = s3_staging_dir
         self.workgroup = workgroup
+        self.max_concurrent_queries = max_concurrent_queries
+        self.result_cache_ttl = result_cache_ttl
+        self._result_cache: Dict[Tuple[str, Optional[str], Optional[str]], Tuple[float, Dict[str, Any]]] = {}
 
     def start_query_execution(
         self,
         query_string: str,
         database: Optional[str] = None,
         query_execution_context: Optional[Dict[str, Any]] = None,
-        result_configuration: Optional[Dict[str, Any]] = None
+        result_configuration: Optional[Dict[str, Any]] = None,
+        result_reuse_minutes: Optional[int] = None
     ) -> str:
-        """Start a query execution."""
+        """
+        Start a query execution.
+
+        With result_reuse_minutes set, Athena returns the results of an
+        identical query run within that many minutes without scanning again
+        (requires engine version 3).
+        """
         config = {
             'QueryString': query_string,
             'ResultConfiguration': result_configuration or {'OutputLocation': self.output_location}
@@ -65,6 +94,14 @@ class AthenaClient:
         if self.workgroup:
             config['WorkGroup'] = self.workgroup
 
+        if result_reuse_minutes:
+            config['ResultReuseConfiguration'] = {
+                'ResultReuseByAgeConfiguration': {
+                    'Enabled': True,
+                    'MaxAgeInMinutes': result_reuse_minutes
+                }
+            }
+
         response = self.session.start_query_execution(**config)
         return response['QueryExecutionId']
 
@@ -73,6 +110,17 @@ class AthenaClient:
         response = self.session.get_query_execution(QueryExecutionId=query_execution_id)
         return response['QueryExecution']
 
+    def batch_get_query_execution(self, query_execution_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get details of many query executions, 50 IDs per API call."""
+        executions = {}
+        for start in range(0, len(query_execution_ids), self.BATCH_GET_LIMIT):
+            response = self.session.batch_get_query_execution(
+                QueryExecutionIds=query_execution_ids[start:start + self.BATCH_GET_LIMIT]
+            )
+            for execution in response['QueryExecutions']:
+                executions[execution['QueryExecutionId']] = execution
+        return executions
+
     def get_query_results(
         self,
         query_execution_id: str,
@@ -85,8 +133,10 @@ class AthenaClient:
             params['NextToken'] = next_token
 
         response = self.session.get_query_results(**params)
+        column_info = response['ResultSet'].get('ResultSetMetadata', {}).get('ColumnInfo', [])
         return {
             'rows': response['ResultSet']['Rows'],
+            'columns': [column['Name'] for column in column_info],
             'next_token': response.get('NextToken')
         }
 
@@ -94,10 +144,19 @@ class AthenaClient:
         self,
         query_execution_id: str,
         check_interval: float = 1.0,
-        timeout: int = 300
+        timeout: int = 300,
+        backoff_factor: float = 1.0,
+        max_check_interval: float = 10.0
     ) -> Dict[str, Any]:
-        """Wait for a query to complete."""
+        """
+        Wait for a query to complete.
+
+        With backoff_factor > 1 the poll interval grows from check_interval
+        up to max_check_interval, so short queries are noticed quickly and
+        long ones don't burn GetQueryExecution calls.
+        """
         start_time = time.time()
+        interval = check_interval
 
         while True:
             if time.time() - start_time > timeout:
@@ -109,7 +168,8 @@ class AthenaClient:
             if state in ['SUCCEEDED', 'FAILED', 'CANCELLED']:
                 return execution
 
-            time.sleep(check_interval)
+            time.sleep(interval)
+            interval = min(interval * backoff_factor, max_check_interval)
 
     def execute_query(
         self,
@@ -142,26 +202,184 @@ class AthenaClient:
         self,
         query_string: str,
         database: Optional[str] = None,
-        timeout: int = 300
+        timeout: int = 300,
+        chunksize: int = 100000
     ):
-        """Execute query and return pandas DataFrame."""
+        """
+        Execute query and return pandas DataFrame with every column as str.
+
+        SELECT results are read from the S3 result CSV. Statements whose
+        output is not a CSV (DDL, SHOW, DESCRIBE, ...) are read through
+        GetQueryResults instead.
+        """
         try:
             import pandas as pd
         except ImportError:
             raise ImportError("pandas is required for query_to_dataframe")
 
-        result = self.execute_query(query_string, database, timeout=timeout)
+        query_id = self.run_query(query_string, database, timeout=timeout)
+        execution = self.get_query_execution(query_id)
+        if not self._has_csv_output(execution):
+            columns, rows = self._statement_rows(query_id, execution)
+            return pd.DataFrame(rows, columns=columns, dtype=str)
+
+        chunks = list(self.iter_result_chunks(query_id, chunksize=chunksize))
+        if not chunks:
+            return pd.DataFrame()
+        return pd.concat(chunks, ignore_index=True)
+
+    def run_query(
+        self,
+        query_string: str,
+        database: Optional[str] = None,
+        timeout: int = 300,
+        check_interval: float = 0.2,
+        backoff_factor: float = 2.0,
+        max_check_interval: float = 5.0
+    ) -> str:
+        """Start a query, wait for it with exponential-backoff polling and return its ID."""
+        query_id = self.start_query_execution(query_string, database)
+        execution = self.wait_for_query_completion(
+            query_id,
+            check_interval=check_interval,
+            timeout=timeout,
+            backoff_factor=backoff_factor,
+            max_check_interval=max_check_interval
+        )
+
+        if execution['Status']['State'] != 'SUCCEEDED':
+            raise Exception(
+                f"Query failed: {execution['Status'].get('StateChangeReason', execution['Status']['State'])}"
+            )
+
+        return query_id
+
+    def stream_query(
+        self,
+        query_string: str,
+        database: Optional[str] = None,
+        timeout: int = 300,
+        chunksize: Optional[int] = None
+    ) -> Iterator[Any]:
+        """
+        Execute a query and stream its results from the S3 output location.
+
+        Yields row dicts, or pandas DataFrames of up to chunksize rows when
+        chunksize is given. Memory use is bounded by one row or one chunk.
+        """
+        query_id = self.run_query(query_string, database, timeout=timeout)
+        if chunksize:
+            yield from self.iter_result_chunks(query_id, chunksize=chunksize)
+        else:
+            yield from self.iter_result_csv(query_id)
+
+    def iter_query_results(
+        self,
+        query_execution_id: str,
+        page_size: int = 1000
+    ) -> Iterator[Dict[str, str]]:
+        """Iterate over result rows as dicts, paging through GetQueryResults."""
+        columns = None
+        next_token = None
+
+        while True:
+            result = self.get_query_results(
+                query_execution_id, max_results=page_size, next_token=next_token
+            )
+            rows = result['rows']
+
+            if columns is None and rows:
+                columns = [cell.get('VarCharValue', '') for cell in rows[0]['Data']]
+                rows = rows[1:]
+
+            for row in rows:
+                yield {
+                    col: cell.get('VarCharValue')
+                    for col, cell in zip(columns, row['Data'])
+                }
+
+            next_token = result['next_token']
+            if not next_token:
+                break
+
+    @staticmethod
+    def _has_csv_output(execution: Dict[str, Any]) -> bool:
+        """True if the query wrote a CSV result (SELECT); DDL/utility output is .txt."""
+        location = execution.get('ResultConfiguration', {}).get('OutputLocation', '')
+        return execution.get('StatementType', 'DML') == 'DML' and location.endswith('.csv')
+
+    def _statement_rows(
+        self,
+        query_execution_id: str,
+        execution: Dict[str, Any]
+    ) -> Tuple[List[str], List[List[str]]]:
+        """Read all result rows via GetQueryResults, skipping the DML header row."""
+        columns: List[str] = []
+        rows: List[List[str]] = []
+        skip_header = execution.get('StatementType') == 'DML'
+        next_token = None
+
+        while True:
+            result = self.get_query_results(query_execution_id, next_token=next_token)
+            columns = columns or result['columns']
+            page = result['rows']
+            if skip_header and page:
+                page = page[1:]
+                skip_header = False
+            rows.extend([cell.get('VarCharValue', '') for cell in row['Data']] for row in page)
+
+            next_token = result['next_token']
+            if not next_token:
+                break
+
+        if not columns and rows:
+            columns = [f'col{i}' for i in range(len(rows[0]))]
+        return columns, rows
+
+    def _open_result_object(self, query_execution_id: str):
+        """Open the result CSV of a finished query as a streaming body."""
+        execution = self.get_query_execution(query_execution_id)
+        location = execution['ResultConfiguration']['OutputLocation']
+        bucket, _, key = location[len('s3://'):].partition('/')
 
-        # Extract column names
-        columns = [col['VarCharValue'] for col in result['results']['rows'][0]['Data']]
+        if not self.s3_client:
+            self.s3_client = boto3.client('s3', **self._session_config)
+
+        response = self.s3_client.get_object(Bucket=bucket, Key=key)
+        return response['Body']
 
-        # Extract data rows
-        rows = [
-            [cell.get('VarCharValue', '') for cell in row['Data']]
-            for row in result['results']['rows'][1:]
-        ]
+    def iter_result_csv(self, query_execution_id: str) -> Iterator[Dict[str, str]]:
+        """Stream result rows as dicts straight from the S3 result CSV."""
+        body = self._open_result_object(query_execution_id)
+        try:
+            reader = csv.DictReader(codecs.getreader('utf-8')(body))
+            for row in reader:
+                yield row
+        finally:
+            body.close()
+
+    def iter_result_chunks(
+        self,
+        query_execution_id: str,
+        chunksize: int = 100000
+    ) -> Iterator[Any]:
+        """
+        Stream the S3 result CSV as pandas DataFrame chunks.
+
+        Values stay strings, as returned by GetQueryResults; NULLs and empty
+        strings both become ''.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("pandas is required for iter_result_chunks")
 
-        return pd.DataFrame(rows, columns=columns)
+        body = self._open_result_object(query_execution_id)
+        try:
+            for chunk in pd.read_csv(body, chunksize=chunksize, dtype=str, keep_default_na=False):
+                yield chunk
+        finally:
+            body.close()
 
     def get_all_query_results(self, query_execution_id: str) -> List[Dict[str, Any]]:
         """Get all results with pagination."""
@@ -236,25 +454,200 @@ class AthenaClient:
         self,
         queries: List[str],
         database: Optional[str] = None,
-        parallel: int = 5
+        parallel: Optional[int] = None,
+        timeout: int = 300,
+        use_cache: bool = False,
+        result_reuse_minutes: Optional[int] = None,
+        check_interval: float = 0.2,
+        max_check_interval: float = 5.0
     ) -> List[Dict[str, Any]]:
-        """Execute multiple queries in parallel."""
-        import concurrent.futures
-
-        def run_query(query: str) -> Dict[str, Any]:
-            return self.execute_query(query, database)
+        """
+        Execute multiple queries concurrently and return results in input order.
+
+        All queries are started up front, up to parallel (default
+        max_concurrent_queries) at a time; a new one starts as soon as a slot
+        frees up. Running queries are polled together with
+        BatchGetQueryExecution, with backoff while nothing changes. When
+        StartQueryExecution is throttled, the concurrency limit drops to the
+        number of queries already running and the start is retried with its
+        own backoff; each query that finishes afterwards raises the limit by
+        one again, up to parallel.
+
+        Repeated SQL (compared after normalising whitespace, comments and a
+        trailing semicolon) is run once per batch. Both caches are opt-in,
+        since they can return data older than the tables: with use_cache,
+        complete results (a single result page) are kept for
+        result_cache_ttl seconds; result_reuse_minutes enables Athena's own
+        result reuse beyond that window.
+
+        Failed queries produce {'error': ..., 'query': ...} entries. Queries
+        still running when the batch ends early (timeout or an exception)
+        are stopped.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        waiting: Dict[Tuple[str, Optional[str], Optional[str]], List[int]] = {}
+        pending = deque()
+
+        for index, query in enumerate(queries):
+            key = self._cache_key(query, database)
+            cached = self._get_cached_result(key) if use_cache else None
+            if cached is not None:
+                results[index] = cached
+            elif key in waiting:
+                waiting[key].append(index)
+            else:
+                waiting[key] = [index]
+                pending.append((key, query))
+
+        max_limit = parallel or self.max_concurrent_queries
+        limit = max_limit
+        running: Dict[str, Tuple[Tuple[str, Optional[str], Optional[str]], str]] = {}
+        deadline = time.time() + timeout
+        interval = check_interval
+        start_interval = check_interval
+        start_retry_at = 0.0
+
+        def finish(key, result):
+            for index in waiting[key]:
+                results[index] = result
 
-        results = []
-        with concurrent.futures.ThreadPoolExecutor(max_workers=parallel) as executor:
-            futures = {executor.submit(run_query, query): query for query in queries}
-            for future in concurrent.futures.as_completed(futures):
+        try:
+            while pending or running:
+                while pending and len(running) < limit and time.time() >= start_retry_at:
+                    key, query = pending[0]
+                    try:
+                        query_id = self.start_query_execution(
+                            query, database, result_reuse_minutes=result_reuse_minutes
+                        )
+                    except ClientError as e:
+                        if e.response['Error']['Code'] in self.THROTTLING_ERRORS:
+                            # Hit the concurrency quota: wait for a running query to
+                            # finish, and back off before trying to start again
+                            limit = max(len(running), 1)
+                            start_retry_at = time.time() + start_interval
+                            start_interval = min(start_interval * 2, max_check_interval)
+                            break
+                        pending.popleft()
+                        finish(key, {'error': str(e), 'query': query})
+                        continue
+                    pending.popleft()
+                    running[query_id] = (key, query)
+                    start_interval = check_interval
+
+                if time.time() > deadline:
+                    for query_id, (key, query) in running.items():
+                        finish(key, {'error': f"Query {query_id} timed out", 'query': query})
+                    for key, query in pending:
+                        finish(key, {'error': 'Query not started before timeout', 'query': query})
+                    break
+
+                if not running:
+                    # Nothing to poll: only a throttled start is waiting
+                    time.sleep(max(start_retry_at - time.time(), 0.0))
+                    continue
+                time.sleep(interval)
+
+                running_before = len(running)
+                for query_id, execution in self._poll_executions(list(running)).items():
+                    key, query = running[query_id]
+                    if isinstance(execution, ClientError):
+                        del running[query_id]
+                        finish(key, {'error': str(execution), 'query': query})
+                        continue
+
+                    status = execution['Status']
+                    if status['State'] not in self.TERMINAL_STATES:
+                        continue
+
+                    del running[query_id]
+                    if status['State'] != 'SUCCEEDED':
+                        finish(key, {
+                            'error': f"Query failed: {status.get('StateChangeReason', status['State'])}",
+                            'query': query
+                        })
+                        continue
+
+                    try:
+                        query_results = self.get_query_results(query_id)
+                    except ClientError as e:
+                        finish(key, {'error': str(e), 'query': query})
+                        continue
+                    result = {
+                        'query_execution_id': query_id,
+                        'execution': execution,
+                        'results': query_results
+                    }
+                    # Only complete results are cached; a first page with a
+                    # next_token must be paged on from the query ID
+                    if use_cache and not query_results['next_token']:
+                        self._result_cache[key] = (time.time(), result)
+                    finish(key, result)
+
+                finished = running_before - len(running)
+                # Every finished query gives back a slot a throttle took away
+                limit = min(limit + finished, max_limit)
+                interval = check_interval if finished else min(interval * 2, max_check_interval)
+        finally:
+            for query_id in running:
                 try:
-                    results.append(future.result())
-                except Exception as e:
-                    results.append({'error': str(e), 'query': futures[future]})
+                    self.cancel_query(query_id)
+                except ClientError:
+                    pass
 
         return results
 
+    def _poll_executions(self, query_execution_ids: List[str]) -> Dict[str, Any]:
+        """
+        Return the execution of each query, or the ClientError that fetching it raised.
+
+        Throttled polls return nothing, so the queries are polled again on
+        the next round. Any other BatchGetQueryExecution error is retried
+        query by query, so one bad ID cannot fail the whole batch.
+        """
+        try:
+            return self.batch_get_query_execution(query_execution_ids)
+        except ClientError as e:
+            if e.response['Error']['Code'] in self.THROTTLING_ERRORS:
+                return {}
+
+        executions: Dict[str, Any] = {}
+        for query_id in query_execution_ids:
+            try:
+                executions[query_id] = self.get_query_execution(query_id)
+            except ClientError as e:
+                if e.response['Error']['Code'] not in self.THROTTLING_ERRORS:
+                    executions[query_id] = e
+        return executions
+
+    def clear_result_cache(self) -> None:
+        """Drop all locally cached batch_query results."""
+        self._result_cache.clear()
+
+    def _cache_key(self, query: str, database: Optional[str]) -> Tuple[str, Optional[str], Optional[str]]:
+        return (self._normalize_sql(query), database, self.workgroup)
+
+    def _get_cached_result(self, key: Tuple[str, Optional[str], Optional[str]]) -> Optional[Dict[str, Any]]:
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        cached_at, result = entry
+        if time.time() - cached_at > self.result_cache_ttl:
+            del self._result_cache[key]
+            return None
+        return result
+
+    @classmethod
+    def _normalize_sql(cls, query: str) -> str:
+        """Collapse whitespace and drop comments outside quoted literals and identifiers."""
+        parts = []
+        for token in cls._SQL_TOKEN.findall(query):
+            if token.startswith('--') or token.isspace():
+                if parts and parts[-1] != ' ':
+                    parts.append(' ')
+            else:
+                parts.append(token)
+        return ''.join(parts).strip().rstrip(';').strip()
+
     def get_query_history(
         self,
         max_results: int = 50
@@ -5,7 +5,8 @@ This module provides a Python client for interacting with Kintone.
 """
 
 import requests
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Iterator
 import json
 
 
@@ -117,6 +118,105 @@ class KintoneClient:
             'totalCount': len(all_records)
         }
 
+    def create_cursor(
+        self,
+        app: int,
+        query: str = "",
+        fields: Optional[List[str]] = None,
+        size: int = 500
+    ) -> Dict[str, Any]:
+        """Create a record cursor (size up to 500, query without limit/offset)."""
+        data = {'app': app, 'size': size}
+        if query:
+            data['query'] = query
+        if fields:
+            data['fields'] = fields
+        return self._request('POST', '/records/cursor', data=data)
+
+    def get_cursor_records(self, cursor_id: str) -> Dict[str, Any]:
+        """Get the next page of records from a cursor."""
+        params = {'id': cursor_id}
+        return self._request('GET', '/records/cursor', params=params)
+
+    def delete_cursor(self, cursor_id: str) -> Dict[str, Any]:
+        """Delete a record cursor."""
+        data = {'id': cursor_id}
+        return self._request('DELETE', '/records/cursor', data=data)
+
+    def iter_records(
+        self,
+        app: int,
+        query: str = "",
+        fields: Optional[List[str]] = None,
+        size: int = 500,
+        batch_size: Optional[int] = None,
+        prefetch: bool = True
+    ) -> Iterator[Any]:
+        """
+        Stream records through the cursor API.
+
+        Unlike get_records, this is not bound by the 10,000 offset cap and
+        never holds more than two pages in memory. While the caller consumes
+        one page the next one is fetched in the background (prefetch=True).
+        The cursor is always deleted when the generator finishes, fails or
+        is closed early.
+
+        Args:
+            app: App ID
+            query: Query string (must not contain limit/offset)
+            fields: Field codes to return
+            size: Records per cursor page (max 500)
+            batch_size: Yield lists of this many records instead of
+                single records
+
+        Yields:
+            Records, or lists of records when batch_size is set
+        """
+        cursor = self.create_cursor(app, query=query, fields=fields, size=size)
+        cursor_id = cursor['id']
+        exhausted = False
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+        try:
+            batch = []
+            pending = None
+            response = self.get_cursor_records(cursor_id)
+
+            while True:
+                has_next = response.get('next', False)
+                if has_next and executor:
+                    pending = executor.submit(self.get_cursor_records, cursor_id)
+
+                for record in response.get('records', []):
+                    if batch_size:
+                        batch.append(record)
+                        if len(batch) >= batch_size:
+                            yield batch
+                            batch = []
+                    else:
+                        yield record
+
+                if not has_next:
+                    break
+                if pending is not None:
+                    response = pending.result()
+                    pending = None
+                else:
+                    response = self.get_cursor_records(cursor_id)
+
+            # kintone drops the cursor itself once the last page is read
+            exhausted = True
+            if batch:
+                yield batch
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            if not exhausted:
+                try:
+                    self.delete_cursor(cursor_id)
+                except requests.RequestException:
+                    pass
+
     def add_record(
         self,
         app: int,
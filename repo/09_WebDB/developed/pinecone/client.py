@@ -5,8 +5,11 @@ This module provides a Python client for interacting with Pinecone's vector data
 """
 
 import requests
-from typing import Dict, List, Optional, Any, Union, Tuple
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Optional, Any, Union, Tuple, Iterable, Iterator, Callable
 import json
+import time
 import numpy as np
 from datetime import datetime
 
@@ -173,6 +176,160 @@ class PineconeClient:
 
         return {'upsertedCount': upserted}
 
+    def upsert_pipeline(
+        self,
+        index_name: str,
+        vectors: Union[Iterable[Dict[str, Any]], np.ndarray],
+        ids: Optional[List[str]] = None,
+        metadata: Optional[List[Dict[str, Any]]] = None,
+        namespace: str = "",
+        batch_size: int = 100,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        retry_backoff: float = 1.0,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Upsert vectors with a bounded number of concurrent batch requests.
+
+        Batches are built lazily from the input, so arbitrarily large
+        iterators or arrays can be loaded without materialising every
+        request body up front. At most max_workers batches are in flight
+        at any time, over a session of their own whose connection pool
+        holds max_workers connections; it is closed when the pipeline ends,
+        and the client's session is left untouched.
+
+        Args:
+            index_name: Name of the index
+            vectors: Iterable of vector dicts (same structure as
+                upsert_vectors), or a 2-D NumPy array of values
+            ids: Vector IDs (required when vectors is a NumPy array)
+            metadata: Optional per-vector metadata for NumPy input
+            namespace: Namespace for the vectors
+            batch_size: Number of vectors per batch
+            max_workers: Maximum concurrent batch requests
+            max_retries: Retries per batch on 429/5xx or connection errors
+            retry_backoff: Base delay in seconds for exponential backoff
+            progress_callback: Called with throughput stats after each batch
+
+        Returns:
+            Upsert summary with upsertedCount, throughput and failed batches
+        """
+        url = f"https://{index_name}-{self.environment}.pinecone.io/vectors/upsert"
+
+        stats = {
+            'upsertedCount': 0,
+            'vectors': 0,
+            'bytes': 0,
+            'batches': 0,
+            'failedBatches': [],
+            'elapsed': 0.0,
+            'vectorsPerSecond': 0.0,
+            'bytesPerSecond': 0.0
+        }
+        started = time.monotonic()
+
+        def collect(future, batch_ids: List[str], size: int) -> None:
+            try:
+                result = future.result()
+                stats['upsertedCount'] += result.get('upsertedCount', 0)
+                stats['vectors'] += len(batch_ids)
+                stats['bytes'] += size
+            except requests.RequestException as e:
+                stats['failedBatches'].append({'ids': batch_ids, 'error': str(e)})
+            stats['batches'] += 1
+            elapsed = time.monotonic() - started
+            stats['elapsed'] = elapsed
+            if elapsed > 0:
+                stats['vectorsPerSecond'] = stats['vectors'] / elapsed
+                stats['bytesPerSecond'] = stats['bytes'] / elapsed
+            if progress_callback:
+                progress_callback(dict(stats))
+
+        in_flight = {}
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            session.headers.update(self.session.headers)
+            session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=max_workers))
+
+            for batch in self._iter_vector_batches(vectors, ids, metadata, batch_size):
+                body = json.dumps({'vectors': batch, 'namespace': namespace}).encode('utf-8')
+                future = executor.submit(
+                    self._post_with_retry, session, url, body, max_retries, retry_backoff
+                )
+                in_flight[future] = ([v['id'] for v in batch], len(body))
+
+                if len(in_flight) >= max_workers:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for finished in done:
+                        collect(finished, *in_flight.pop(finished))
+
+            for future in list(in_flight):
+                collect(future, *in_flight.pop(future))
+
+        return stats
+
+    def _iter_vector_batches(
+        self,
+        vectors: Union[Iterable[Dict[str, Any]], np.ndarray],
+        ids: Optional[List[str]],
+        metadata: Optional[List[Dict[str, Any]]],
+        batch_size: int
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Split vector dicts or a NumPy array into upsert batches."""
+        if isinstance(vectors, np.ndarray):
+            if ids is None or len(ids) != len(vectors):
+                raise ValueError("ids must be given for every row of a NumPy array")
+            for i in range(0, len(vectors), batch_size):
+                rows = vectors[i:i + batch_size].tolist()
+                batch = []
+                for j, row in enumerate(rows):
+                    vector = {'id': str(ids[i + j]), 'values': row}
+                    if metadata is not None:
+                        vector['metadata'] = metadata[i + j]
+                    batch.append(vector)
+                yield batch
+            return
+
+        batch = []
+        for vector in vectors:
+            values = vector.get('values')
+            if isinstance(values, np.ndarray):
+                vector = dict(vector, values=values.tolist())
+            batch.append(vector)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _post_with_retry(
+        self,
+        session: requests.Session,
+        url: str,
+        body: bytes,
+        max_retries: int,
+        retry_backoff: float
+    ) -> Dict[str, Any]:
+        """POST a pre-encoded body, retrying on 429/5xx and connection errors."""
+        attempt = 0
+        while True:
+            try:
+                response = session.post(url, data=body, timeout=self.timeout)
+                response.raise_for_status()
+                return response.json()
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                status = getattr(e.response, 'status_code', None)
+                retryable = status is None or status == 429 or status >= 500
+                if not retryable or attempt >= max_retries:
+                    raise
+                delay = retry_backoff * (2 ** attempt)
+                if e.response is not None:
+                    retry_after = e.response.headers.get('Retry-After', '')
+                    if retry_after.isdigit():
+                        delay = float(retry_after)
+                time.sleep(delay)
+                attempt += 1
+
     def query_vectors(
         self,
         index_name: str,
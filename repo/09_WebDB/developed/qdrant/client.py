@@ -5,7 +5,11 @@ This module provides a Python client for interacting with Qdrant vector database
 """
 
 import requests
-from typing import Dict, List, Optional, Any, Union
+import queue
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Union, Iterator, Tuple
 import json
 from datetime import datetime
 
@@ -22,6 +26,8 @@ class QdrantClient:
     - Distance metrics configuration
     """
 
+    UUID_SPACE = 1 << 128
+
     def __init__(
         self,
         api_key: str,
@@ -55,13 +61,26 @@ class QdrantClient:
         json_data=None
     ) -> Dict[str, Any]:
         """Make an authenticated request to the API."""
+        return self._send(self.session, method, endpoint, params=params, data=data, json_data=json_data)
+
+    def _send(
+        self,
+        session: requests.Session,
+        method: str,
+        endpoint: str,
+        params=None,
+        data=None,
+        json_data=None
+    ) -> Dict[str, Any]:
+        """Send a request on the given session; json_data may contain NumPy arrays."""
         url = f"{self.url}{endpoint}"
-        response = self.session.request(
+        if json_data is not None:
+            data = self._dumps(json_data)
+        response = session.request(
             method,
             url,
             params=params,
             data=data,
-            json=json_data,
             timeout=self.timeout
         )
 
@@ -74,6 +93,30 @@ class QdrantClient:
         except:
             return response.text if response.text else {}
 
+    @staticmethod
+    def _json_default(obj):
+        # NumPy arrays and scalars serialise via tolist(), which converts in C
+        if hasattr(obj, 'tolist'):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    @classmethod
+    def _dumps(cls, obj: Any) -> bytes:
+        """
+        Serialise a request body to compact JSON.
+
+        NumPy arrays are converted to nested lists by tolist() in C, but the
+        lists are still encoded by the standard json module, so encoding
+        large batches remains CPU-bound Python work.
+        """
+        return json.dumps(obj, separators=(',', ':'), default=cls._json_default).encode('utf-8')
+
+    def _new_session(self) -> requests.Session:
+        """Create a session with the same auth headers, for use in a worker thread."""
+        session = requests.Session()
+        session.headers.update(self.session.headers)
+        return session
+
     def get_collections(self) -> Dict[str, Any]:
         """Get all collections."""
         return self._request('GET', '/collections')
@@ -389,6 +432,294 @@ class QdrantClient:
 
         return self._request('POST', f'/collections/{collection_name}/points/scroll', json_data=data)
 
+    def iter_all_points(
+        self,
+        collection_name: str,
+        segments: int = 4,
+        page_size: int = 256,
+        with_payload: Union[bool, List[str]] = True,
+        with_vector: bool = False,
+        filter: Optional[Dict[str, Any]] = None,
+        max_buffered_pages: int = 16
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Export every point of a collection, scrolling ID-space segments concurrently.
+
+        Point IDs are split into segments: integer IDs evenly between the
+        smallest and the largest ID, UUIDs evenly over the UUID space. Each
+        segment is scrolled in its own thread, and points are yielded as
+        pages arrive, in no particular order. At most max_buffered_pages pages
+        are held in memory. The last segment is open-ended, so points added
+        beyond the probed range, or UUIDs after integer IDs, are still
+        exported.
+        """
+        bounds = self._segment_bounds(collection_name, segments, filter)
+        if not bounds:
+            return
+
+        pages: queue.Queue = queue.Queue(maxsize=max_buffered_pages)
+        stop = threading.Event()
+        done = object()
+
+        def put(item) -> bool:
+            """Queue item unless the consumer has stopped; never blocks for good."""
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker(start, end):
+            session = self._new_session()
+            try:
+                for page in self._scroll_segment(
+                    session, collection_name, start, end, page_size, with_payload, with_vector, filter
+                ):
+                    if not put(page):
+                        return
+                put(done)
+            except Exception as e:
+                put(e)
+            finally:
+                session.close()
+
+        threads = [
+            threading.Thread(target=worker, args=segment, daemon=True)
+            for segment in bounds
+        ]
+        for thread in threads:
+            thread.start()
+
+        remaining = len(threads)
+        try:
+            while remaining:
+                page = pages.get()
+                if page is done:
+                    remaining -= 1
+                elif isinstance(page, Exception):
+                    raise page
+                else:
+                    yield from page
+        finally:
+            stop.set()
+
+    def _scroll_segment(
+        self,
+        session: requests.Session,
+        collection_name: str,
+        start: Union[int, str],
+        end: Optional[Union[int, str]],
+        page_size: int,
+        with_payload: Union[bool, List[str]],
+        with_vector: bool,
+        filter: Optional[Dict[str, Any]]
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Scroll points with start <= id < end, one page at a time."""
+        offset = start
+        while offset is not None:
+            data = {
+                "limit": page_size,
+                "offset": offset,
+                "with_payload": with_payload,
+                "with_vector": with_vector
+            }
+            if filter:
+                data["filter"] = filter
+
+            result = self._send(
+                session, 'POST', f'/collections/{collection_name}/points/scroll', json_data=data
+            )['result']
+            points = result['points']
+            offset = result.get('next_page_offset')
+
+            if end is not None:
+                in_range = [point for point in points if self._id_before(point['id'], end)]
+                if len(in_range) < len(points) or (offset is not None and not self._id_before(offset, end)):
+                    offset = None
+                points = in_range
+
+            if points:
+                yield points
+
+    def _segment_bounds(
+        self,
+        collection_name: str,
+        segments: int,
+        filter: Optional[Dict[str, Any]]
+    ) -> List[Tuple[Union[int, str], Optional[Union[int, str]]]]:
+        """Split the ID space into (start, end) pairs; the last end is None."""
+        first = self._probe(collection_name, None, filter)
+        if first is None:
+            return []
+
+        if isinstance(first, str):
+            low = uuid.UUID(first).int
+            step = max((self.UUID_SPACE - low) // segments, 1)
+            starts = [str(uuid.UUID(int=low + i * step)) for i in range(segments) if low + i * step < self.UUID_SPACE]
+        else:
+            high = self._max_int_id(collection_name, first, filter)
+            step = max((high - first + 1) // segments, 1)
+            starts = sorted({min(first + i * step, high) for i in range(segments)})
+
+        return list(zip(starts, starts[1:] + [None]))
+
+    def _probe(
+        self,
+        collection_name: str,
+        offset: Optional[Union[int, str]],
+        filter: Optional[Dict[str, Any]]
+    ) -> Optional[Union[int, str]]:
+        """Return the first point ID at or after offset."""
+        data = {"limit": 1, "with_payload": False, "with_vector": False}
+        if offset is not None:
+            data["offset"] = offset
+        if filter:
+            data["filter"] = filter
+        points = self._request('POST', f'/collections/{collection_name}/points/scroll', json_data=data)['result']['points']
+        return points[0]['id'] if points else None
+
+    def _max_int_id(
+        self,
+        collection_name: str,
+        low: int,
+        filter: Optional[Dict[str, Any]]
+    ) -> int:
+        """Find the largest integer point ID with exponential then binary search."""
+        def has_int_at_or_after(value):
+            found = self._probe(collection_name, value, filter)
+            return isinstance(found, int)
+
+        step = 1
+        while has_int_at_or_after(low + step):
+            low += step
+            step *= 2
+        high = low + step
+        while high - low > 1:
+            middle = (low + high) // 2
+            if has_int_at_or_after(middle):
+                low = middle
+            else:
+                high = middle
+        return low
+
+    @staticmethod
+    def _id_before(point_id: Union[int, str], end: Union[int, str]) -> bool:
+        """Compare IDs in Qdrant order: integers sort before UUIDs."""
+        if isinstance(end, int):
+            return isinstance(point_id, int) and point_id < end
+        if isinstance(point_id, int):
+            return True
+        return uuid.UUID(point_id).int < uuid.UUID(end).int
+
+    def upsert_vectors(
+        self,
+        collection_name: str,
+        ids: Any,
+        vectors: Any,
+        payloads: Optional[List[Dict[str, Any]]] = None,
+        batch_size: int = 1000,
+        parallel: int = 1,
+        vector_name: Optional[str] = None,
+        precision: Optional[int] = None,
+        wait: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Upsert points from a 2-D NumPy array (or any sequence of vectors).
+
+        Points are sent in the column-oriented batch format, batch_size
+        points per request, with up to parallel requests in flight.
+        Vectors are converted with ndarray.tolist() in C, not per element in
+        Python. precision rounds components before encoding, which shrinks
+        float32 data that would otherwise serialise with float64 digits.
+        With parallel > 1 each worker thread gets its own session, closed
+        when the upsert ends.
+        """
+        if precision is not None:
+            import numpy as np
+            # Round in float64 so tolist() yields the short decimal, not float32 noise
+            vectors = np.round(np.asarray(vectors, dtype=np.float64), precision)
+
+        total = len(ids)
+        if len(vectors) != total or (payloads is not None and len(payloads) != total):
+            raise ValueError("ids, vectors and payloads must have the same length")
+
+        def send(start: int, session: requests.Session) -> Dict[str, Any]:
+            end = start + batch_size
+            batch_vectors = vectors[start:end]
+            batch = {
+                "ids": ids[start:end],
+                "vectors": {vector_name: batch_vectors} if vector_name else batch_vectors
+            }
+            if payloads is not None:
+                batch["payloads"] = payloads[start:end]
+            return self._send(
+                session, 'PUT', f'/collections/{collection_name}/points',
+                params={"wait": str(wait).lower()}, json_data={"batch": batch}
+            )
+
+        starts = range(0, total, batch_size)
+        if parallel <= 1:
+            return [send(start, self.session) for start in starts]
+
+        local = threading.local()
+        sessions: List[requests.Session] = []
+
+        def send_in_thread(start: int) -> Dict[str, Any]:
+            if not hasattr(local, 'session'):
+                local.session = self._new_session()
+                sessions.append(local.session)
+            return send(start, local.session)
+
+        try:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                return list(executor.map(send_in_thread, starts))
+        finally:
+            for session in sessions:
+                session.close()
+
+    def search_vectors(
+        self,
+        collection_name: str,
+        query_vectors: Any,
+        limit: int = 10,
+        with_payload: Union[bool, List[str]] = True,
+        with_vector: bool = False,
+        score_threshold: Optional[float] = None,
+        vector_name: Optional[str] = None,
+        filter: Optional[Dict[str, Any]] = None,
+        batch_size: int = 100
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for each row of a 2-D NumPy array of query vectors.
+
+        Queries go through the batch search endpoint, batch_size queries per
+        request. Returns one result list per query, in input order.
+        """
+        results = []
+        for start in range(0, len(query_vectors), batch_size):
+            searches = []
+            for query_vector in query_vectors[start:start + batch_size]:
+                search = {
+                    "vector": {"name": vector_name, "vector": query_vector} if vector_name else query_vector,
+                    "limit": limit,
+                    "with_payload": with_payload,
+                    "with_vector": with_vector
+                }
+                if score_threshold is not None:
+                    search["score_threshold"] = score_threshold
+                if filter:
+                    search["filter"] = filter
+                searches.append(search)
+
+            response = self._request(
+                'POST', f'/collections/{collection_name}/points/search/batch',
+                json_data={"searches": searches}
+            )
+            results.extend(response['result'])
+        return results
+
     def count(
         self,
         collection_name: str,
@@ -20,8 +20,9 @@ Authentication: Bot Token
 
 import aiohttp
 import asyncio
-from datetime import datetime
-from typing import Optional, Dict, Any, List
+import time
+from contextlib import asynccontextmanager
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass, field
 
 
@@ -112,13 +113,25 @@ class DiscordInvite:
     max_uses: int = 0
     uses: int = 0
     
+class _RateLimitBucket:
+    """State of one Discord rate limit bucket, fed from X-RateLimit-* headers."""
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+
+
 class DiscordBotClient:
     """
     Discord Bot API client for server management.
     """
 
     BASE_URL = "https://discord.com/api/v10"
-    RATE_LIMIT = 50  # requests per second (varies by endpoint)
+    RATE_LIMIT = 50  # global requests per second
+    MAX_RETRIES = 3  # retries after a 429 response
+    MAJOR_PARAMETERS = ("channels", "guilds", "webhooks")
 
     def __init__(self, bot_token: str):
         """
@@ -129,7 +142,11 @@ class DiscordBotClient:
         """
         self.bot_token = bot_token
         self.session = None
-        self._last_request_time = datetime.now()
+        self._global_reset_at = 0.0
+        self._window_start = 0.0
+        self._window_count = 0
+        self._route_buckets: Dict[Tuple[str, str, str], str] = {}
+        self._buckets: Dict[Any, _RateLimitBucket] = {}
         self._headers = {
             "Authorization": f"Bot {bot_token}",
             "Content-Type": "application/json"
@@ -143,16 +160,141 @@ class DiscordBotClient:
         if self.session:
             await self.session.close()
 
+    @classmethod
+    def _route_key(cls, method: str, endpoint: str) -> Tuple[str, str, str]:
+        """
+        Build the rate limit route of a request.
+
+        Discord scopes limits per route and major parameter (channel, guild or
+        webhook id), so the major id is kept and any other id is normalized.
+        """
+        segments = endpoint.split("?", 1)[0].strip("/").split("/")
+        major = ""
+        if len(segments) > 1 and segments[0] in cls.MAJOR_PARAMETERS:
+            major_length = 3 if segments[0] == "webhooks" and len(segments) > 2 else 2
+            major = "/".join(segments[:major_length])
+            rest = segments[major_length:]
+        else:
+            rest = segments
+        path = "/".join(":id" if segment.isdigit() else segment for segment in rest)
+        return method.upper(), path, major
+
+    def _get_bucket(self, route: Tuple[str, str, str]) -> _RateLimitBucket:
+        """Return the bucket a route currently maps to."""
+        key = self._route_buckets.get(route, route)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _RateLimitBucket()
+        return bucket
+
     async def _check_rate_limit(self):
-        """Check and enforce rate limiting"""
-        now = datetime.now()
-        time_since_last = (now - self._last_request_time).total_seconds()
+        """Wait for the global limit: a pending global 429 and RATE_LIMIT requests per second."""
+        while True:
+            now = time.monotonic()
+            if now < self._global_reset_at:
+                await asyncio.sleep(self._global_reset_at - now)
+                continue
 
-        if time_since_last < (1.0 / self.RATE_LIMIT):
-            wait_time = (1.0 / self.RATE_LIMIT) - time_since_last
-            await asyncio.sleep(wait_time)
+            if now - self._window_start >= 1.0:
+                self._window_start = now
+                self._window_count = 0
 
-        self._last_request_time = datetime.now()
+            if self._window_count < self.RATE_LIMIT:
+                self._window_count += 1
+                return
+
+            await asyncio.sleep(self._window_start + 1.0 - now)
+
+    @asynccontextmanager
+    async def _rate_limit_slot(self, method: str, endpoint: str):
+        """
+        Reserve a request in the bucket of a route.
+
+        Requests queue on the bucket lock. Once the bucket is known, the lock is
+        released as soon as a slot is reserved, so up to `remaining` requests run
+        in parallel. The first request of an unknown bucket holds the lock until
+        its response headers have been recorded.
+        """
+        route = self._route_key(method, endpoint)
+        while True:
+            bucket = self._get_bucket(route)
+            await bucket.lock.acquire()
+            # The route may have been mapped to its real bucket while queued
+            if self._get_bucket(route) is bucket:
+                break
+            bucket.lock.release()
+        held = True
+        try:
+            if bucket.remaining is not None:
+                now = time.monotonic()
+                if bucket.remaining <= 0 and now < bucket.reset_at:
+                    await asyncio.sleep(bucket.reset_at - now)
+                if time.monotonic() >= bucket.reset_at:
+                    bucket.remaining = bucket.limit
+            if bucket.remaining is not None:
+                bucket.remaining -= 1
+                bucket.lock.release()
+                held = False
+
+            await self._check_rate_limit()
+            yield route
+        finally:
+            if held:
+                bucket.lock.release()
+
+    @staticmethod
+    def _header_number(headers, name: str) -> Optional[float]:
+        value = headers.get(name)
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    def _update_rate_limits(self, route: Tuple[str, str, str], headers) -> None:
+        """Record the X-RateLimit-* headers of a response against its bucket."""
+        bucket_hash = headers.get("X-RateLimit-Bucket")
+        limit = self._header_number(headers, "X-RateLimit-Limit")
+        remaining = self._header_number(headers, "X-RateLimit-Remaining")
+        reset_after = self._header_number(headers, "X-RateLimit-Reset-After")
+        if not bucket_hash or limit is None or remaining is None or reset_after is None:
+            return
+
+        key = f"{bucket_hash}:{route[2]}"
+        self._route_buckets[route] = key
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _RateLimitBucket()
+
+        reset_at = time.monotonic() + reset_after
+        # Responses of concurrent requests can arrive out of order: within the
+        # same window keep the lower count, since local reservations already
+        # account for requests still in flight.
+        if bucket.remaining is None or reset_at > bucket.reset_at + 0.5:
+            bucket.remaining = int(remaining)
+        else:
+            bucket.remaining = min(bucket.remaining, int(remaining))
+        bucket.limit = int(limit)
+        bucket.reset_at = max(bucket.reset_at, reset_at)
+
+    def _handle_rate_limited(self, route: Tuple[str, str, str], headers, result: Any) -> float:
+        """Block the bucket, or every request on a global 429. Returns the retry delay."""
+        body = result if isinstance(result, dict) else {}
+        retry_after = body.get("retry_after")
+        if retry_after is None:
+            retry_after = self._header_number(headers, "Retry-After")
+        retry_after = float(retry_after) if retry_after is not None else 1.0
+        reset_at = time.monotonic() + retry_after
+
+        if body.get("global") or headers.get("X-RateLimit-Global"):
+            self._global_reset_at = max(self._global_reset_at, reset_at)
+        else:
+            self._update_rate_limits(route, headers)
+            bucket = self._get_bucket(route)
+            bucket.remaining = 0
+            bucket.reset_at = max(bucket.reset_at, reset_at)
+        return retry_after
 
     async def _make_request(
         self,
@@ -161,28 +303,35 @@ class DiscordBotClient:
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Make API request with rate limiting."""
-        await self._check_rate_limit()
-
+        """Make API request with per-route and global rate limiting."""
         url = f"{self.BASE_URL}{endpoint}"
 
-        async with self.session.request(
-            method,
-            url,
-            headers=self._headers,
-            json=data,
-            params=params
-        ) as response:
-            try:
-                result = await response.json()
-            except:
-                result = {}
-
-            if response.status not in [200, 201, 204]:
-                error_msg = result.get("message", result.get("error", "Unknown error"))
-                raise Exception(f"Discord API error: {response.status} - {error_msg}")
-
-            return result
+        for attempt in range(self.MAX_RETRIES + 1):
+            async with self._rate_limit_slot(method, endpoint) as route:
+                async with self.session.request(
+                    method,
+                    url,
+                    headers=self._headers,
+                    json=data,
+                    params=params
+                ) as response:
+                    try:
+                        result = await response.json()
+                    except:
+                        result = {}
+
+                    if response.status == 429:
+                        self._handle_rate_limited(route, response.headers, result)
+                        if attempt < self.MAX_RETRIES:
+                            continue
+                    else:
+                        self._update_rate_limits(route, response.headers)
+
+                    if response.status not in [200, 201, 204]:
+                        error_msg = result.get("message", result.get("error", "Unknown error"))
+                        raise Exception(f"Discord API error: {response.status} - {error_msg}")
+
+                    return result
 
     async def send_message(
         self,
@@ -218,7 +367,6 @@ class DiscordBotClient:
         content: Optional[str] = None
     ) -> DiscordMessage:
         """Send a file with optional content to a channel."""
-        await self._check_rate_limit()
         url = f"{self.BASE_URL}/channels/{channel_id}/messages"
         
         data = aiohttp.FormData()
@@ -232,18 +380,25 @@ class DiscordBotClient:
             
         data.add_field('files[0]', file_data, filename=filename)
 
-        async with self.session.post(url, headers={"Authorization": f"Bot {self.bot_token}"}, data=data) as response:
-            try:
-                result = await response.json()
-            except:
-                result = {}
-
-            if response.status not in [200, 201]:
-                error_msg = result.get("message", result.get("error", "Unknown error"))
-                raise Exception(f"Discord API error: {response.status} - {error_msg}")
-
-            msg_fields = {k: v for k, v in result.items() if k in DiscordMessage.__annotations__}
-            return DiscordMessage(**msg_fields)
+        endpoint = f"/channels/{channel_id}/messages"
+        async with self._rate_limit_slot("POST", endpoint) as route:
+            async with self.session.post(url, headers={"Authorization": f"Bot {self.bot_token}"}, data=data) as response:
+                try:
+                    result = await response.json()
+                except:
+                    result = {}
+
+                if response.status == 429:
+                    self._handle_rate_limited(route, response.headers, result)
+                else:
+                    self._update_rate_limits(route, response.headers)
+
+                if response.status not in [200, 201]:
+                    error_msg = result.get("message", result.get("error", "Unknown error"))
+                    raise Exception(f"Discord API error: {response.status} - {error_msg}")
+
+                msg_fields = {k: v for k, v in result.items() if k in DiscordMessage.__annotations__}
+                return DiscordMessage(**msg_fields)
 
     async def download_message_file(self, url: str, save_path: str) -> str:
         """Download a file from a message attachment URL."""
@@ -1,7 +1,8 @@
+import asyncio
 import os
+import time
 import pytest
 import pytest_asyncio
-from datetime import datetime
 
 from client import DiscordBotClient
 
@@ -166,16 +167,113 @@ def test_handle_webhook_guild_member_add():
     assert result["member"].user["username"] == "NewUser"
     assert result["guild_id"] == GUILD_ID
 
+class FakeResponse:
+    """aiohttp のレスポンスを模したテスト用オブジェクト"""
+
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body if body is not None else {}
+
+    async def json(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeSession:
+    """決められた順にレスポンスを返し、呼び出し時刻を記録するセッション"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, time.monotonic()))
+        return self.responses.pop(0)
+
+
+def bucket_headers(bucket, remaining, reset_after, limit=5):
+    return {
+        "X-RateLimit-Bucket": bucket,
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset-After": str(reset_after),
+    }
+
+
+def test_rate_limit_bucket_mapping():
+    """X-RateLimit-Bucket によりルートが共有バケットへ対応付けられること"""
+    client_instance = DiscordBotClient("dummy_token")
+    messages = client_instance._route_key("GET", f"/channels/{CHANNEL_ID}/messages")
+    message = client_instance._route_key("GET", f"/channels/{CHANNEL_ID}/messages/123")
+    other_channel = client_instance._route_key("GET", "/channels/42/messages")
+
+    # メジャーパラメータ (チャンネルID) は保持され、それ以外のIDは正規化される
+    assert messages == ("GET", "messages", f"channels/{CHANNEL_ID}")
+    assert message == ("GET", "messages/:id", f"channels/{CHANNEL_ID}")
+
+    # 未知のルートはそれぞれ別のバケット
+    assert client_instance._get_bucket(messages) is not client_instance._get_bucket(message)
+
+    client_instance._update_rate_limits(messages, bucket_headers("abc", 4, 1))
+    client_instance._update_rate_limits(message, bucket_headers("abc", 3, 1))
+    client_instance._update_rate_limits(other_channel, bucket_headers("abc", 4, 1))
+
+    # 同じバケットハッシュ・同じチャンネルなら同じバケットを共有する
+    shared = client_instance._get_bucket(messages)
+    assert client_instance._get_bucket(message) is shared
+    assert shared.limit == 5
+    assert shared.remaining == 3
+    # チャンネルが違えばバケットハッシュが同じでも別バケット
+    assert client_instance._get_bucket(other_channel) is not shared
+
+
 @pytest.mark.asyncio
-async def test_rate_limit(client):
-    """内部の _check_rate_limit メソッドが正常に動作し、待機処理に問題がないかテスト"""
-    client._last_request_time = datetime.now()
-    client.RATE_LIMIT = 50 # 1秒あたり50リクエスト
-    
-    # time_since_lastが短いため、内部でasyncio.sleepが発生するが、例外が起きずに通過するはず
-    await client._check_rate_limit()
-    
-    assert True # 例外が発生しなければパス
+async def test_rate_limit_waits_when_bucket_exhausted():
+    """remaining=0 のバケットはリセットまでリクエストを待機させること"""
+    client_instance = DiscordBotClient("dummy_token")
+    endpoint = f"/channels/{CHANNEL_ID}/messages"
+    client_instance.session = FakeSession([
+        FakeResponse(200, {"id": "1"}, bucket_headers("abc", 0, 0.3)),
+        FakeResponse(200, {"id": "2"}, bucket_headers("abc", 4, 1)),
+    ])
+
+    await client_instance._make_request("POST", endpoint, data={"content": "a"})
+    result = await client_instance._make_request("POST", endpoint, data={"content": "b"})
+
+    first, second = client_instance.session.calls
+    assert result == {"id": "2"}
+    assert second[2] - first[2] >= 0.25
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_global_429():
+    """グローバル 429 では retry_after だけ全ルートを止めてから再試行すること"""
+    client_instance = DiscordBotClient("dummy_token")
+    client_instance.session = FakeSession([
+        FakeResponse(429, {"message": "You are being rate limited.", "retry_after": 0.3, "global": True},
+                     {"X-RateLimit-Global": "true", "Retry-After": "1"}),
+        FakeResponse(200, {"id": GUILD_ID}),
+        FakeResponse(200, {"id": USER_ID}),
+    ])
+
+    started = time.monotonic()
+    guild_task = asyncio.create_task(client_instance._make_request("GET", f"/guilds/{GUILD_ID}"))
+    await asyncio.sleep(0.05)
+    # 別ルートのリクエストもグローバル制限の解除を待つ
+    user_result = await client_instance._make_request("GET", f"/users/{USER_ID}")
+    guild_result = await guild_task
+
+    assert {guild_result["id"], user_result["id"]} == {GUILD_ID, USER_ID}
+    assert client_instance._global_reset_at > started
+    retries = client_instance.session.calls[1:]
+    assert all(call[2] - started >= 0.25 for call in retries)
+
 
 @pytest.mark.asyncio
 async def test_optional_parameters_and_exceptions(client):
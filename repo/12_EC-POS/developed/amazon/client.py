@@ -6,12 +6,27 @@ Documentation: https://developer.amazon.com/
 """
 
 import os
+import csv
+import time
+import zlib
+import base64
+import codecs
 import requests
 import hashlib
 import hmac
 import urllib.parse
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Callable, Iterator, Iterable
+
+
+# SP-API default rate limits per operation: (requests per second, burst)
+SP_RATE_LIMITS = {
+    "getOrders": (0.0167, 20),
+    "getOrder": (0.5, 30),
+    "getOrderItems": (0.5, 30),
+    "getReport": (2.0, 15),
+    "getReportDocument": (0.0167, 15),
+}
 
 
 class AmazonClient:
@@ -61,6 +76,7 @@ class AmazonClient:
         self.verify_ssl = verify_ssl
         
         self.session = requests.Session()
+        self._sp_buckets: Dict[str, List[float]] = {}
         
         # Region endpoints
         self.endpoints = {
@@ -68,6 +84,23 @@ class AmazonClient:
             "EU": ("https://mws-eu.amazonservices.com", "https://sellingpartnerapi-eu.amazon.com"),
             "FE": ("https://mws-fe.amazonservices.com", "https://sellingpartnerapi-fe.amazon.com")
         }
+        
+        # Parts of the MWS signature that do not change between calls
+        self._mws_endpoint, _ = self.endpoints.get(self.region, self.endpoints["US"])
+        self._mws_host = urllib.parse.urlparse(self._mws_endpoint).netloc
+        self._mws_static_params = {
+            "AWSAccessKeyId": self.access_key,
+            "SellerId": self.seller_id,
+            "SignatureVersion": "2",
+            "SignatureMethod": "HmacSHA256",
+            "Version": "2013-09-01"
+        }
+        if self.marketplace_id:
+            self._mws_static_params["MarketplaceId"] = self.marketplace_id
+        self._mws_hmac = (
+            hmac.new(self.secret_key.encode(), digestmod=hashlib.sha256)
+            if self.secret_key else None
+        )
     
     def _sign_mws_request(
         self,
@@ -78,60 +111,68 @@ class AmazonClient:
     ) -> str:
         """
         Sign MWS request with AWS signature.
-        """
-        # Add standard params
-        timestamp = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-        params.update({
-            "AWSAccessKeyId": self.access_key,
-            "Action": action,
-            "SellerId": self.seller_id,
-            "SignatureVersion": "2",
-            "SignatureMethod": "HmacSHA256",
-            "Timestamp": timestamp,
-            "Version": "2013-09-01"
-        })
         
-        if self.marketplace_id:
-            params["MarketplaceId"] = self.marketplace_id
+        The timestamp makes every signature unique, so only the static
+        parameters, host and HMAC key are prepared once in __init__.
+        """
+        signed_params = dict(self._mws_static_params)
+        signed_params.update(params)
+        signed_params["Action"] = action
+        signed_params["Timestamp"] = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
         
         # Sort parameters
-        sorted_params = sorted(params.items())
-        query_string = "&".join([f"{k}={urllib.parse.quote(str(v), safe='')}" for k, v in sorted_params])
+        query_string = "&".join(
+            f"{k}={urllib.parse.quote(str(v), safe='')}"
+            for k, v in sorted(signed_params.items())
+        )
         
         # Create canonical string
-        canonical = f"{method}\n{urllib.parse.urlparse(endpoint).netloc}\n/\n{query_string}"
+        host = self._mws_host if endpoint == self._mws_endpoint else urllib.parse.urlparse(endpoint).netloc
+        canonical = f"{method}\n{host}\n/\n{query_string}"
         
         # Sign
-        signature = hmac.new(
-            self.secret_key.encode(),
-            canonical.encode(),
-            hashlib.sha256
-        ).digest()
+        mac = self._mws_hmac.copy()
+        mac.update(canonical.encode())
+        signature = base64.b64encode(mac.digest()).decode()
         
         encoded_signature = urllib.parse.quote(signature, safe='')
         
         return f"{endpoint}?{query_string}&Signature={encoded_signature}"
     
-    def _mws_request(
+    def _mws_send(
         self,
         action: str,
         params: Dict[str, str],
-        method: str = "POST"
-    ) -> Dict[str, Any]:
+        method: str = "POST",
+        stream: bool = False
+    ) -> requests.Response:
         """
-        Make MWS request.
+        Send a signed MWS request and return the raw response.
         """
-        mws_endpoint, _ = self.endpoints.get(self.region, self.endpoints["US"])
+        signed_url = self._sign_mws_request(self._mws_endpoint, action, params, method)
         
-        signed_url = self._sign_mws_request(mws_endpoint, action, params, method)
-        
-        response = self.session.get(
+        response = self.session.request(
+            method,
             signed_url,
             timeout=self.timeout,
-            verify=self.verify_ssl
+            verify=self.verify_ssl,
+            stream=stream
         )
         response.raise_for_status()
         
+        return response
+    
+    def _mws_request(
+        self,
+        action: str,
+        params: Dict[str, str],
+        method: str = "POST"
+    ) -> Dict[str, Any]:
+        """
+        Make MWS request.
+        """
+        response = self._mws_send(action, params, method)
+        
         return response.text if response.text else {}
     
     # ============================================================================
@@ -324,10 +365,91 @@ class AmazonClient:
     def get_report(self, report_id: str) -> str:
         """
         Get report content.
+        
+        Loads the whole report into memory; use iter_report_rows for large reports.
         """
         params = {"ReportId": report_id}
         return self._mws_request("GetReport", params)
     
+    def iter_report_rows(
+        self,
+        report_id: str,
+        delimiter: str = "\t",
+        column_types: Optional[Dict[str, Callable[[str], Any]]] = None,
+        encoding: str = "utf-8"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream an MWS report and parse it row by row.
+        
+        Args:
+            report_id: Report ID
+            delimiter: Column delimiter ("\t" for flat files, "," for CSV)
+            column_types: Converters per column, e.g. {"quantity": int, "price": float}
+            encoding: Report text encoding
+            
+        Yields:
+            One dict per row, keyed by the header row
+        """
+        response = self._mws_send("GetReport", {"ReportId": report_id}, stream=True)
+        # Content-Encoding gzip is already decoded by iter_content
+        yield from self._parse_report_rows(
+            self._iter_report_lines(response, None, encoding),
+            delimiter,
+            column_types
+        )
+    
+    def _iter_report_lines(
+        self,
+        response: requests.Response,
+        compression: Optional[str] = None,
+        encoding: str = "utf-8",
+        chunk_size: int = 1024 * 1024
+    ) -> Iterator[str]:
+        """
+        Decode a streamed report body into lines without holding it in memory.
+        
+        GZIP documents are inflated chunk by chunk. Content-Encoding gzip is
+        already handled by urllib3, so only explicit compression is inflated here.
+        """
+        inflater = zlib.decompressobj(16 + zlib.MAX_WBITS) if compression == "GZIP" else None
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        pending = ""
+        
+        with response:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if inflater is not None:
+                    chunk = inflater.decompress(chunk)
+                pending += decoder.decode(chunk)
+                # The last piece may continue in the next chunk
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    yield line + "\n"
+            
+            if inflater is not None:
+                pending += decoder.decode(inflater.flush())
+            pending += decoder.decode(b"", final=True)
+            if pending:
+                yield pending
+    
+    @staticmethod
+    def _parse_report_rows(
+        lines: Iterable[str],
+        delimiter: str,
+        column_types: Optional[Dict[str, Callable[[str], Any]]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Parse report lines into dicts, converting typed columns (empty values become None)."""
+        quoting = csv.QUOTE_NONE if delimiter == "\t" else csv.QUOTE_MINIMAL
+        reader = csv.DictReader(lines, delimiter=delimiter, quoting=quoting)
+        converters = column_types or {}
+        
+        for row in reader:
+            for column, convert in converters.items():
+                value = row.get(column)
+                if value is None:
+                    continue
+                row[column] = convert(value) if value != "" else None
+            yield row
+    
     # ============================================================================
     # Feeds (MWS)
     # ============================================================================
@@ -401,51 +523,199 @@ class AmazonClient:
     # SP-API (Selling Partner API) Basic Support
     # ============================================================================
     
+    def _sp_wait(self, operation: str) -> None:
+        """
+        Wait for a token of the operation's rate limit bucket.
+        
+        Each SP-API operation has its own rate and burst (SP_RATE_LIMITS,
+        updated from the x-amzn-RateLimit-Limit response header).
+        """
+        rate, burst = SP_RATE_LIMITS.get(operation, (1.0, 1))
+        bucket = self._sp_buckets.get(operation)
+        now = time.monotonic()
+        if bucket is None:
+            bucket = self._sp_buckets[operation] = [float(burst), now, rate, float(burst)]
+        
+        tokens, last, rate, burst = bucket
+        tokens = min(burst, tokens + (now - last) * rate)
+        if tokens < 1:
+            time.sleep((1 - tokens) / rate)
+            now = time.monotonic()
+            tokens = 1.0
+        bucket[0], bucket[1] = tokens - 1, now
+    
     def _sp_request(
         self,
         endpoint: str,
         method: str = "GET",
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        operation: Optional[str] = None,
+        max_retries: int = 5
     ) -> Dict[str, Any]:
         """
         Make SP-API request.
+        
+        With an operation name the request is paced by that operation's rate
+        limit, and 429 responses are retried with exponential backoff.
         """
         _, sp_endpoint = self.endpoints.get(self.region, self.endpoints["US"])
         url = f"{sp_endpoint}{endpoint}"
         
-        headers = {
-            "Authorization": f"Bearer {self.sp_api_token}",
-            "x-amz-date": datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
-            "Content-Type": "application/json"
-        }
+        for attempt in range(max_retries + 1):
+            if operation:
+                self._sp_wait(operation)
+            
+            headers = {
+                "Authorization": f"Bearer {self.sp_api_token}",
+                "x-amz-access-token": self.sp_api_token,
+                "x-amz-date": datetime.utcnow().strftime("%Y%m%dT%H%M%SZ"),
+                "Content-Type": "application/json"
+            }
+            
+            response = self.session.request(
+                method=method,
+                url=url,
+                json=data,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                verify=self.verify_ssl
+            )
+            
+            if operation:
+                self._update_sp_rate(operation, response.headers.get("x-amzn-RateLimit-Limit"))
+            
+            if response.status_code == 429 and attempt < max_retries:
+                time.sleep(min(2 ** attempt, 60))
+                continue
+            
+            response.raise_for_status()
+            return response.json()
         
-        response = self.session.request(
-            method=method,
-            url=url,
-            json=data,
-            headers=headers,
-            timeout=self.timeout,
-            verify=self.verify_ssl
-        )
         response.raise_for_status()
-        
         return response.json()
     
+    def _update_sp_rate(self, operation: str, rate_limit: Optional[str]) -> None:
+        """Adopt the rate Amazon reports for this seller and operation."""
+        bucket = self._sp_buckets.get(operation)
+        if not rate_limit or bucket is None:
+            return
+        try:
+            rate = float(rate_limit)
+        except ValueError:
+            return
+        if rate > 0:
+            bucket[2] = rate
+    
     def get_orders_sp(
         self,
         created_after: str,
         marketplace_ids: List[str],
-        order_statuses: Optional[List[str]] = None
+        order_statuses: Optional[List[str]] = None,
+        next_token: Optional[str] = None,
+        max_results_per_page: int = 100
     ) -> Dict[str, Any]:
         """
-        Get orders via Selling Partner API.
+        Get one page of orders via Selling Partner API.
+        
+        Args:
+            created_after: Orders created after this date (ISO 8601)
+            marketplace_ids: Marketplace IDs
+            order_statuses: Filter by order statuses
+            next_token: NextToken from the previous page
+            max_results_per_page: Page size (max 100)
         """
         params = {
-            "createdAfter": created_after,
-            "marketplaceIds": marketplace_ids
+            "CreatedAfter": created_after,
+            "MarketplaceIds": ",".join(marketplace_ids),
+            "MaxResultsPerPage": min(max_results_per_page, 100)
         }
         
         if order_statuses:
-            params["orderStatuses"] = order_statuses
+            params["OrderStatuses"] = ",".join(order_statuses)
+        if next_token:
+            params["NextToken"] = next_token
         
-        return self._sp_request("/orders/v0/orders", params=urllib.parse.urlencode(params))
\ No newline at end of file
+        return self._sp_request("/orders/v0/orders", params=params, operation="getOrders")
+    
+    def iter_orders_sp(
+        self,
+        created_after: str,
+        marketplace_ids: List[str],
+        order_statuses: Optional[List[str]] = None,
+        max_results_per_page: int = 100
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all orders, following NextToken.
+        
+        Pages are fetched at the getOrders rate limit, so long backfills run
+        at the allowed rate instead of failing with 429.
+        
+        Yields:
+            Order dicts
+        """
+        next_token = None
+        while True:
+            response = self.get_orders_sp(
+                created_after,
+                marketplace_ids,
+                order_statuses,
+                next_token=next_token,
+                max_results_per_page=max_results_per_page
+            )
+            payload = response.get("payload", {})
+            yield from payload.get("Orders", [])
+            
+            next_token = payload.get("NextToken")
+            if not next_token:
+                break
+    
+    def get_report_document_sp(self, report_document_id: str) -> Dict[str, Any]:
+        """
+        Get the download URL and compression of a report document.
+        """
+        return self._sp_request(
+            f"/reports/2021-06-30/documents/{report_document_id}",
+            operation="getReportDocument"
+        )
+    
+    def iter_report_document_rows(
+        self,
+        report_document_id: str,
+        delimiter: str = "\t",
+        column_types: Optional[Dict[str, Callable[[str], Any]]] = None,
+        encoding: str = "utf-8"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream an SP-API report document and parse it row by row.
+        
+        The document is downloaded in chunks, GZIP documents are inflated on
+        the fly, and rows are yielded as soon as they are complete, so memory
+        stays flat for reports of any size.
+        
+        Args:
+            report_document_id: Report document ID
+            delimiter: Column delimiter ("\t" for flat files, "," for CSV)
+            column_types: Converters per column, e.g. {"quantity": int, "price": float}
+            encoding: Report text encoding (e.g. "cp1252" for some settlement reports)
+            
+        Yields:
+            One dict per row, keyed by the header row
+        """
+        document = self.get_report_document_sp(report_document_id)
+        
+        # Pre-signed URL: sent without SP-API credentials
+        response = requests.get(
+            document["url"],
+            stream=True,
+            timeout=self.timeout,
+            verify=self.verify_ssl
+        )
+        response.raise_for_status()
+        
+        yield from self._parse_report_rows(
+            self._iter_report_lines(response, document.get("compressionAlgorithm"), encoding),
+            delimiter,
+            column_types
+        )
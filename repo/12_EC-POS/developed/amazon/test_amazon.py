@@ -0,0 +1,73 @@
+"""
+Amazon client report streaming tests
+Run with: python -m pytest test_amazon.py
+"""
+
+import gzip
+import io
+from unittest.mock import patch
+
+import requests
+from urllib3.response import HTTPResponse
+
+from client import AmazonClient
+
+
+REPORT = "sku\tquantity\tprice\n" + "A-1\t3\t9.99\nB-2\t\t12.50\n" * 1000
+
+
+def streamed_response(body: bytes, headers: dict) -> requests.Response:
+    """Build a streaming response whose body is decoded by urllib3 like a real one."""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers.update(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        status=200,
+        preload_content=False,
+        decode_content=True
+    )
+    return response
+
+
+def make_client() -> AmazonClient:
+    return AmazonClient(seller_id="SELLER", access_key="KEY", secret_key="SECRET", marketplace_id="MARKET")
+
+
+def test_iter_report_rows_gzip_content_encoding():
+    """A gzip Content-Encoding is decoded by the transport and must not be inflated again."""
+    client = make_client()
+    response = streamed_response(gzip.compress(REPORT.encode()), {"Content-Encoding": "gzip"})
+
+    with patch.object(client, "_mws_send", return_value=response):
+        rows = list(client.iter_report_rows("REPORT", column_types={"quantity": int}))
+
+    assert len(rows) == 2000
+    assert rows[0] == {"sku": "A-1", "quantity": 3, "price": "9.99"}
+    assert rows[1] == {"sku": "B-2", "quantity": None, "price": "12.50"}
+
+
+def test_iter_report_rows_plain():
+    client = make_client()
+    response = streamed_response(REPORT.encode(), {})
+
+    with patch.object(client, "_mws_send", return_value=response):
+        rows = list(client.iter_report_rows("REPORT"))
+
+    assert len(rows) == 2000
+    assert rows[-1]["sku"] == "B-2"
+
+
+def test_report_document_gzip_compression():
+    """SP-API documents with compressionAlgorithm GZIP are inflated by the client."""
+    client = make_client()
+    response = streamed_response(gzip.compress(REPORT.encode()), {})
+    document = {"url": "https://example.com/report", "compressionAlgorithm": "GZIP"}
+
+    with patch.object(client, "get_report_document_sp", return_value=document), \
+            patch("client.requests.get", return_value=response):
+        rows = list(client.iter_report_document_rows("DOC"))
+
+    assert len(rows) == 2000
+    assert rows[0]["price"] == "9.99"
@@ -2,7 +2,7 @@
 shopify - EC/POS Integration for Yoom Apps
 """
 
-from .client import ShopifyClient
+from .client import ShopifyClient, BulkRecord
 
 __version__ = "1.0.0"
-__all__ = ["ShopifyClient"]
+__all__ = ["ShopifyClient", "BulkRecord"]
@@ -4,11 +4,23 @@ Shopify Store API documentation: https://shopify.dev/api/admin-rest
 """
 
 import os
+import json
+import time
 import requests
-from typing import Optional, Dict, List, Any
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Any, Iterator
 from urllib.parse import urljoin
 
 
+@dataclass
+class BulkRecord:
+    """One line of a GraphQL bulk operation result."""
+    type: str
+    id: Optional[str]
+    parent_id: Optional[str]
+    data: Dict[str, Any]
+
+
 class ShopifyClient:
     """
     Complete client for Shopify Admin REST API.
@@ -23,7 +35,10 @@ class ShopifyClient:
         access_token: Optional[str] = None,
         version: str = "2024-01",
         timeout: int = 30,
-        verify_ssl: bool = True
+        verify_ssl: bool = True,
+        leak_rate: float = 2.0,
+        call_limit_headroom: int = 4,
+        max_retries: int = 5
     ):
         """
         Initialize Shopify client.
@@ -36,6 +51,10 @@ class ShopifyClient:
             version: API version
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            leak_rate: Requests per second the call limit bucket drains
+                (2 for standard stores, 20 for Shopify Plus)
+            call_limit_headroom: Calls to keep free in the bucket before pacing
+            max_retries: Retries after a 429 response
             
         Environment variables:
             SHOPIFY_STORE_NAME: Your store name (e.g., "mystore" from mystore.myshopify.com)
@@ -50,6 +69,9 @@ class ShopifyClient:
         self.version = version
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.leak_rate = leak_rate
+        self.call_limit_headroom = call_limit_headroom
+        self.max_retries = max_retries
         
         if not self.store_name:
             raise ValueError(
@@ -90,28 +112,97 @@ class ShopifyClient:
         """
         Make HTTP request to Shopify API.
         """
-        url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        response = self._send(method, endpoint, data=data, params=params, headers=headers)
         
-        session_headers = dict(self.session.headers)
-        if headers:
-            session_headers.update(headers)
+        if response.status_code == 204:
+            return {}
         
-        response = self.session.request(
-            method=method,
-            url=url,
-            json=data,
-            params=params,
-            headers=session_headers,
-            timeout=self.timeout,
-            verify=self.verify_ssl
-        )
+        return response.json()
+    
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """
+        Send a request paced by the call limit bucket, retrying on 429.
+        
+        Session headers are merged by requests itself, so only per-call
+        headers are passed. Absolute URLs (Link header pages) are used as-is.
+        """
+        if endpoint.startswith("https://"):
+            url = endpoint
+        else:
+            url = urljoin(self.base_url + "/", endpoint.lstrip("/"))
+        
+        for attempt in range(self.max_retries + 1):
+            response = self.session.request(
+                method=method,
+                url=url,
+                json=data,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+                verify=self.verify_ssl
+            )
+            
+            if response.status_code == 429 and attempt < self.max_retries:
+                retry_after = response.headers.get("Retry-After")
+                try:
+                    delay = float(retry_after) if retry_after else 2.0
+                except ValueError:
+                    delay = 2.0
+                time.sleep(delay)
+                continue
+            
+            response.raise_for_status()
+            self._pace(response)
+            return response
         
         response.raise_for_status()
+        return response
+    
+    def _pace(self, response: requests.Response) -> None:
+        """
+        Sleep when the leaky bucket is nearly full.
         
-        if response.status_code == 204:
-            return {}
+        X-Shopify-Shop-Api-Call-Limit reports "used/size"; the bucket drains at
+        leak_rate calls per second, so wait until call_limit_headroom calls are free.
+        """
+        call_limit = response.headers.get("X-Shopify-Shop-Api-Call-Limit")
+        if not call_limit:
+            return
         
-        return response.json()
+        try:
+            used, size = (int(part) for part in call_limit.split("/", 1))
+        except ValueError:
+            return
+        
+        excess = used - (size - self.call_limit_headroom)
+        if excess > 0:
+            time.sleep(excess / self.leak_rate)
+    
+    def _paginate(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield records from every page of a list endpoint.
+        
+        Follows the Link: rel="next" header. The next URL already carries
+        page_info and limit, and filters may not be repeated with page_info.
+        """
+        url: Optional[str] = endpoint
+        while url:
+            response = self._send("GET", url, params=params)
+            yield from response.json().get(key, [])
+            url = response.links.get("next", {}).get("url")
+            params = None
     
     # ============================================================================
     # Products
@@ -172,6 +263,22 @@ class ShopifyClient:
         
         return self._request("GET", "products.json", params=params)
     
+    def iter_products(self, limit: int = 250, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all products, following Link header pagination.
+        
+        Args:
+            limit: Page size (max 250)
+            **filters: Query filters as accepted by list_products
+                (e.g. status="active", vendor="MyBrand", updated_at_min=...)
+            
+        Yields:
+            Product dicts
+        """
+        params = {"limit": min(limit, 250), "status": "active"}
+        params.update({k: v for k, v in filters.items() if v is not None})
+        return self._paginate("products.json", "products", params)
+    
     def get_product(self, product_id: int) -> Dict[str, Any]:
         """
         Get a specific product by ID.
@@ -285,6 +392,22 @@ class ShopifyClient:
         
         return self._request("GET", "orders.json", params=params)
     
+    def iter_orders(self, limit: int = 250, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all orders, following Link header pagination.
+        
+        Args:
+            limit: Page size (max 250)
+            **filters: Query filters as accepted by list_orders
+                (e.g. status="any", updated_at_min=...)
+            
+        Yields:
+            Order dicts
+        """
+        params = {"limit": min(limit, 250)}
+        params.update({k: v for k, v in filters.items() if v is not None})
+        return self._paginate("orders.json", "orders", params)
+    
     def get_order(self, order_id: int) -> Dict[str, Any]:
         """
         Get a specific order by ID.
@@ -397,6 +520,21 @@ class ShopifyClient:
         
         return self._request("GET", "customers.json", params=params)
     
+    def iter_customers(self, limit: int = 250, **filters: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all customers, following Link header pagination.
+        
+        Args:
+            limit: Page size (max 250)
+            **filters: Query filters as accepted by list_customers
+            
+        Yields:
+            Customer dicts
+        """
+        params = {"limit": min(limit, 250)}
+        params.update({k: v for k, v in filters.items() if v is not None})
+        return self._paginate("customers.json", "customers", params)
+    
     def get_customer(self, customer_id: int) -> Dict[str, Any]:
         """
         Get a specific customer by ID.
@@ -611,6 +749,177 @@ class ShopifyClient:
         """
         self._request("DELETE", f"webhooks/{webhook_id}.json")
     
+    # ============================================================================
+    # GraphQL Bulk Operations
+    # ============================================================================
+    
+    def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run a GraphQL Admin API query.
+        
+        Returns:
+            The "data" member of the response
+            
+        Raises:
+            RuntimeError: If the response contains GraphQL errors
+        """
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        
+        result = self._request("POST", "graphql.json", data=payload)
+        if result.get("errors"):
+            raise RuntimeError(f"Shopify GraphQL error: {result['errors']}")
+        return result.get("data", {})
+    
+    def run_bulk_query(self, query: str) -> Dict[str, Any]:
+        """
+        Submit a bulk export query (bulkOperationRunQuery).
+        
+        Args:
+            query: GraphQL query using connections, e.g.
+                "{ products { edges { node { id title variants { edges { node { id sku } } } } } } }"
+            
+        Returns:
+            Bulk operation dict (id, status)
+            
+        Raises:
+            RuntimeError: If Shopify rejects the query
+        """
+        mutation = """
+        mutation bulkOperationRunQuery($query: String!) {
+          bulkOperationRunQuery(query: $query) {
+            bulkOperation { id status }
+            userErrors { field message }
+          }
+        }
+        """
+        data = self.graphql(mutation, {"query": query})["bulkOperationRunQuery"]
+        if data.get("userErrors"):
+            raise RuntimeError(f"Bulk operation rejected: {data['userErrors']}")
+        return data["bulkOperation"]
+    
+    def get_bulk_operation(self, operation_id: str) -> Dict[str, Any]:
+        """
+        Get the status of a bulk operation.
+        
+        Returns:
+            Bulk operation dict (status, errorCode, objectCount, url, ...)
+        """
+        query = """
+        query bulkOperation($id: ID!) {
+          node(id: $id) {
+            ... on BulkOperation {
+              id status errorCode objectCount fileSize url partialDataUrl
+            }
+          }
+        }
+        """
+        return self.graphql(query, {"id": operation_id})["node"]
+    
+    def wait_for_bulk_operation(
+        self,
+        operation_id: str,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        timeout: float = 3600.0
+    ) -> Dict[str, Any]:
+        """
+        Poll a bulk operation until it finishes, backing off between polls.
+        
+        Returns:
+            The completed bulk operation
+            
+        Raises:
+            RuntimeError: If the operation fails or is canceled
+            TimeoutError: If it does not finish within timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        interval = poll_interval
+        
+        while True:
+            operation = self.get_bulk_operation(operation_id)
+            status = operation.get("status")
+            
+            if status == "COMPLETED":
+                return operation
+            if status in ("FAILED", "CANCELED", "EXPIRED"):
+                raise RuntimeError(
+                    f"Bulk operation {status.lower()}: {operation.get('errorCode')}"
+                )
+            if time.monotonic() + interval > deadline:
+                raise TimeoutError(f"Bulk operation {operation_id} did not finish in {timeout}s")
+            
+            time.sleep(interval)
+            interval = min(interval * 2, max_poll_interval)
+    
+    def iter_bulk_results(self, url: Optional[str]) -> Iterator[BulkRecord]:
+        """
+        Stream a bulk operation result file line by line.
+        
+        The JSONL file is read in chunks, never held in memory. Nested
+        connection items are separate lines that point at their parent
+        through __parentId.
+        
+        Args:
+            url: Result URL of a completed bulk operation (None when empty)
+            
+        Yields:
+            BulkRecord per line, typed from the object's GID
+        """
+        if not url:
+            return
+        
+        # Signed storage URL: must not receive the Shopify credentials
+        with requests.get(url, stream=True, timeout=self.timeout, verify=self.verify_ssl) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                object_id = data.get("id")
+                yield BulkRecord(
+                    type=self._gid_type(object_id),
+                    id=object_id,
+                    parent_id=data.pop("__parentId", None),
+                    data=data
+                )
+    
+    def bulk_export(
+        self,
+        query: str,
+        poll_interval: float = 1.0,
+        timeout: float = 3600.0
+    ) -> Iterator[BulkRecord]:
+        """
+        Run a bulk export query and stream its records.
+        
+        Example:
+            for record in client.bulk_export(
+                "{ products { edges { node { id title "
+                "variants { edges { node { id sku price } } } } } } }"
+            ):
+                if record.type == "ProductVariant":
+                    print(record.parent_id, record.data["sku"])
+        """
+        operation = self.run_bulk_query(query)
+        operation = self.wait_for_bulk_operation(
+            operation["id"], poll_interval=poll_interval, timeout=timeout
+        )
+        return self.iter_bulk_results(operation.get("url"))
+    
+    @staticmethod
+    def _gid_type(gid: Optional[str]) -> str:
+        """Extract the type from a GID such as gid://shopify/ProductVariant/1."""
+        if not gid or not gid.startswith("gid://"):
+            return ""
+        parts = gid.split("/")
+        return parts[3] if len(parts) > 3 else ""
+    
     # ============================================================================
     # Shop Info
     # ============================================================================
@@ -15,8 +15,10 @@ Base URL: https://api.dropboxapi.com/2
 
 import aiohttp
 import asyncio
+import json
+import os
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Union, AsyncIterator, BinaryIO
 from dataclasses import dataclass, field
 import logging
 
@@ -61,15 +63,22 @@ class DropboxClient:
         result = await client.list_items()
     """
 
+    # Upload session chunks must be multiples of 4 MiB (except the last one)
+    UPLOAD_BLOCK_SIZE = 4 * 1024 * 1024
+    # Single-request /files/upload is limited to 150 MB
+    SIMPLE_UPLOAD_LIMIT = 150 * 1024 * 1024
+
     def __init__(
         self,
         api_key: str,
         base_url: Optional[str] = None,
         timeout: int = 30,
-        max_retries: int = 3
+        max_retries: int = 3,
+        content_url: Optional[str] = None
     ):
         self.api_key = api_key
         self.base_url = base_url or "https://api.dropboxapi.com/2"
+        self.content_url = content_url or "https://content.dropboxapi.com/2"
         self.timeout = timeout
         self.max_retries = max_retries
         self.session: Optional[aiohttp.ClientSession] = None
@@ -155,30 +164,257 @@ class DropboxClient:
                 await asyncio.sleep(1 * (attempt + 1))
 
 
-    async def upload_file(self, **kwargs) -> DropboxResponse:
+    async def _content_request(
+        self,
+        endpoint: str,
+        api_arg: Dict[str, Any],
+        data: Optional[bytes] = None
+    ) -> aiohttp.ClientResponse:
+        """
+        Make a request to a content endpoint (upload/download).
+
+        Arguments go in the Dropbox-API-Arg header and the body is raw bytes.
+        Retries connection errors, 429 and 5xx responses. The caller must
+        release the returned response.
+        """
+        url = f"{self.content_url}{endpoint}"
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Dropbox-API-Arg": json.dumps(api_arg),
+            "Content-Type": "application/octet-stream"
+        }
+        # Transfers can take far longer than the API timeout; only bound idle reads
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=self.timeout)
+
+        for attempt in range(self.max_retries):
+            try:
+                response = await self.session.post(
+                    url, data=data, headers=headers, timeout=timeout
+                )
+            except aiohttp.ClientError as e:
+                if attempt == self.max_retries - 1:
+                    raise
+                logger.warning(f"Content request to {endpoint} failed, retrying: {e}")
+                await asyncio.sleep(1 * (attempt + 1))
+                continue
+
+            if (response.status == 429 or response.status >= 500) and attempt < self.max_retries - 1:
+                retry_after = response.headers.get('Retry-After', '')
+                response.release()
+                await asyncio.sleep(float(retry_after) if retry_after.isdigit() else 1 * (attempt + 1))
+                continue
+
+            return response
+
+    async def _read_chunks(
+        self,
+        source: Union[str, bytes, BinaryIO, AsyncIterator[bytes]],
+        chunk_size: int
+    ) -> AsyncIterator[bytes]:
+        """Yield chunk_size pieces (last one may be shorter) from a path, bytes, file or async iterator."""
+        if isinstance(source, (bytes, bytearray)):
+            for i in range(0, len(source), chunk_size):
+                yield bytes(source[i:i + chunk_size])
+            return
+
+        if isinstance(source, str):
+            with open(source, 'rb') as f:
+                async for chunk in self._read_chunks(f, chunk_size):
+                    yield chunk
+            return
+
+        if hasattr(source, 'read'):
+            loop = asyncio.get_running_loop()
+            while True:
+                chunk = await loop.run_in_executor(None, source.read, chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+        buffer = bytearray()
+        async for piece in source:
+            buffer.extend(piece)
+            while len(buffer) >= chunk_size:
+                yield bytes(buffer[:chunk_size])
+                del buffer[:chunk_size]
+        if buffer:
+            yield bytes(buffer)
+
+    async def upload_file(
+        self,
+        path: str,
+        source: Union[str, bytes, BinaryIO, AsyncIterator[bytes]],
+        mode: str = "add",
+        autorename: bool = False,
+        mute: bool = False,
+        chunk_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4
+    ) -> DropboxResponse:
         """
         Upload File
 
+        Small sources (known size within one chunk) go through /files/upload.
+        Anything larger is streamed through a concurrent upload session:
+        upload_session/start, append_v2 of up to max_concurrency chunks in
+        parallel, then upload_session/finish. At most max_concurrency chunks
+        are held in memory at once.
+
         Args:
-            **kwargs: Additional parameters
+            path: Destination path in Dropbox (e.g. "/Videos/talk.mp4")
+            source: Local file path, bytes, binary file object or async iterator of bytes
+            mode: Write mode ("add", "overwrite")
+            autorename: Rename on conflict
+            mute: Don't notify the user's devices
+            chunk_size: Bytes per append (rounded down to a multiple of 4 MiB)
+            max_concurrency: Maximum appends in flight
 
         Returns:
-            DropboxResponse
+            DropboxResponse with the file metadata
         """
-        return await self._request('POST', '/upload_file', data=kwargs if kwargs else None)
+        commit = {"path": path, "mode": mode, "autorename": autorename, "mute": mute}
+        chunk_size = max(self.UPLOAD_BLOCK_SIZE, chunk_size - chunk_size % self.UPLOAD_BLOCK_SIZE)
+
+        size = None
+        if isinstance(source, (bytes, bytearray)):
+            size = len(source)
+        elif isinstance(source, str):
+            size = os.path.getsize(source)
+
+        try:
+            if size is not None and size <= min(chunk_size, self.SIMPLE_UPLOAD_LIMIT):
+                data = bytes(source) if not isinstance(source, str) else None
+                if data is None:
+                    with open(source, 'rb') as f:
+                        data = f.read()
+                response = await self._content_request('/files/upload', commit, data=data)
+                return await self._content_result(response)
+
+            return await self._upload_session(source, commit, chunk_size, max_concurrency)
+        except aiohttp.ClientError as e:
+            logger.error(f"Upload of {path} failed: {e}")
+            return DropboxResponse(success=False, error=str(e), status_code=500)
+
+    async def _upload_session(
+        self,
+        source: Union[str, bytes, BinaryIO, AsyncIterator[bytes]],
+        commit: Dict[str, Any],
+        chunk_size: int,
+        max_concurrency: int
+    ) -> DropboxResponse:
+        """Stream a source through a concurrent upload session."""
+        response = await self._content_request(
+            '/files/upload_session/start', {"close": False, "session_type": "concurrent"}
+        )
+        started = await self._content_result(response)
+        if not started.success:
+            return started
+        session_id = started.data["session_id"]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks: List[asyncio.Task] = []
 
+        async def append(offset: int, chunk: bytes, close: bool) -> None:
+            try:
+                arg = {"cursor": {"session_id": session_id, "offset": offset}, "close": close}
+                result = await self._content_result(
+                    await self._content_request('/files/upload_session/append_v2', arg, data=chunk)
+                )
+                if not result.success:
+                    raise aiohttp.ClientError(
+                        f"append at offset {offset} failed ({result.status_code}): {result.error}"
+                    )
+            finally:
+                semaphore.release()
+
+        offset = 0
+        previous = None
+        try:
+            # Read one chunk ahead so the final chunk can be sent with close=True
+            async for chunk in self._read_chunks(source, chunk_size):
+                if previous is not None:
+                    await semaphore.acquire()
+                    tasks.append(asyncio.ensure_future(append(offset, previous, False)))
+                    offset += len(previous)
+                previous = chunk
+
+            await semaphore.acquire()
+            last = previous or b""
+            tasks.append(asyncio.ensure_future(append(offset, last, True)))
+            offset += len(last)
+
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        response = await self._content_request(
+            '/files/upload_session/finish',
+            {"cursor": {"session_id": session_id, "offset": offset}, "commit": commit}
+        )
+        return await self._content_result(response)
+
+    async def _content_result(self, response: aiohttp.ClientResponse) -> DropboxResponse:
+        """Turn a content endpoint response into a DropboxResponse and release it."""
+        async with response:
+            if response.status >= 400:
+                return DropboxResponse(
+                    success=False,
+                    error=await response.text(),
+                    status_code=response.status
+                )
+            text = await response.text()
+            return DropboxResponse(
+                success=True,
+                data=json.loads(text) if text else {},
+                status_code=response.status
+            )
 
-    async def download_file(self, **kwargs) -> DropboxResponse:
+    async def download_file(
+        self,
+        path: str,
+        output_path: str,
+        chunk_size: int = 1024 * 1024
+    ) -> DropboxResponse:
         """
         Download File
 
+        Streams /files/download straight to disk in chunk_size blocks, so
+        memory use does not depend on the file size. Data is written to
+        '<output_path>.part' and renamed once complete.
+
         Args:
-            **kwargs: Additional parameters
+            path: File path (or "id:...") in Dropbox
+            output_path: Local destination path
+            chunk_size: Bytes read from the network per write
 
         Returns:
-            DropboxResponse
+            DropboxResponse with the file metadata (from Dropbox-API-Result)
         """
-        return await self._request('POST', '/download_file', data=kwargs if kwargs else None)
+        partial_path = f"{output_path}.part"
+        try:
+            response = await self._content_request('/files/download', {"path": path})
+            async with response:
+                if response.status >= 400:
+                    return DropboxResponse(
+                        success=False,
+                        error=await response.text(),
+                        status_code=response.status
+                    )
+
+                metadata = json.loads(response.headers.get('Dropbox-API-Result', '{}'))
+                with open(partial_path, 'wb') as f:
+                    async for block in response.content.iter_chunked(chunk_size):
+                        f.write(block)
+
+            os.replace(partial_path, output_path)
+            metadata['local_path'] = output_path
+            return DropboxResponse(success=True, data=metadata, status_code=response.status)
+        except aiohttp.ClientError as e:
+            logger.error(f"Download of {path} failed: {e}")
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            return DropboxResponse(success=False, error=str(e), status_code=500)
 
 
     async def delete_file(self, **kwargs) -> DropboxResponse:
@@ -9,47 +9,39 @@ Version: 1.0.0
 """
 
 import os
+import sys
 import logging
-from typing import Optional, Dict, List, Any, Union, BinaryIO
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Union, BinaryIO, Iterator
 from datetime import datetime
 import io
+import json
 
 try:
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
+    from google.auth.transport.requests import Request, AuthorizedSession
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
-    from googleapiclient.http import MediaIoBaseDownload, MediaFileUpload, MediaIoBaseUpload
+    from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
+    import google_auth_httplib2
+    import httplib2
+    from requests.adapters import HTTPAdapter
     GOOGLE_API_AVAILABLE = True
 except ImportError:
     GOOGLE_API_AVAILABLE = False
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+from common.rate_limit import credential_key, get_rate_limiter  # noqa: E402
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-class RateLimiter:
-    """Simple rate limiter for Google Drive API calls."""
-    
-    def __init__(self, max_calls: int = 100, period: int = 100):
-        self.max_calls = max_calls
-        self.period = period
-        self.calls = []
-    
-    def wait_if_needed(self):
-        import time
-        now = time.time()
-        self.calls = [t for t in self.calls if now - t < self.period]
-        if len(self.calls) >= self.max_calls:
-            sleep_time = self.period - (now - self.calls[0]) + 1
-            logger.warning(f"Rate limiting: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-            self.calls = []
-        self.calls.append(now)
-
-
 class GoogleDriveClient:
     """
     Google Drive API v3 Client
@@ -63,6 +55,13 @@ class GoogleDriveClient:
     """
     
     SCOPES = ['https://www.googleapis.com/auth/drive']
+    RATE_LIMIT_CALLS = 100
+    RATE_LIMIT_PERIOD = 100  # seconds
+    FOLDER_MIME_TYPE = 'application/vnd.google-apps.folder'
+    API_BASE_URL = 'https://www.googleapis.com/drive/v3'
+    DOWNLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+    STREAM_BLOCK_SIZE = 1024 * 1024
+    DEFAULT_LIST_FIELDS = 'id,name,mimeType,parents,size,md5Checksum,modifiedTime'
     
     def __init__(
         self,
@@ -76,9 +75,12 @@ class GoogleDriveClient:
                 "Install with: pip install google-api-python-client google-auth-oauthlib"
             )
         
-        self.rate_limiter = RateLimiter(max_calls=100, period=100)
         self._service = None
         self._credentials = None
+        self._owner_thread = threading.current_thread()
+        self._thread_local = threading.local()
+        self._http_session = None
+        self._http_session_lock = threading.Lock()
         
         if credentials:
             self._credentials = self._credentials_from_dict(credentials)
@@ -90,6 +92,18 @@ class GoogleDriveClient:
         if not self._credentials:
             raise ValueError("Authentication failed. Provide credentials, token_file, or credentials_file.")
         
+        # Quota is per Cloud project, so every client using the same OAuth
+        # client (or, failing that, the same token) shares one bucket
+        quota_key = credential_key(*(
+            getattr(self._credentials, attr, None)
+            for attr in ('client_id', 'service_account_email', 'refresh_token', 'token')
+        ))
+        self.rate_limiter = get_rate_limiter(
+            f"google-drive:{quota_key}",
+            self.RATE_LIMIT_CALLS,
+            self.RATE_LIMIT_PERIOD
+        )
+        
         self._service = build('drive', 'v3', credentials=self._credentials)
         logger.info("Google Drive client initialized")
     
@@ -148,6 +162,90 @@ class GoogleDriveClient:
             logger.error(f"API error in {operation}: {error}")
         raise
     
+    def _thread_http(self):
+        """
+        Return an authorized HTTP object for worker threads.
+        
+        httplib2 connections are not thread-safe, so threads other than the
+        one that built the client get their own connection.
+        """
+        if threading.current_thread() is self._owner_thread:
+            return None
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
+    def _execute(self, request):
+        """Execute an API request, counting it once against the rate limiter."""
+        self.rate_limiter.wait_if_needed()
+        start = time.monotonic()
+        try:
+            response = request.execute(http=self._thread_http())
+        except HttpError as error:
+            status = error.resp.status
+            if status == 403 and b'ateLimitExceeded' in (error.content or b''):
+                status = 429
+            self.rate_limiter.record_response(status, error.resp, time.monotonic() - start)
+            raise
+        self.rate_limiter.record_response(200, elapsed=time.monotonic() - start)
+        return response
+    
+    def _get_http_session(self, pool_size: int = 16) -> 'AuthorizedSession':
+        """Shared, thread-safe authorized session with one connection pool for media transfers."""
+        with self._http_session_lock:
+            if self._http_session is None:
+                session = AuthorizedSession(self._credentials)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session.mount('https://', adapter)
+                self._http_session = session
+            return self._http_session
+    
+    def _session_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+        operation: str = 'request'
+    ):
+        """
+        GET through the shared session, counted once against the rate limiter.
+        
+        Error responses are raised as HttpError through _handle_api_error,
+        like calls made with the API client library.
+        """
+        self.rate_limiter.wait_if_needed()
+        start = time.monotonic()
+        response = self._get_http_session().get(
+            url, params=params, headers=headers, stream=stream, timeout=300
+        )
+        self.rate_limiter.record_response(
+            response.status_code, response.headers, time.monotonic() - start
+        )
+        if response.status_code >= 400:
+            resp = httplib2.Response({**response.headers, 'status': response.status_code})
+            resp.reason = response.reason
+            content = response.content
+            response.close()
+            try:
+                raise HttpError(resp, content, uri=response.url)
+            except HttpError as error:
+                self._handle_api_error(error, operation)
+        return response
+    
+    def _stream_to_file(self, response, fh) -> int:
+        """Copy a streamed response body to an open file in fixed-size blocks."""
+        written = 0
+        try:
+            for block in response.iter_content(chunk_size=self.STREAM_BLOCK_SIZE):
+                fh.write(block)
+                written += len(block)
+        finally:
+            response.close()
+        return written
+    
     # ============================================
     # File & Folder Operations
     # ============================================
@@ -158,8 +256,6 @@ class GoogleDriveClient:
         parent_folder_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """9. フォルダの作成"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {
             'name': name,
             'mimeType': 'application/vnd.google-apps.folder'
@@ -170,7 +266,7 @@ class GoogleDriveClient:
         
         try:
             request = self._service.files().create(body=file_metadata, fields='id,name')
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Created folder: {name}")
             return {
                 'id': response.get('id'),
@@ -188,15 +284,13 @@ class GoogleDriveClient:
         fields: str = 'files(id,name,mimeType,webViewLink,webContentLink)'
     ) -> Dict[str, Any]:
         """3.ファイル/フォルダを検索する、17.特定のフォルダを検索する（ごみ箱を除く）、21.特定のフォルダを検索する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.files().list(
                 q=query,
                 pageSize=page_size,
                 fields=f"nextPageToken,{fields}"
             )
-            response = request.execute()
+            response = self._execute(request)
             
             files = response.get('files', [])
             return {
@@ -208,14 +302,211 @@ class GoogleDriveClient:
             self._handle_api_error(error, 'search_files')
             raise
     
+    def iter_files(
+        self,
+        query: str = 'trashed=false',
+        fields: Optional[str] = None,
+        page_size: int = 1000,
+        drive_id: Optional[str] = None,
+        order_by: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over every file matching a query, following nextPageToken.
+        
+        Args:
+            query: Drive search query
+            fields: File fields to return (field mask inside files(...))
+            page_size: Files per page (max 1000)
+            drive_id: Restrict to one shared drive
+            order_by: Optional sort order (e.g., 'folder,name')
+        
+        Yields:
+            File resource dictionaries
+        """
+        fields = fields or self.DEFAULT_LIST_FIELDS
+        kwargs = {
+            'q': query,
+            'pageSize': page_size,
+            'fields': f"nextPageToken,files({fields})",
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True
+        }
+        if drive_id:
+            kwargs['corpora'] = 'drive'
+            kwargs['driveId'] = drive_id
+        if order_by:
+            kwargs['orderBy'] = order_by
+        
+        page_token = None
+        while True:
+            if page_token:
+                kwargs['pageToken'] = page_token
+            try:
+                response = self._execute(self._service.files().list(**kwargs))
+            except HttpError as error:
+                self._handle_api_error(error, 'iter_files')
+                raise
+            
+            for file in response.get('files', []):
+                yield file
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                break
+    
+    def walk_folder(
+        self,
+        folder_id: str,
+        fields: Optional[str] = None,
+        max_workers: int = 8,
+        include_trashed: bool = False,
+        drive_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recursively list a folder tree, listing sibling folders concurrently.
+        
+        Folders are listed by a bounded worker pool and entries are yielded as
+        each folder listing completes, so the order is not deterministic.
+        Each entry gets a 'path' key relative to folder_id.
+        
+        Args:
+            folder_id: Root folder ID
+            fields: File fields to return (id, name and mimeType are always included)
+            max_workers: Maximum concurrent folder listings
+            include_trashed: Include trashed items
+            drive_id: Shared drive ID when walking a shared drive
+        
+        Yields:
+            File resource dictionaries with an added 'path'
+        """
+        fields = fields or self.DEFAULT_LIST_FIELDS
+        for required in ('id', 'name', 'mimeType'):
+            if required not in fields.split(','):
+                fields = f"{fields},{required}"
+        
+        def list_folder(parent_id: str) -> List[Dict[str, Any]]:
+            query = f"'{parent_id}' in parents"
+            if not include_trashed:
+                query += " and trashed=false"
+            return list(self.iter_files(query, fields=fields, drive_id=drive_id))
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {executor.submit(list_folder, folder_id): ''}
+            
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent_path = pending.pop(future)
+                        for entry in future.result():
+                            entry['path'] = f"{parent_path}/{entry['name']}"
+                            if entry.get('mimeType') == self.FOLDER_MIME_TYPE:
+                                pending[executor.submit(list_folder, entry['id'])] = entry['path']
+                            yield entry
+            finally:
+                # Stop queued listings if the caller stops iterating early
+                for future in pending:
+                    future.cancel()
+    
+    def get_start_page_token(self, drive_id: Optional[str] = None) -> str:
+        """Get the current page token of the changes feed."""
+        kwargs = {'supportsAllDrives': True}
+        if drive_id:
+            kwargs['driveId'] = drive_id
+        try:
+            response = self._execute(self._service.changes().getStartPageToken(**kwargs))
+            return response['startPageToken']
+        except HttpError as error:
+            self._handle_api_error(error, 'get_start_page_token')
+            raise
+    
+    def iter_changes(
+        self,
+        page_token: Optional[str] = None,
+        token_file: Optional[str] = None,
+        fields: Optional[str] = None,
+        drive_id: Optional[str] = None,
+        include_removed: bool = True,
+        page_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over changes since a saved page token (incremental re-scan).
+        
+        When token_file is given, the token is read from it if page_token is
+        not passed, and the file is updated after every fully consumed page,
+        so an interrupted sync resumes where it stopped. If token_file does
+        not exist yet, the current start token is saved and nothing is
+        yielded: run a full walk_folder first, then call this on later runs.
+        
+        Args:
+            page_token: Page token to start from
+            token_file: File used to persist the page token
+            fields: File fields to include in each change
+            drive_id: Shared drive ID to follow
+            include_removed: Include removals
+            page_size: Changes per page (max 1000)
+        
+        Yields:
+            Change resource dictionaries
+        
+        Returns:
+            The new start page token (as the generator's return value)
+        """
+        if page_token is None and token_file:
+            if os.path.exists(token_file):
+                with open(token_file) as f:
+                    page_token = f.read().strip()
+            else:
+                page_token = self.get_start_page_token(drive_id)
+                self._save_page_token(token_file, page_token)
+                return page_token
+        
+        if page_token is None:
+            raise ValueError("Either page_token or token_file must be provided")
+        
+        fields = fields or self.DEFAULT_LIST_FIELDS
+        kwargs = {
+            'pageSize': page_size,
+            'includeRemoved': include_removed,
+            'supportsAllDrives': True,
+            'includeItemsFromAllDrives': True,
+            'fields': f"nextPageToken,newStartPageToken,changes(changeType,removed,fileId,time,file({fields}))"
+        }
+        if drive_id:
+            kwargs['driveId'] = drive_id
+        
+        while True:
+            try:
+                response = self._execute(
+                    self._service.changes().list(pageToken=page_token, **kwargs)
+                )
+            except HttpError as error:
+                self._handle_api_error(error, 'iter_changes')
+                raise
+            
+            for change in response.get('changes', []):
+                yield change
+            
+            page_token = response.get('nextPageToken') or response.get('newStartPageToken')
+            if token_file:
+                self._save_page_token(token_file, page_token)
+            
+            if 'newStartPageToken' in response:
+                return page_token
+    
+    def _save_page_token(self, token_file: str, page_token: str) -> None:
+        """Atomically persist a changes page token."""
+        tmp_file = f"{token_file}.tmp"
+        with open(tmp_file, 'w') as f:
+            f.write(page_token)
+        os.replace(tmp_file, token_file)
+    
     def rename_file(
         self,
         file_id: str,
         new_name: str
     ) -> Dict[str, Any]:
         """4. ファイル名の変更"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {'name': new_name}
         
         try:
@@ -224,7 +515,7 @@ class GoogleDriveClient:
                 body=file_metadata,
                 fields='id,name'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Renamed file: {file_id} -> {new_name}")
             return {
                 'id': response.get('id'),
@@ -240,8 +531,6 @@ class GoogleDriveClient:
         description: str
     ) -> Dict[str, Any]:
         """33. ファイル/フォルダの説明を更新する"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {'description': description}
         
         try:
@@ -250,7 +539,7 @@ class GoogleDriveClient:
                 body=file_metadata,
                 fields='id,name,description'
             )
-            response = request.execute()
+            response = self._execute(request)
             return {
                 'id': response.get('id'),
                 'name': response.get('name'),
@@ -265,11 +554,9 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """15. ファイルを削除する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.files().delete(fileId=file_id)
-            request.execute()
+            self._execute(request)
             logger.info(f"Deleted file: {file_id}")
             return {'success': True, 'fileId': file_id}
         except HttpError as error:
@@ -282,14 +569,12 @@ class GoogleDriveClient:
         new_parent_folder_id: str
     ) -> Dict[str, Any]:
         """6. ファイル保存フォルダの変更"""
-        self.rate_limiter.wait_if_needed()
-        
         # First get the file to retrieve current parents
         try:
-            file = self._service.files().get(
+            file = self._execute(self._service.files().get(
                 fileId=file_id,
                 fields='parents'
-            ).execute()
+            ))
             
             previous_parents = ",".join(file.get('parents', []))
             
@@ -300,7 +585,7 @@ class GoogleDriveClient:
                 removeParents=previous_parents,
                 fields='id,parents'
             )
-            response = request.execute()
+            response = self._execute(request)
             
             logger.info(f"Moved file {file_id} to folder {new_parent_folder_id}")
             return {
@@ -316,8 +601,6 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """27. ファイルをごみ箱に移動する"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {'trashed': True}
         
         try:
@@ -326,7 +609,7 @@ class GoogleDriveClient:
                 body=file_metadata,
                 fields='id,trashed'
             )
-            request.execute()
+            self._execute(request)
             logger.info(f"Moved to trash: {file_id}")
             return {'success': True, 'fileId': file_id, 'trashed': True}
         except HttpError as error:
@@ -339,14 +622,12 @@ class GoogleDriveClient:
         fields: str = 'id,name,mimeType,size,createdTime,modifiedTime,owners,webContentLink,webViewLink'
     ) -> Dict[str, Any]:
         """20. ファイル/フォルダ情報のインポート"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.files().get(
                 fileId=file_id,
                 fields=fields
             )
-            response = request.execute()
+            response = self._execute(request)
             return response
         except HttpError as error:
             self._handle_api_error(error, 'get_file_info')
@@ -358,8 +639,6 @@ class GoogleDriveClient:
         page_size: int = 100
     ) -> Dict[str, Any]:
         """21. 特定のフォルダ内のファイル/フォルダの検索、31. 特定のフォルダ内のフォルダ一覧、34. 特定のフォルダ内のファイル/フォルダの一覧"""
-        self.rate_limiter.wait_if_needed()
-        
         query = f"'{folder_id}' in parents and trashed=false"
         
         return self.search_files(query, page_size)
@@ -375,8 +654,6 @@ class GoogleDriveClient:
         file_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """23. ファイルをアップロードする"""
-        self.rate_limiter.wait_if_needed()
-        
         file_name = file_name or os.path.basename(file_path)
         
         # Determine MIME type
@@ -400,7 +677,7 @@ class GoogleDriveClient:
                 media_body=media,
                 fields='id,name,mimeType,webContentLink,webViewLink'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Uploaded file: {file_name}")
             return response
         except HttpError as error:
@@ -410,16 +687,30 @@ class GoogleDriveClient:
     def download_file(
         self,
         file_id: str,
-        output_path: Optional[str] = None
+        output_path: Optional[str] = None,
+        file_info: Optional[Dict[str, Any]] = None,
+        chunk_size: Optional[int] = None,
+        max_workers: int = 4,
+        resume: bool = True
     ) -> Dict[str, Any]:
-        """16. ファイルのダウンロード"""
-        self.rate_limiter.wait_if_needed()
-        
-        # Get file info to determine if it's a Google Workspace file
-        file_info = self.get_file_info(
-            file_id,
-            fields='id,name,mimeType,webContentLink'
-        )
+        """
+        16. ファイルのダウンロード
+        
+        Large files are split into byte ranges that are fetched concurrently
+        into a pre-allocated output file. Progress is recorded in a
+        '<output_path>.parts' file so an interrupted download resumes with
+        the missing ranges only.
+        
+        Args:
+            file_id: File ID
+            output_path: Destination path
+            file_info: Metadata with mimeType/name/size (e.g. from iter_files); skips the lookup
+            chunk_size: Bytes per range request (default 32 MiB)
+            max_workers: Concurrent range requests
+            resume: Reuse completed ranges from a previous interrupted run
+        """
+        if file_info is None or 'mimeType' not in file_info:
+            file_info = self.get_file_info(file_id, fields='id,name,mimeType,size')
         
         mime_type = file_info.get('mimeType', '')
         file_name = file_info.get('name', 'download')
@@ -432,21 +723,153 @@ class GoogleDriveClient:
         if not output_path:
             return {'success': False, 'reason': 'output_path required for regular files'}
         
-        request = self._service.files().get_media(fileId=file_id)
+        chunk_size = chunk_size or self.DOWNLOAD_CHUNK_SIZE
+        size = int(file_info.get('size') or 0)
+        url = f"{self.API_BASE_URL}/files/{file_id}"
+        params = {'alt': 'media', 'supportsAllDrives': 'true'}
         
-        with open(output_path, 'wb') as fh:
-            downloader = MediaIoBaseDownload(fh, request)
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
+        ranged = size > chunk_size and max_workers > 1
+        if ranged:
+            ranged = self._download_ranges(url, params, output_path, size, chunk_size, max_workers, resume)
+        if not ranged:
+            response = self._session_get(url, params=params, stream=True, operation='download_file')
+            with open(output_path, 'wb') as fh:
+                self._stream_to_file(response, fh)
         
         logger.info(f"Downloaded file to: {output_path}")
         return {
             'success': True,
             'path': output_path,
-            'name': file_name
+            'name': file_name,
+            'size': size
         }
     
+    def _download_ranges(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        output_path: str,
+        size: int,
+        chunk_size: int,
+        max_workers: int,
+        resume: bool
+    ) -> bool:
+        """
+        Fetch byte ranges concurrently into a pre-allocated file, recording finished ranges.
+        
+        Returns False, without writing anything more, when a response is not
+        the requested range (anything but 206 with a matching Content-Range);
+        the caller then downloads the file as a single stream.
+        """
+        parts_path = f"{output_path}.parts"
+        completed = set()
+        
+        if resume and os.path.exists(parts_path) and os.path.exists(output_path):
+            with open(parts_path) as f:
+                state = json.load(f)
+            if state.get('size') == size and state.get('chunkSize') == chunk_size:
+                completed = set(state.get('completed', []))
+        
+        if not completed:
+            with open(output_path, 'wb') as fh:
+                fh.truncate(size)
+        
+        lock = threading.Lock()
+        
+        def save_state() -> None:
+            tmp_path = f"{parts_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'size': size, 'chunkSize': chunk_size, 'completed': sorted(completed)}, f)
+            os.replace(tmp_path, parts_path)
+        
+        def fetch(offset: int) -> bool:
+            end = min(offset + chunk_size, size) - 1
+            response = self._session_get(
+                url, params=params, headers={'Range': f"bytes={offset}-{end}"}, stream=True,
+                operation='download_file'
+            )
+            content_range = response.headers.get('Content-Range', '')
+            if response.status_code != 206 or not content_range.startswith(f"bytes {offset}-{end}/"):
+                response.close()
+                return False
+            with open(output_path, 'r+b') as fh:
+                fh.seek(offset)
+                self._stream_to_file(response, fh)
+            with lock:
+                completed.add(offset)
+                save_state()
+            return True
+        
+        offsets = [o for o in range(0, size, chunk_size) if o not in completed]
+        self._get_http_session(pool_size=max(max_workers, 16))
+        
+        honoured = True
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(fetch, offset) for offset in offsets]
+            for future in futures:
+                if not future.result():
+                    logger.warning("Range request not honoured, falling back to a single-stream download")
+                    honoured = False
+                    for pending in futures:
+                        pending.cancel()
+                    break
+        
+        if os.path.exists(parts_path):
+            os.remove(parts_path)
+        return honoured
+    
+    def download_files(
+        self,
+        file_ids: List[str],
+        output_dir: str,
+        max_workers: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Download many files concurrently over one shared connection pool.
+        
+        Metadata lookups run inside the workers, so they overlap with other
+        files' transfers instead of running one after another up front.
+        
+        Args:
+            file_ids: File IDs to download
+            output_dir: Directory to write files into, as '<name>_<file ID><ext>' so
+                files sharing a Drive name don't overwrite each other
+            max_workers: Concurrent downloads
+        
+        Returns:
+            One result dictionary per file, in input order
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        self._get_http_session(pool_size=max(max_workers, 16))
+        
+        def download_one(file_id: str) -> Dict[str, Any]:
+            try:
+                info = self._session_get(
+                    f"{self.API_BASE_URL}/files/{file_id}",
+                    params={'fields': 'id,name,mimeType,size', 'supportsAllDrives': 'true'},
+                    operation='download_files'
+                ).json()
+                stem, ext = os.path.splitext(os.path.basename(info.get('name') or ''))
+                output_path = os.path.join(output_dir, f"{stem}_{file_id}{ext}" if stem else file_id)
+                return self.download_file(file_id, output_path, file_info=info, max_workers=1)
+            except Exception as e:
+                logger.error(f"Download failed for {file_id}: {e}")
+                return {'success': False, 'fileId': file_id, 'error': str(e)}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(download_one, file_ids))
+    
+    def _export_to_path(self, file_id: str, export_mime: str, output_path: str) -> int:
+        """Stream a Google Workspace export straight to disk."""
+        response = self._session_get(
+            f"{self.API_BASE_URL}/files/{file_id}/export",
+            params={'mimeType': export_mime},
+            stream=True,
+            operation='export_file'
+        )
+        with open(output_path, 'wb') as fh:
+            return self._stream_to_file(response, fh)
+    
     def _export_file(
         self,
         file_id: str,
@@ -470,19 +893,17 @@ class GoogleDriveClient:
         elif export_mime == 'application/vnd.openxmlformats-officedocument.presentationml':
             export_mime = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
         
-        request = self._service.files().export(
-            fileId=file_id,
-            mimeType=export_mime
-        )
-        
         if output_path:
-            with open(output_path, 'wb') as fh:
-                fh.write(request.execute())
+            self._export_to_path(file_id, export_mime, output_path)
             logger.info(f"Exported file to: {output_path}")
             return {'success': True, 'path': output_path}
         else:
             # Return as base64
-            content = request.execute()
+            request = self._service.files().export(
+                fileId=file_id,
+                mimeType=export_mime
+            )
+            content = self._execute(request)
             import base64
             return {
                 'success': True,
@@ -500,8 +921,6 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """1. ファイルを Google Docs に変換する"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {
             'name': 'Converted Document',
             'parents': [file_id]  # Wrong - should use copy API with convert
@@ -514,7 +933,7 @@ class GoogleDriveClient:
                 body={'name': 'Converted to Docs'},
                 supportsAllDrives=True
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Converted to Google Docs: {response.get('id')}")
             return response
         except HttpError as error:
@@ -526,15 +945,13 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """2. プレゼンテーション ファイルを Google Slides に変換する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.files().copy(
                 fileId=file_id,
                 body={'name': 'Converted to Slides'},
                 supportsAllDrives=True
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Converted to Google Slides: {response.get('id')}")
             return response
         except HttpError as error:
@@ -547,8 +964,6 @@ class GoogleDriveClient:
         parent_folder_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """18. CSVファイルをスプレッドシートに変換する、32. Excelファイルを変換する"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {
             'name': os.path.basename(file_path).replace('.csv', '').replace('.xlsx', ''),
             'mimeType': 'application/vnd.google-apps.spreadsheet'
@@ -569,7 +984,7 @@ class GoogleDriveClient:
                 media_body=media,
                 fields='id,name,mimeType'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Converted to Sheets: {response.get('id')}")
             return response
         except HttpError as error:
@@ -587,8 +1002,6 @@ class GoogleDriveClient:
         output_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """7. Google Docsをダウンロードする"""
-        self.rate_limiter.wait_if_needed()
-        
         mime_map = {
             'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
             'pdf': 'application/pdf',
@@ -600,19 +1013,17 @@ class GoogleDriveClient:
         
         export_mime = mime_map.get(format, mime_map['docx'])
         
-        request = self._service.files().export_media(
-            fileId=file_id,
-            mimeType=export_mime
-        )
-        
         if output_path:
-            with open(output_path, 'wb') as fh:
-                fh.write(request.execute())
+            self._export_to_path(file_id, export_mime, output_path)
             logger.info(f"Downloaded Google Doc: {output_path}")
             return {'success': True, 'path': output_path}
         else:
+            request = self._service.files().export_media(
+                fileId=file_id,
+                mimeType=export_mime
+            )
             import base64
-            content = request.execute()
+            content = self._execute(request)
             return {
                 'success': True,
                 'content': base64.b64encode(content).decode(),
@@ -623,11 +1034,10 @@ class GoogleDriveClient:
         self,
         file_id: str,
         format: str = 'xlsx',
-        sheet_name: Optional[str] = None
+        sheet_name: Optional[str] = None,
+        output_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """12. Googleシートをダウンロードする、19.シート指定をダウンロードする"""
-        self.rate_limiter.wait_if_needed()
-        
         mime_map = {
             'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
             'pdf': 'application/pdf',
@@ -638,18 +1048,22 @@ class GoogleDriveClient:
         
         export_mime = mime_map.get(format, mime_map['xlsx'])
         
-        request = self._service.files().export_media(
-            fileId=file_id,
-            mimeType=export_mime
-        )
-        
-        import base64
-        content = request.execute()
-        result = {
-            'success': True,
-            'content': base64.b64encode(content).decode(),
-            'format': format
-        }
+        if output_path:
+            self._export_to_path(file_id, export_mime, output_path)
+            logger.info(f"Downloaded Google Sheets: {output_path}")
+            result = {'success': True, 'path': output_path, 'format': format}
+        else:
+            request = self._service.files().export_media(
+                fileId=file_id,
+                mimeType=export_mime
+            )
+            import base64
+            content = self._execute(request)
+            result = {
+                'success': True,
+                'content': base64.b64encode(content).decode(),
+                'format': format
+            }
         
         if sheet_name:
             result['sheetName'] = sheet_name
@@ -659,11 +1073,10 @@ class GoogleDriveClient:
     def download_slides(
         self,
         file_id: str,
-        format: str = 'pptx'
+        format: str = 'pptx',
+        output_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """30. Google Slidesをダウンロードする"""
-        self.rate_limiter.wait_if_needed()
-        
         mime_map = {
             'pptx': 'application/vnd.openxmlformats-officedocument.presentationml.presentation',
             'pdf': 'application/pdf',
@@ -673,13 +1086,18 @@ class GoogleDriveClient:
         
         export_mime = mime_map.get(format, mime_map['pptx'])
         
+        if output_path:
+            self._export_to_path(file_id, export_mime, output_path)
+            logger.info(f"Downloaded Google Slides: {output_path}")
+            return {'success': True, 'path': output_path, 'format': format}
+        
         request = self._service.files().export_media(
             fileId=file_id,
             mimeType=export_mime
         )
         
         import base64
-        content = request.execute()
+        content = self._execute(request)
         return {
             'success': True,
             'content': base64.b64encode(content).decode(),
@@ -691,15 +1109,13 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """25. PDF ファイルを Google Docs に変換する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.files().copy(
                 fileId=file_id,
                 body={'name': 'PDF Converted'},
                 supportsAllDrives=True
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Converted PDF to Docs: {response.get('id')}")
             return response
         except HttpError as error:
@@ -716,8 +1132,6 @@ class GoogleDriveClient:
         new_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """8. ファイルの複製、14. ファイルの複製 (詳細)、22. ファイルのショートカットの作成"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {}
         if new_name:
             file_metadata['name'] = new_name
@@ -728,7 +1142,7 @@ class GoogleDriveClient:
                 body=file_metadata,
                 fields='id,name,mimeType'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Duplicated file: {response.get('id')}")
             return response
         except HttpError as error:
@@ -744,14 +1158,12 @@ class GoogleDriveClient:
         file_id: str
     ) -> Dict[str, Any]:
         """5. ファイル/フォルダ権限リストのインポート"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.permissions().list(
                 fileId=file_id,
                 fields='permissions(id,role,type,emailAddress,domain,allowFileDiscovery)'
             )
-            response = request.execute()
+            response = self._execute(request)
             return {
                 'fileId': file_id,
                 'permissions': response.get('permissions', [])
@@ -766,14 +1178,12 @@ class GoogleDriveClient:
         permission_id: str
     ) -> Dict[str, Any]:
         """10. ファイル/フォルダから権限を削除する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             request = self._service.permissions().delete(
                 fileId=file_id,
                 permissionId=permission_id
             )
-            request.execute()
+            self._execute(request)
             logger.info(f"Deleted permission {permission_id} from {file_id}")
             return {'success': True}
         except HttpError as error:
@@ -788,8 +1198,6 @@ class GoogleDriveClient:
         transfer_ownership: bool = False
     ) -> Dict[str, Any]:
         """35. 指定ユーザーに許可を与える"""
-        self.rate_limiter.wait_if_needed()
-        
         valid_roles = ['reader', 'writer', 'commenter', 'owner']
         if role not in valid_roles:
             raise ValueError(f"Invalid role. Must be one of: {valid_roles}")
@@ -806,7 +1214,7 @@ class GoogleDriveClient:
                 kwargs['transferOwnership'] = True
             
             request = self._service.permissions().create(**kwargs)
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Granted {role} permission to {email}")
             return response
         except HttpError as error:
@@ -820,8 +1228,6 @@ class GoogleDriveClient:
         role: str = 'reader'
     ) -> Dict[str, Any]:
         """26. 特定の組織への承認"""
-        self.rate_limiter.wait_if_needed()
-        
         permission = {
             'type': 'domain',
             'role': role,
@@ -834,7 +1240,7 @@ class GoogleDriveClient:
                 body=permission,
                 fields='id,role,type,domain'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Granted {role} permission to domain {domain}")
             return response
         except HttpError as error:
@@ -848,8 +1254,6 @@ class GoogleDriveClient:
         allow_discovery: bool = False
     ) -> Dict[str, Any]:
         """28. ファイル権限を"リンクを知っているすべての人"に変更する"""
-        self.rate_limiter.wait_if_needed()
-        
         permission = {
             'type': 'anyone',
             'role': role
@@ -864,7 +1268,7 @@ class GoogleDriveClient:
                 body=permission,
                 fields='id,role,type'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Set 'anyone with link' permission to {role}")
             return response
         except HttpError as error:
@@ -878,14 +1282,12 @@ class GoogleDriveClient:
         allow_download: bool = True
     ) -> Dict[str, Any]:
         """24. ファイルのダウンロード/コピーを許可する設定"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             # Get existing permissions
-            file_info = self._service.files().get(
+            file_info = self._execute(self._service.files().get(
                 fileId=file_id,
                 fields='copyRequiresWriterPermission, writersCanShare'
-            ).execute()
+            ))
             
             # Update file copy settings
             file_metadata = {
@@ -899,10 +1301,10 @@ class GoogleDriveClient:
                 for p in perms.get('permissions', []):
                     if p.get('type') == 'anyone':
                         try:
-                            self._service.permissions().delete(
+                            self._execute(self._service.permissions().delete(
                                 fileId=file_id,
                                 permissionId=p.get('id')
-                            ).execute()
+                            ))
                         except:
                             pass
             
@@ -911,7 +1313,7 @@ class GoogleDriveClient:
                 body=file_metadata,
                 fields='id,webContentLink'
             )
-            response = request.execute()
+            response = self._execute(request)
             return response
         except HttpError as error:
             self._handle_api_error(error, 'set_copy_and_download_permission')
@@ -926,15 +1328,13 @@ class GoogleDriveClient:
         query: str = ''
     ) -> Dict[str, Any]:
         """11. 共有ドライブを検索する"""
-        self.rate_limiter.wait_if_needed()
-        
         try:
             kwargs = {}
             if query:
                 kwargs['q'] = query
             
             request = self._service.drives().list(**kwargs)
-            response = request.execute()
+            response = self._execute(request)
             
             return {
                 'drives': response.get('drives', [])
@@ -949,8 +1349,6 @@ class GoogleDriveClient:
         request_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """29. 共有ドライブの作成"""
-        self.rate_limiter.wait_if_needed()
-        
         import uuid
         request_id = request_id or str(uuid.uuid4())
         
@@ -964,7 +1362,7 @@ class GoogleDriveClient:
                 body=drive_metadata,
                 fields='id,name'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Created shared drive: {name}")
             return response
         except HttpError as error:
@@ -981,8 +1379,6 @@ class GoogleDriveClient:
         file_path: str
     ) -> Dict[str, Any]:
         """13. 特定のファイルを更新する"""
-        self.rate_limiter.wait_if_needed()
-        
         file_metadata = {}
         
         import mimetypes
@@ -998,7 +1394,7 @@ class GoogleDriveClient:
                 media_body=media,
                 fields='id,name,modifiedTime'
             )
-            response = request.execute()
+            response = self._execute(request)
             logger.info(f"Updated file: {file_id}")
             return response
         except HttpError as error:
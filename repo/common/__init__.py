@@ -0,0 +1,12 @@
+"""
+Code shared by the API clients under repo/.
+
+Clients import it by putting the repo directory on sys.path:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from common.rate_limit import get_rate_limiter
+"""
+
+from .rate_limit import RateLimiter, credential_key, get_rate_limiter
+
+__all__ = ["RateLimiter", "credential_key", "get_rate_limiter"]
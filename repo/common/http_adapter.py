@@ -0,0 +1,28 @@
+"""
+requests transport adapter that applies a shared RateLimiter.
+"""
+
+from requests.adapters import HTTPAdapter
+
+from .rate_limit import RateLimiter
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """Transport adapter that waits for the rate limiter and retries 429 responses."""
+
+    def __init__(self, rate_limiter: RateLimiter, max_retries: int = 3, **kwargs):
+        super().__init__(**kwargs)
+        self.rate_limiter = rate_limiter
+        self.retry_limit = max_retries
+
+    def send(self, request, **kwargs):
+        for attempt in range(self.retry_limit + 1):
+            # After a 429 the limiter blocks until Retry-After has passed,
+            # so this wait is the only back-off before the retry
+            self.rate_limiter.wait_if_needed()
+            response = super().send(request, **kwargs)
+            self.rate_limiter.record_response(response.status_code, response.headers, response.elapsed.total_seconds())
+            if response.status_code != 429 or attempt == self.retry_limit:
+                return response
+            response.close()
+        return response
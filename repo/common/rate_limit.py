@@ -0,0 +1,249 @@
+"""
+Shared token-bucket rate limiting for API clients.
+
+Clients get their limiter from get_rate_limiter, keyed per tenant or
+credential, so every client instance and thread that spends the same API
+budget draws from one bucket.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Mapping, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe token-bucket rate limiter fed by the API's rate limit headers.
+
+    Tokens refill continuously at max_calls / period per second; a token is
+    reserved under a lock and the sleep happens outside it, so concurrent
+    threads (and asyncio tasks using wait_if_needed_async) are served in
+    order. Responses feed the bucket: the advertised limit replaces
+    max_calls, the remaining count caps the tokens left in the current
+    window, and a 429 blocks every caller until Retry-After and halves the
+    refill rate, which recovers over one period.
+    """
+
+    REMAINING_HEADERS = ("X-RateLimit-Remaining", "X-Rate-Limit-Remaining", "RateLimit-Remaining")
+    LIMIT_HEADERS = ("X-RateLimit-Limit", "X-Rate-Limit", "RateLimit-Limit")
+    RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float,
+        remaining_headers: Optional[Sequence[str]] = None,
+        limit_headers: Optional[Sequence[str]] = None,
+        reset_headers: Optional[Sequence[str]] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_calls: Maximum calls allowed in the period (bucket size)
+            period: Time period in seconds
+            remaining_headers: Headers carrying the calls left in the window
+            limit_headers: Headers carrying the window's call limit
+            reset_headers: Headers carrying when the window resets
+        """
+        self.max_calls = max_calls
+        self.period = period
+        if remaining_headers is not None:
+            self.REMAINING_HEADERS = tuple(remaining_headers)
+        if limit_headers is not None:
+            self.LIMIT_HEADERS = tuple(limit_headers)
+        if reset_headers is not None:
+            self.RESET_HEADERS = tuple(reset_headers)
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._rate_factor = 1.0
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._recent_waits = deque(maxlen=1000)
+        self.call_count = 0
+        self.throttled_calls = 0
+        self.total_wait = 0.0
+        self.total_request_time = 0.0
+        self.rate_limit_errors = 0
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in calls per second."""
+        return self.max_calls / self.period * self._rate_factor
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._rate_factor = min(1.0, self._rate_factor + elapsed / self.period)
+        self._tokens = min(float(self.max_calls), self._tokens + elapsed * self.rate)
+
+    def _reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+
+            wait = max(0.0, -self._tokens / self.rate, self._blocked_until - now)
+            self.call_count += 1
+            if wait > 0:
+                self.throttled_calls += 1
+                self.total_wait += wait
+            self._recent_waits.append(wait)
+            return wait
+
+    def wait_if_needed(self) -> float:
+        """Wait if rate limit would be exceeded. Returns seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            if wait >= 1:
+                logger.warning(f"Rate limit approaching, sleeping for {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def wait_if_needed_async(self) -> float:
+        """Asyncio variant of wait_if_needed. Returns seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_response(
+        self,
+        status: int,
+        headers: Optional[Mapping[str, str]] = None,
+        elapsed: float = 0.0
+    ) -> float:
+        """
+        Feed back the outcome of an API call.
+
+        Args:
+            status: HTTP status code (429 for quota errors)
+            headers: Response headers
+            elapsed: Time spent in the request itself
+
+        Returns:
+            Seconds until the next call may be made (0 unless status is 429).
+            The wait is already charged to the bucket: the next
+            wait_if_needed sleeps exactly this long, so callers retrying a
+            429 should not sleep on their own as well.
+        """
+        headers = headers or {}
+        limit = self._header_number(headers, self.LIMIT_HEADERS)
+        remaining = self._header_number(headers, self.REMAINING_HEADERS)
+        reset_after = self._reset_after(headers)
+
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.total_request_time += elapsed
+            if limit and limit >= 1:
+                self.max_calls = int(limit)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining <= 0 and reset_after:
+                    self._blocked_until = max(self._blocked_until, now + reset_after)
+
+            if status != 429:
+                return 0.0
+
+            self.rate_limit_errors += 1
+            self._rate_factor = max(0.1, self._rate_factor / 2)
+            delay = self._header_number(headers, ("Retry-After",))
+            if delay is None:
+                delay = reset_after or 1.0
+            self._blocked_until = max(self._blocked_until, now + delay)
+            # Empty the bucket so that exactly one token has refilled when the
+            # block ends: the retry is paid for by the Retry-After wait
+            # instead of waiting another 1 / rate on top of it.
+            self._tokens = min(self._tokens, 1.0 - delay * self.rate)
+            return delay
+
+    @staticmethod
+    def _header(headers: Mapping[str, str], name: str) -> Optional[str]:
+        value = headers.get(name)
+        if value is None:
+            value = headers.get(name.lower())
+        return value
+
+    @classmethod
+    def _header_number(cls, headers: Mapping[str, str], names: Sequence[str]) -> Optional[float]:
+        for name in names:
+            value = cls._header(headers, name)
+            if value is not None:
+                try:
+                    return float(value)
+                except ValueError:
+                    return None
+        return None
+
+    def _reset_after(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Seconds until the window resets; accepts delta seconds, epoch seconds or ISO 8601."""
+        for name in self.RESET_HEADERS:
+            value = self._header(headers, name)
+            if not value:
+                continue
+            try:
+                number = float(value)
+            except ValueError:
+                try:
+                    reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+                except ValueError:
+                    return None
+                return max(0.0, reset_at.timestamp() - time.time())
+            # Values larger than a year of seconds are epoch timestamps
+            return max(0.0, number - time.time()) if number > 31536000 else number
+        return None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return throttling vs. request latency statistics."""
+        with self._lock:
+            waits = sorted(self._recent_waits)
+            return {
+                'calls': self.call_count,
+                'throttledCalls': self.throttled_calls,
+                'rateLimitErrors': self.rate_limit_errors,
+                'maxCalls': self.max_calls,
+                'totalWaitSeconds': self.total_wait,
+                'totalRequestSeconds': self.total_request_time,
+                'avgWaitSeconds': self.total_wait / self.call_count if self.call_count else 0.0,
+                'avgRequestSeconds': self.total_request_time / self.call_count if self.call_count else 0.0,
+                'p95WaitSeconds': waits[int(len(waits) * 0.95)] if waits else 0.0,
+                'currentRate': self.rate
+            }
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(key: str, max_calls: int, period: float, **options) -> RateLimiter:
+    """
+    Return the process-wide rate limiter for key, creating it on first use.
+
+    Clients for the same tenant share one limiter, so their calls draw from
+    one budget no matter how many instances or threads make them. options
+    (header names) are only used when the limiter is created.
+    """
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(key)
+        if limiter is None:
+            limiter = _rate_limiters[key] = RateLimiter(max_calls, period, **options)
+        return limiter
+
+
+def credential_key(*credentials: Optional[str]) -> str:
+    """
+    Registry key for the first non-empty credential value.
+
+    The value is hashed so the registry never holds the secret itself.
+    """
+    value = next((c for c in credentials if c), "")
+    return hashlib.sha256(value.encode()).hexdigest()
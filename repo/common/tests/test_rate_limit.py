@@ -0,0 +1,168 @@
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from common import rate_limit
+from common.http_adapter import RateLimitedAdapter
+from common.rate_limit import RateLimiter, credential_key, get_rate_limiter
+
+
+class FakeClock:
+    """time.monotonic / time.sleep の代わりに使う手動クロック"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(rate_limit.time, "sleep", fake.sleep)
+    return fake
+
+
+def make_response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b""
+    response._content_consumed = True
+    return response
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    """バケット容量まではすぐに通り、その後は 1 / rate 間隔になること"""
+    limiter = RateLimiter(max_calls=5, period=1)
+
+    assert [limiter.wait_if_needed() for _ in range(5)] == [0.0] * 5
+    assert limiter.wait_if_needed() == pytest.approx(0.2)
+    assert limiter.get_metrics()["throttledCalls"] == 1
+
+
+def test_bucket_refills_over_time(clock):
+    """経過時間に応じてトークンが補充され、容量を超えないこと"""
+    limiter = RateLimiter(max_calls=5, period=1)
+    for _ in range(5):
+        limiter.wait_if_needed()
+
+    clock.now += 0.4
+    assert limiter.wait_if_needed() == pytest.approx(0.0)
+    assert limiter.wait_if_needed() == pytest.approx(0.0)
+    assert limiter.wait_if_needed() == pytest.approx(0.2)
+
+    clock.now += 60
+    assert [limiter.wait_if_needed() for _ in range(5)] == [0.0] * 5
+    assert limiter.wait_if_needed() > 0
+
+
+def test_remaining_header_caps_tokens(clock):
+    """Remaining ヘッダーが 0 ならリセットまで全呼び出しを止めること"""
+    limiter = RateLimiter(max_calls=100, period=60)
+
+    limiter.record_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+
+    assert limiter.wait_if_needed() == pytest.approx(30)
+
+
+def test_limit_header_updates_max_calls(clock):
+    limiter = RateLimiter(max_calls=10, period=60)
+
+    limiter.record_response(200, {"x-ratelimit-limit": "600"})
+
+    assert limiter.max_calls == 600
+
+
+def test_custom_header_names(clock):
+    """独自のヘッダー名 (Xero の X-MinLimit-Remaining など) を読めること"""
+    limiter = RateLimiter(10, 60, remaining_headers=("X-MinLimit-Remaining",), reset_headers=())
+
+    limiter.record_response(200, {"X-MinLimit-Remaining": "0", "X-RateLimit-Reset": "30"})
+
+    assert limiter._tokens == 0
+    assert limiter._blocked_until == 0.0
+
+
+def test_429_waits_retry_after_only_once(clock):
+    """429 の後は Retry-After だけ待ち、さらに 1 / rate を上乗せしないこと"""
+    limiter = RateLimiter(max_calls=10, period=1)
+    limiter.wait_if_needed()
+
+    delay = limiter.record_response(429, {"Retry-After": "2"})
+
+    assert delay == 2.0
+    assert limiter.wait_if_needed() == pytest.approx(2.0)
+    assert limiter.get_metrics()["rateLimitErrors"] == 1
+
+
+def test_429_halves_rate_and_recovers(clock):
+    limiter = RateLimiter(max_calls=10, period=10)
+
+    limiter.record_response(429, {"Retry-After": "1"})
+    assert limiter.rate == pytest.approx(0.5)
+
+    clock.now += 10
+    limiter.wait_if_needed()
+    assert limiter.rate == pytest.approx(1.0)
+
+
+def test_429_without_retry_after_uses_reset(clock):
+    limiter = RateLimiter(max_calls=10, period=1)
+
+    assert limiter.record_response(429, {"RateLimit-Reset": "3"}) == 3.0
+    assert limiter.record_response(429, {}) == 1.0
+
+
+def test_registry_shares_limiter_per_key():
+    """同じキーでは同じリミッターを共有し、キーが違えば別になること"""
+    first = get_rate_limiter("test:tenant-a", 10, 60)
+    second = get_rate_limiter("test:tenant-a", 99, 1)
+    other = get_rate_limiter("test:tenant-b", 10, 60)
+
+    assert first is second
+    assert first.max_calls == 10
+    assert other is not first
+
+
+def test_credential_key_uses_first_credential():
+    """最初の空でない認証情報をハッシュ化してキーにすること"""
+    key = credential_key(None, "", "client-id", "token")
+
+    assert key == credential_key("client-id")
+    assert key != credential_key("token")
+    assert "client-id" not in key
+
+
+def test_adapter_retries_429_with_single_wait(clock, monkeypatch):
+    """アダプターは 429 を再試行し、待機はリミッターの 1 回だけであること"""
+    responses = [make_response(429, {"Retry-After": "2"}), make_response(200)]
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, **kwargs: responses.pop(0))
+    limiter = RateLimiter(max_calls=10, period=1)
+    adapter = RateLimitedAdapter(limiter, max_retries=3)
+
+    response = adapter.send(requests.Request("GET", "https://example.com").prepare())
+
+    assert response.status_code == 200
+    assert clock.sleeps == [pytest.approx(2.0)]
+
+
+def test_adapter_returns_429_after_retry_limit(clock, monkeypatch):
+    monkeypatch.setattr(
+        HTTPAdapter, "send",
+        lambda self, request, **kwargs: make_response(429, {"Retry-After": "1"})
+    )
+    limiter = RateLimiter(max_calls=10, period=1)
+    adapter = RateLimitedAdapter(limiter, max_retries=2)
+
+    response = adapter.send(requests.Request("GET", "https://example.com").prepare())
+
+    assert response.status_code == 429
+    assert limiter.get_metrics()["rateLimitErrors"] == 3
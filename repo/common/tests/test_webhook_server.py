@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+import hmac
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import unused_port
+
+from common.webhook_server import WebhookIngestionServer, extract_events, load_triggers_class
+
+
+class FakeTriggers:
+    """extract_events を持たない汎用トリガー"""
+
+    SIGNATURE_HEADER = "X-Webhook-Signature"
+
+    def __init__(self, webhook_secret=None):
+        self.webhook_secret = webhook_secret
+        self.handlers = {}
+
+    def register_handler(self, event_type, handler):
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    def verify_webhook_signature(self, payload, signature):
+        expected = hmac.new(self.webhook_secret.encode(), payload, hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature)
+
+
+async def post(port, payload, headers=None):
+    async with aiohttp.ClientSession() as session:
+        async with session.post(f"http://127.0.0.1:{port}/webhook", json=payload, headers=headers) as response:
+            return response.status, response.headers
+
+
+def make_server(triggers, **options):
+    port = unused_port()
+    server = WebhookIngestionServer(host="127.0.0.1", port=port, **options)
+    server.add_route("/webhook", triggers)
+    return server, port
+
+
+@pytest.mark.asyncio
+async def test_duplicate_event_is_handled_once():
+    """同じイベント ID の再送はハンドラーを 1 回しか呼ばないこと"""
+    triggers = FakeTriggers()
+    received = []
+    triggers.register_handler("subscribe", received.append)
+    server, port = make_server(triggers)
+
+    async with server:
+        event = {"type": "subscribe", "id": "evt-1"}
+        assert (await post(port, event))[0] == 200
+        assert (await post(port, event))[0] == 200
+
+    assert received == [event]
+    assert server.get_metrics()["duplicates"] == 1
+    assert server.get_metrics()["processed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_answers_503_and_accepts_redelivery():
+    """キューが満杯なら 503 と Retry-After を返し、空いた後の再送は受け付けること"""
+    triggers = FakeTriggers()
+    release = asyncio.Event()
+    received = []
+
+    async def slow_handler(event):
+        await release.wait()
+        received.append(event["id"])
+
+    triggers.register_handler("subscribe", slow_handler)
+    server, port = make_server(triggers, max_queue_size=1, workers=1, enqueue_timeout=0.1)
+
+    async with server:
+        assert (await post(port, {"type": "subscribe", "id": "a"}))[0] == 200
+        await asyncio.sleep(0.05)  # the worker takes "a" and blocks
+        assert (await post(port, {"type": "subscribe", "id": "b"}))[0] == 200
+
+        status, headers = await post(port, {"type": "subscribe", "id": "c"})
+        assert status == 503
+        assert "Retry-After" in headers
+        assert server.get_metrics()["throttled"] == 1
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert (await post(port, {"type": "subscribe", "id": "c"}))[0] == 200
+
+    assert received == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_throttled_submit_keeps_ids_seen_before():
+    """スロットル時は今回追加した ID だけを忘れ、以前に受けた ID は残すこと"""
+    server = WebhookIngestionServer(max_queue_size=1, enqueue_timeout=0.01)
+    server._queue = asyncio.Queue(maxsize=1)
+    triggers = FakeTriggers()
+
+    assert await server.submit(triggers, {"type": "subscribe", "id": "y"})
+    accepted = await server.submit(triggers, [{"type": "subscribe", "id": "x"}, {"type": "subscribe", "id": "y"}])
+
+    assert accepted is False
+    assert "x" not in server._seen
+    assert "y" in server._seen
+
+
+@pytest.mark.asyncio
+async def test_invalid_signature_is_rejected():
+    triggers = FakeTriggers(webhook_secret="secret")
+    server, port = make_server(triggers)
+
+    async with server:
+        status, _ = await post(port, {"type": "subscribe"}, headers={"X-Webhook-Signature": "bad"})
+
+    assert status == 401
+    assert server.get_metrics()["rejected"] == 1
+
+
+def test_extract_events_hashes_events_without_id():
+    """ID のないイベントは内容のハッシュで識別されること"""
+    events = extract_events([{"type": "open", "email": "a@example.com"}, {"type": "open", "email": "a@example.com"}])
+
+    assert len(events) == 2
+    assert events[0][1] == events[1][1]
+    assert events[0][1] != "None"
+
+
+def test_facebook_lead_without_leadgen_id_gets_content_hash():
+    """leadgen_id のないリードの ID が "None" にならないこと"""
+    triggers = load_triggers_class("facebook-ads")()
+    payload = {"entry": [{"changes": [
+        {"field": "leadgen", "value": {"form_id": "1", "created_time": 1}},
+        {"field": "leadgen", "value": {"form_id": "2", "created_time": 1}},
+        {"field": "leadgen", "value": {"leadgen_id": "42", "form_id": "3"}},
+    ]}]}
+
+    event_ids = [event_id for _, event_id, _ in triggers.extract_events(payload)]
+
+    assert "None" not in event_ids
+    assert event_ids[0] != event_ids[1]
+    assert event_ids[2] == "42"
@@ -0,0 +1,417 @@
+"""
+Asynchronous webhook ingestion server for Triggers handlers.
+
+Verifies the signature once, acknowledges immediately, and hands events to a
+bounded queue drained by a worker pool, so slow handlers never delay the
+HTTP response (and never cause vendor retries).
+
+The server works with the Triggers class of any service; load_triggers_class
+imports the ones listed in TRIGGERS from their service folders. Vendor
+specifics stay in each triggers.py: SIGNATURE_HEADER, and extract_events
+when the payload is not a plain event (or list of events).
+"""
+import asyncio
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import sys
+import time
+import types
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIGNATURE_HEADER = "X-Webhook-Signature"
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Service -> (category, folder, Triggers class)
+TRIGGERS: Dict[str, Tuple[str, str, str]] = {
+    "facebook-ads": ("01_Marketing", "facebook-ads", "FacebookAdsTriggers"),
+    "getresponse-api": ("01_Marketing", "getresponse-api", "GetresponseApiTriggers"),
+    "google-business-profile": ("01_Marketing", "google-business-profile", "GoogleBusinessProfileTriggers"),
+    "klaviyo": ("01_Marketing", "klaviyo", "KlaviyoTriggers"),
+    "line": ("01_Marketing", "line", "LineTriggers"),
+    "livestorm": ("01_Marketing", "livestorm", "LivestormTriggers"),
+    "luma": ("01_Marketing", "luma", "LumaTriggers"),
+    "mailchimp": ("01_Marketing", "mailchimp", "MailchimpTriggers"),
+    "mailerlite": ("01_Marketing", "mailerlite", "MailerliteTriggers"),
+}
+
+
+def load_triggers_class(service: str) -> type:
+    """
+    Import the Triggers class of a service listed in TRIGGERS.
+
+    The service folder is found under developed/ or verified/ and imported
+    as a package without running its __init__, so only triggers.py and the
+    modules it imports are loaded.
+
+    Raises:
+        KeyError: If the service is not listed in TRIGGERS
+        ImportError: If the service folder cannot be found
+    """
+    category, folder, class_name = TRIGGERS[service]
+    for stage in ("verified", "developed"):
+        path = REPO_ROOT / category / stage / folder
+        if (path / "triggers.py").exists():
+            break
+    else:
+        raise ImportError(f"triggers.py for {service} not found under {REPO_ROOT / category}")
+
+    package_name = "_webhook_triggers_" + folder.replace("-", "_")
+    if package_name not in sys.modules:
+        package = types.ModuleType(package_name)
+        package.__path__ = [str(path)]
+        sys.modules[package_name] = package
+    module = importlib.import_module(f"{package_name}.triggers")
+    return getattr(module, class_name)
+
+
+def content_hash(event: Any) -> str:
+    """Stable ID for an event that carries none, so identical redeliveries share it."""
+    return hashlib.sha256(json.dumps(event, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def extract_events(event_data: Any) -> List[Tuple[str, str, Any]]:
+    """
+    Split a webhook payload into (event_type, event_id, event) tuples.
+
+    Used for Triggers without their own extract_events. Payloads may hold
+    one event or a list of events, typed by event_type or type and
+    identified by event_id or id (else by content_hash).
+    """
+    events = event_data if isinstance(event_data, list) else [event_data]
+    extracted = []
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        event_type = event.get("event_type") or event.get("type")
+        if not event_type:
+            continue
+        event_id = event.get("event_id") or event.get("id")
+        if event_id is None:
+            event_id = content_hash(event)
+        extracted.append((event_type, str(event_id), event))
+    return extracted
+
+
+class WebhookMetrics:
+    """Counters, queue depth and per-event-type handler latency."""
+
+    LATENCY_WINDOW = 1024
+
+    def __init__(self):
+        self.counters: Dict[str, int] = {
+            "received": 0,
+            "enqueued": 0,
+            "duplicates": 0,
+            "rejected": 0,
+            "throttled": 0,
+            "processed": 0,
+            "handler_errors": 0,
+        }
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._latency_totals: Dict[str, List[float]] = {}
+        self._queue_waits: Deque[float] = deque(maxlen=self.LATENCY_WINDOW)
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        self.counters[name] += amount
+
+    def record_latency(self, event_type: str, seconds: float) -> None:
+        window = self._latencies.get(event_type)
+        if window is None:
+            window = self._latencies[event_type] = deque(maxlen=self.LATENCY_WINDOW)
+            self._latency_totals[event_type] = [0, 0.0, 0.0]
+        window.append(seconds)
+        totals = self._latency_totals[event_type]
+        totals[0] += 1
+        totals[1] += seconds
+        totals[2] = max(totals[2], seconds)
+
+    def record_queue_wait(self, seconds: float) -> None:
+        self._queue_waits.append(seconds)
+
+    @staticmethod
+    def _percentiles(values: Deque[float]) -> Dict[str, float]:
+        if not values:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0}
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return {
+            "p50": ordered[int(last * 0.50)],
+            "p95": ordered[int(last * 0.95)],
+            "p99": ordered[int(last * 0.99)],
+        }
+
+    def snapshot(self, queue_depth: int, queue_capacity: int) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serialisable dict."""
+        handlers = {}
+        for event_type, window in self._latencies.items():
+            count, total, maximum = self._latency_totals[event_type]
+            handlers[event_type] = {
+                "count": count,
+                "mean": total / count if count else 0.0,
+                "max": maximum,
+                **self._percentiles(window),
+            }
+        return {
+            **self.counters,
+            "queue_depth": queue_depth,
+            "queue_capacity": queue_capacity,
+            "queue_wait": self._percentiles(self._queue_waits),
+            "handler_latency": handlers,
+        }
+
+
+class WebhookIngestionServer:
+    """
+    aiohttp server fronting one or more Triggers objects.
+
+    Each route verifies the request with its triggers'
+    verify_webhook_signature, splits the payload with the triggers'
+    extract_events (or the generic extract_events), drops redeliveries by
+    event ID, enqueues the events and returns 200.
+    When the queue stays full for enqueue_timeout seconds, the request is
+    answered with 503 and Retry-After so the vendor redelivers later
+    instead of the server buffering without bound.
+
+    Workers call the registered handlers: coroutine functions on the event
+    loop, plain functions in a thread pool. GET {metrics_path} returns
+    queue depth, counters and handler latency percentiles.
+    """
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        max_queue_size: int = 10000,
+        workers: int = 16,
+        thread_pool_size: Optional[int] = None,
+        enqueue_timeout: float = 1.0,
+        dedup_ttl: float = 3600.0,
+        dedup_max_size: int = 100000,
+        metrics_path: Optional[str] = "/metrics",
+    ):
+        """
+        Initialize the ingestion server.
+
+        Args:
+            host: Interface to listen on
+            port: Port to listen on
+            max_queue_size: Events buffered between receiving and handling
+            workers: Events handled concurrently
+            thread_pool_size: Threads for synchronous handlers (default: workers)
+            enqueue_timeout: Seconds to wait for queue space before answering 503
+            dedup_ttl: Seconds an event ID is remembered for deduplication
+            dedup_max_size: Maximum number of remembered event IDs
+            metrics_path: Path of the metrics endpoint (None to disable)
+        """
+        self.host = host
+        self.port = port
+        self.max_queue_size = max_queue_size
+        self.workers = workers
+        self.thread_pool_size = thread_pool_size or workers
+        self.enqueue_timeout = enqueue_timeout
+        self.dedup_ttl = dedup_ttl
+        self.dedup_max_size = dedup_max_size
+        self.metrics_path = metrics_path
+        self.metrics = WebhookMetrics()
+
+        self._routes: Dict[str, Tuple[Any, Optional[str]]] = {}
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._runner: Optional[web.AppRunner] = None
+
+    def add_route(self, path: str, triggers: Any, signature_header: Optional[str] = None) -> None:
+        """
+        Serve a Triggers object at path.
+
+        Args:
+            path: Request path the vendor posts to
+            triggers: Triggers object (handlers, verify_webhook_signature and
+                optionally extract_events)
+            signature_header: Header carrying the signature (default: the
+                triggers' SIGNATURE_HEADER, else X-Webhook-Signature);
+                signatures are only checked when the triggers object has a
+                secret configured
+        """
+        self._routes[path] = (
+            triggers,
+            signature_header or getattr(triggers, "SIGNATURE_HEADER", DEFAULT_SIGNATURE_HEADER)
+        )
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop()
+
+    async def start(self) -> None:
+        """Start the workers and begin listening."""
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._executor = ThreadPoolExecutor(max_workers=self.thread_pool_size)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+        app = web.Application()
+        for path in self._routes:
+            app.router.add_post(path, self._handle)
+            app.router.add_get(path, self._handle_challenge)
+        if self.metrics_path:
+            app.router.add_get(self.metrics_path, self._handle_metrics)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+
+    async def stop(self, drain_timeout: Optional[float] = 30.0) -> None:
+        """Stop accepting requests, finish queued events, then stop the workers."""
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+        if self._queue is not None:
+            try:
+                await asyncio.wait_for(self._queue.join(), drain_timeout)
+            except asyncio.TimeoutError:
+                logger.warning("Stopped with %d webhook events unprocessed", self._queue.qsize())
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Return queue depth, counters and handler latency percentiles."""
+        depth = self._queue.qsize() if self._queue is not None else 0
+        return self.metrics.snapshot(depth, self.max_queue_size)
+
+    async def submit(self, triggers: Any, event_data: Any) -> bool:
+        """
+        Enqueue the events of an already verified payload.
+
+        Returns:
+            False if the queue stayed full for enqueue_timeout seconds. The
+            event that could not be enqueued is forgotten by deduplication,
+            so a redelivery is accepted; the events after it were never
+            looked at, and IDs seen before this call are kept.
+        """
+        extract = getattr(triggers, "extract_events", extract_events)
+        events = extract(event_data)
+        self.metrics.increment("received", len(events))
+
+        for event_type, event_id, event in events:
+            if event_id is not None and self._is_duplicate(event_id):
+                self.metrics.increment("duplicates")
+                continue
+
+            item = (triggers, event_type, event, time.perf_counter())
+            try:
+                self._queue.put_nowait(item)
+            except asyncio.QueueFull:
+                try:
+                    await asyncio.wait_for(self._queue.put(item), self.enqueue_timeout)
+                except asyncio.TimeoutError:
+                    self.metrics.increment("throttled")
+                    if event_id is not None:
+                        self._seen.pop(event_id, None)
+                    return False
+            self.metrics.increment("enqueued")
+        return True
+
+    def _is_duplicate(self, event_id: str) -> bool:
+        """Remember event_id; True if it was seen within dedup_ttl."""
+        now = time.monotonic()
+        while self._seen:
+            oldest_id, expires = next(iter(self._seen.items()))
+            if expires > now and len(self._seen) < self.dedup_max_size:
+                break
+            del self._seen[oldest_id]
+
+        if event_id in self._seen:
+            return True
+        self._seen[event_id] = now + self.dedup_ttl
+        return False
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        triggers, signature_header = self._routes[request.path]
+        body = await request.read()
+
+        if self._has_secret(triggers):
+            signature = request.headers.get(signature_header or "", "")
+            try:
+                valid = bool(signature) and triggers.verify_webhook_signature(body, signature)
+            except Exception:
+                valid = False
+            if not valid:
+                self.metrics.increment("rejected")
+                return web.Response(status=401)
+
+        try:
+            event_data = json.loads(body)
+        except ValueError:
+            self.metrics.increment("rejected")
+            return web.Response(status=400)
+
+        if not await self.submit(triggers, event_data):
+            return web.Response(status=503, headers={"Retry-After": "5"})
+        return web.Response(text="ok")
+
+    async def _handle_challenge(self, request: web.Request) -> web.Response:
+        """Answer subscription challenges (e.g. Facebook hub.challenge)."""
+        triggers, _ = self._routes[request.path]
+        handle_challenge = getattr(triggers, "handle_webhook_challenge", None)
+        if handle_challenge is None:
+            return web.Response(status=405)
+        challenge = handle_challenge(
+            request.query.get("hub.mode", ""),
+            request.query.get("hub.verify_token", ""),
+            request.query.get("hub.challenge", ""),
+        )
+        if challenge is None:
+            return web.Response(status=403)
+        return web.Response(text=challenge)
+
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_metrics())
+
+    @staticmethod
+    def _has_secret(triggers: Any) -> bool:
+        return bool(getattr(triggers, "webhook_secret", None) or getattr(triggers, "app_secret", None))
+
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            triggers, event_type, event, enqueued_at = await self._queue.get()
+            try:
+                self.metrics.record_queue_wait(time.perf_counter() - enqueued_at)
+                for handler in triggers.handlers.get(event_type, []):
+                    started = time.perf_counter()
+                    try:
+                        if inspect.iscoroutinefunction(handler):
+                            await handler(event)
+                        else:
+                            await loop.run_in_executor(self._executor, handler, event)
+                    except Exception:
+                        self.metrics.increment("handler_errors")
+                        logger.exception("Handler %s failed for %s event", _handler_name(handler), event_type)
+                    finally:
+                        self.metrics.record_latency(event_type, time.perf_counter() - started)
+                self.metrics.increment("processed")
+            finally:
+                self._queue.task_done()
+
+
+def _handler_name(handler: Callable) -> str:
+    return getattr(handler, "__qualname__", repr(handler))
+